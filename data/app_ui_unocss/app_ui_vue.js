@@ -10,6 +10,12 @@
 
   const COMPONENTS_MAP = BOOTSTRAP.componentsMap || __ODOO_BOOTSTRAP_COMPONENTS_MAP__;
   BOOTSTRAP.componentsMap = COMPONENTS_MAP;
+  // Payload is { sources, aliases }: each SFC once, aliases point other keys at their relative key
+  // and win over a source stored under the same key (last file wins, like the old flat map).
+  const COMPONENT_SOURCES = COMPONENTS_MAP.sources || COMPONENTS_MAP;
+  const COMPONENT_ALIASES = COMPONENTS_MAP.aliases || {};
+  const componentSource = (key) =>
+    Object.prototype.hasOwnProperty.call(COMPONENT_ALIASES, key) ? COMPONENT_SOURCES[COMPONENT_ALIASES[key]] : COMPONENT_SOURCES[key];
   const I18N_CATALOG = ROOT.i18nCatalog || { default_locale: "en", messages: { en: {} } };
   const VUE_CDN = CONFIG.cdn.vue;
   const SFC_LOADER_CDN = CONFIG.cdn.sfcLoader;
@@ -426,10 +432,10 @@
         const normalized = normalizeComponentPath(url);
         const name = normalized.split('/').pop();
         const source =
-          COMPONENTS_MAP[normalized] ||
-          COMPONENTS_MAP[url] ||
-          COMPONENTS_MAP[name] ||
-          COMPONENTS_MAP['./' + name];
+          componentSource(normalized) ||
+          componentSource(url) ||
+          componentSource(name) ||
+          componentSource('./' + name);
         if (!source) throw new Error(`SFC file not found: ${url}`);
         return Promise.resolve(source);
       },
@@ -2,6 +2,10 @@
 
 from lib.python.odoo_reusable.core.base import BaseRepository, BaseService, Registry, SingletonMeta
 from lib.python.odoo_reusable.core.asset_resolution import (
+    AssetBatchResolution,
+    AssetBulkResolutionPort,
+    AssetCodePrefixIndex,
+    AssetCodeSet,
     AssetFallbackStrategy,
     AssetInclusionPolicy,
     AssetMatchStrategy,
@@ -15,6 +19,7 @@ from lib.python.odoo_reusable.core.asset_resolution import (
     PrefixAssetInclusionPolicy,
 )
 from lib.python.odoo_reusable.core.asset_labels import (
+    AssetKeyIndex,
     build_asset_display_label,
     extract_asset_number,
     is_asset_key_match,
@@ -27,7 +32,9 @@ from lib.python.odoo_reusable.core.asset_metadata import (
     resolve_serial_metadata_overrides,
 )
 from lib.python.odoo_reusable.core.tabular_rows import (
+    TabularSchema,
     build_normalized_tabular_index,
+    clean_tabular_text_column,
     clean_tabular_text_value,
     get_tabular_value,
     get_tabular_value_by_aliases,
@@ -35,7 +42,7 @@ from lib.python.odoo_reusable.core.tabular_rows import (
     set_if_not_empty,
 )
 from lib.python.odoo_reusable.core.config import Configuration, ConfigurationError
-from lib.python.odoo_reusable.core.connection import OdooConnection, OdooConnectionError
+from lib.python.odoo_reusable.core.connection import OdooBatch, OdooConnection, OdooConnectionError
 from lib.python.odoo_reusable.core.decorators import log_operation, retry, validate_input
 from lib.python.odoo_reusable.core.exceptions import (
     AuthenticationError,
@@ -46,6 +53,7 @@ from lib.python.odoo_reusable.core.exceptions import (
     RPRentalError,
     ValidationError,
 )
+from lib.python.odoo_reusable.core.model_metadata import ModelMetadataCache, shared_metadata_cache
 from lib.python.odoo_reusable.core.phase_runtime import (
     FailurePolicy,
     PhaseSpec,
@@ -57,11 +65,17 @@ from lib.python.odoo_reusable.core.phase_runtime import (
 
 __all__ = [
     "AuthenticationError",
+    "AssetBatchResolution",
+    "AssetBulkResolutionPort",
+    "AssetCodePrefixIndex",
+    "AssetCodeSet",
     "AssetFallbackStrategy",
     "AssetInclusionPolicy",
+    "AssetKeyIndex",
     "AssetMatchStrategy",
     "build_asset_display_label",
     "build_normalized_tabular_index",
+    "clean_tabular_text_column",
     "clean_tabular_text_value",
     "coalesce_normalized_metadata_values",
     "extract_asset_number",
@@ -81,7 +95,9 @@ __all__ = [
     "DataLoadError",
     "GeneratedProductFallbackStrategy",
     "log_operation",
+    "ModelMetadataCache",
     "NotFoundError",
+    "OdooBatch",
     "OdooConnection",
     "OdooConnectionError",
     "OperationError",
@@ -98,11 +114,13 @@ __all__ = [
     "RPRentalError",
     "resolve_serial_metadata_overrides",
     "set_if_not_empty",
+    "shared_metadata_cache",
     "build_phase_runner_kwargs",
     "build_phase_status_payload",
     "serialize_phase_error_payload",
     "should_run_phase",
     "SingletonMeta",
+    "TabularSchema",
     "ValidationError",
     "validate_input",
 ]
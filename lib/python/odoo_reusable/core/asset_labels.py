@@ -1,11 +1,28 @@
 """Reusable helpers for asset labels and serial-style lookup keys."""
 
+import json
 import re
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+ASSET_KEY_NOISE_PATTERN = re.compile(r"[^a-z0-9]+")
+ASSET_KEY_CACHE_SIZE = 65536
+ASSET_KEY_INDEX_FORMAT = 1
 
 
 def normalize_asset_key(value: str) -> str:
     """Normalize serial/asset values to compare labels with format noise removed."""
-    return re.sub(r"[^a-z0-9]+", "", str(value or "").lower())
+    try:
+        return _normalize_asset_key(value)
+    except TypeError:
+        return ASSET_KEY_NOISE_PATTERN.sub("", str(value or "").lower())
+
+
+@lru_cache(maxsize=ASSET_KEY_CACHE_SIZE, typed=True)
+def _normalize_asset_key(value: str) -> str:
+    return ASSET_KEY_NOISE_PATTERN.sub("", str(value or "").lower())
 
 
 def is_asset_key_match(
@@ -25,6 +42,92 @@ def is_asset_key_match(
     return False
 
 
+class AssetKeyIndex:
+    """Normalized candidate values -> payloads, answering `is_asset_key_match` queries.
+
+    `match(target)` returns the payloads of every candidate `is_asset_key_match`
+    would accept for `target`, exact key first, in O(log N + matches) via a
+    sorted key list. Payloads default to the candidate value and must be JSON
+    serializable for `save`.
+    """
+
+    def __init__(self, items: Iterable[tuple[str, Any]] = ()):
+        self._entries: dict[str, list[Any]] = {}
+        self._sorted_keys: list[str] = []
+        self._dirty = False
+        for candidate_value, payload in items:
+            self.add(candidate_value, payload)
+
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> "AssetKeyIndex":
+        return cls((value, value) for value in values)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, target_key: object) -> bool:
+        return normalize_asset_key(target_key) in self._entries  # type: ignore[arg-type]
+
+    def add(self, candidate_value: str, payload: Any = None) -> None:
+        key = normalize_asset_key(candidate_value)
+        if not key:
+            return
+        bucket = self._entries.get(key)
+        if bucket is None:
+            bucket = self._entries[key] = []
+            self._dirty = True
+        bucket.append(candidate_value if payload is None else payload)
+
+    def match(self, target_key: str, allow_candidate_prefix: bool = True) -> list[Any]:
+        """Payloads of candidates equal to, or (optionally) starting with, the target key."""
+        target = normalize_asset_key(target_key)
+        if not target:
+            return []
+        if not allow_candidate_prefix:
+            return list(self._entries.get(target, ()))
+        keys = self._keys()
+        matches: list[Any] = []
+        position = bisect_left(keys, target)
+        while position < len(keys) and keys[position].startswith(target):
+            matches.extend(self._entries[keys[position]])
+            position += 1
+        return matches
+
+    def first_match(self, target_key: str, allow_candidate_prefix: bool = True) -> Optional[Any]:
+        matches = self.match(target_key, allow_candidate_prefix=allow_candidate_prefix)
+        return matches[0] if matches else None
+
+    def save(self, path: Path, fingerprint: str = "") -> None:
+        """Persist the index; `fingerprint` identifies the inventory it was built from."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"format": ASSET_KEY_INDEX_FORMAT, "fingerprint": fingerprint, "entries": self._entries}
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: str = "") -> Optional["AssetKeyIndex"]:
+        """Load a saved index, or None when missing, unreadable or built for another fingerprint."""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(payload, dict) or payload.get("format") != ASSET_KEY_INDEX_FORMAT:
+            return None
+        if payload.get("fingerprint", "") != fingerprint or not isinstance(payload.get("entries"), dict):
+            return None
+        index = cls()
+        index._entries = {str(key): list(values) for key, values in payload["entries"].items()}
+        index._dirty = True
+        return index
+
+    def _keys(self) -> list[str]:
+        if self._dirty:
+            self._sorted_keys = sorted(self._entries)
+            self._dirty = False
+        return self._sorted_keys
+
+
 def extract_asset_number(label_or_number: str) -> str:
     """Extract canonical asset number from plain value or `number | description` label."""
     text = str(label_or_number or "").strip()
@@ -1,6 +1,7 @@
 """Reusable helpers for legacy serial metadata parsing/normalization."""
 
 import re
+from functools import lru_cache
 from typing import Any, Mapping
 
 SERIAL_METADATA_KEYS: tuple[str, str, str] = ("psn", "esn", "vin")
@@ -10,6 +11,11 @@ SERIAL_METADATA_LABELS: Mapping[str, str] = {
     "vin": "VIN",
 }
 DEFAULT_EMPTY_TOKENS = frozenset({"none", "nan", "null"})
+SERIAL_NOTE_NOISE_PATTERN = re.compile(r"<[^>]+>|&nbsp;")
+# Single pass over a note: yields only the `|`/newline delimited chunks that
+# contain a colon, i.e. that can carry a `LABEL:` marker. The lookbehind pins
+# each match to a chunk start so a colon-less chunk is rejected in one scan.
+SERIAL_NOTE_CHUNK_PATTERN = re.compile(r"(?<![^|\n\r])[^|\n\r:]*:[^|\n\r]*")
 
 
 def normalize_legacy_metadata_value(
@@ -41,26 +47,40 @@ def parse_serial_metadata_note(
     """Parse PSN/ESN/VIN values from legacy note formats."""
     text = str(note_value or "")
     parsed = {key: "" for key in labels}
-    if not text:
+    if ":" not in text:
         return parsed
 
-    cleaned = re.sub(r"<[^>]+>", " ", text)
-    cleaned = cleaned.replace("&nbsp;", " ")
-    chunks = [chunk.strip() for chunk in re.split(r"[|\n\r]+", cleaned) if chunk.strip()]
-    for chunk in chunks:
+    if "<" in text or "&" in text:
+        text = SERIAL_NOTE_NOISE_PATTERN.sub(" ", text)
+    if labels is SERIAL_METADATA_LABELS:
+        markers = _DEFAULT_SERIAL_NOTE_MARKERS
+    else:
+        markers = _serial_note_markers(tuple(labels.items()))
+    remaining = len(parsed)
+    for chunk in SERIAL_NOTE_CHUNK_PATTERN.findall(text):
         upper = chunk.upper()
-        for key, label in labels.items():
-            marker = f"{label.upper()}:"
+        for key, marker in markers:
             if marker not in upper:
                 continue
             if parsed[key]:
                 break
-            value = chunk.split(":", 1)[1].strip() if ":" in chunk else ""
-            parsed[key] = normalize_legacy_metadata_value(value)
+            parsed[key] = normalize_legacy_metadata_value(chunk.split(":", 1)[1])
+            if parsed[key]:
+                remaining -= 1
+            break
+        if not remaining:
             break
     return parsed
 
 
+@lru_cache(maxsize=32)
+def _serial_note_markers(labels: tuple[tuple[str, str], ...]) -> tuple[tuple[str, str], ...]:
+    return tuple((key, f"{label.upper()}:") for key, label in labels)
+
+
+_DEFAULT_SERIAL_NOTE_MARKERS = _serial_note_markers(tuple(SERIAL_METADATA_LABELS.items()))
+
+
 def resolve_serial_metadata_overrides(
     incoming: Mapping[str, Any],
     existing: Mapping[str, Any],
@@ -1,20 +1,172 @@
 """Reusable strategy contracts and engine for asset->product resolution."""
 
-from dataclasses import dataclass
-from typing import Callable, Generic, Optional, Protocol, TypeVar, runtime_checkable
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Iterable, Optional, Protocol, TypeVar, runtime_checkable
 
 TAsset = TypeVar("TAsset")
 
 
+class AssetCodePrefixIndex:
+    """Sorted canonical codes with bisect prefix lookup and memoized variant picks.
+
+    `resolve` memoizes one answer per (prefix, preferred suffixes); adding or
+    removing a code drops only the memo entries for prefixes of that code.
+    """
+
+    def __init__(self, codes: Iterable[str] = ()):
+        self._members: set[str] = set(codes)
+        self._sorted: list[str] = sorted(self._members)
+        self._resolved: dict[str, dict[tuple[str, ...], Optional[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._members
+
+    def add(self, code: str) -> None:
+        if code in self._members:
+            return
+        self._members.add(code)
+        insort(self._sorted, code)
+        self._invalidate(code)
+
+    def discard(self, code: str) -> None:
+        if code not in self._members:
+            return
+        self._members.discard(code)
+        del self._sorted[bisect_left(self._sorted, code)]
+        self._invalidate(code)
+
+    def sync(self, codes: set[str]) -> None:
+        """Apply additions/removals made directly on a state's `available_codes`."""
+        for code in self._members - codes:
+            self.discard(code)
+        for code in codes - self._members:
+            self.add(code)
+
+    def with_prefix(self, prefix: str) -> list[str]:
+        """All codes starting with `prefix`, in sorted order."""
+        codes = self._sorted
+        start = end = bisect_left(codes, prefix)
+        while end < len(codes) and codes[end].startswith(prefix):
+            end += 1
+        return codes[start:end]
+
+    def resolve(self, prefix: str, preferred_suffixes: tuple[str, ...] = ()) -> Optional[str]:
+        """First code with `prefix` ending in a preferred suffix, else the smallest one."""
+        bucket = self._resolved.setdefault(prefix, {})
+        if preferred_suffixes in bucket:
+            return bucket[preferred_suffixes]
+        candidates = self.with_prefix(prefix)
+        resolved = None
+        if candidates:
+            resolved = next(
+                (
+                    candidate
+                    for suffix in preferred_suffixes
+                    for candidate in candidates
+                    if candidate.endswith(suffix)
+                ),
+                candidates[0],
+            )
+        bucket[preferred_suffixes] = resolved
+        return resolved
+
+    def _invalidate(self, code: str) -> None:
+        if not self._resolved:
+            return
+        for end in range(len(code) + 1):
+            self._resolved.pop(code[:end], None)
+
+
+class AssetCodeSet(set):
+    """`set` counting its mutations, so indexes built from it can detect changes."""
+
+    __slots__ = ("version",)
+
+    def __init__(self, codes: Iterable[str] = ()):
+        super().__init__(codes)
+        self.version = 0
+
+
+def _counting_mutation(name: str) -> Callable[..., Any]:
+    method = getattr(set, name)
+
+    def mutate(self: AssetCodeSet, *args: Any) -> Any:
+        self.version += 1
+        return method(self, *args)
+
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in (
+    "add",
+    "discard",
+    "remove",
+    "pop",
+    "clear",
+    "update",
+    "difference_update",
+    "intersection_update",
+    "symmetric_difference_update",
+    "__ior__",
+    "__iand__",
+    "__isub__",
+    "__ixor__",
+):
+    setattr(AssetCodeSet, _name, _counting_mutation(_name))
+
+
 @dataclass
 class AssetResolutionState:
-    """Mutable lookup state reused while resolving asset product mappings."""
+    """Mutable lookup state reused while resolving asset product mappings.
+
+    `available_codes` is stored as an `AssetCodeSet` (a copy when a plain set
+    is passed), so any change to it, direct or via `add_available_code`, is
+    seen by `prefix_index`.
+    """
 
     product_id_map: dict[str, int]
     resolved_product_by_raw_key: dict[str, int]
     available_codes: set[str]
     available_code_norm_map: dict[str, str]
     description_map: dict[str, str]
+    _prefix_index: Optional[AssetCodePrefixIndex] = field(default=None, init=False, repr=False, compare=False)
+    _indexed: tuple[Any, int] = field(default=(None, -1), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.available_codes, AssetCodeSet):
+            self.available_codes = AssetCodeSet(self.available_codes)
+
+    def add_available_code(self, code: str, normalized_key: Optional[str] = None) -> None:
+        """Register one canonical code in the lookup set, prefix index and normalized map."""
+        codes = self._codes()
+        codes.add(code)
+        if self._prefix_index is not None and self._indexed[0] is codes:
+            self._prefix_index.add(code)
+            self._indexed = (codes, codes.version)
+        if normalized_key:
+            self.available_code_norm_map.setdefault(normalized_key, code)
+
+    def prefix_index(self) -> AssetCodePrefixIndex:
+        """Prefix index over `available_codes`, built on first use and synced on change."""
+        codes = self._codes()
+        indexed_codes, indexed_version = self._indexed
+        if self._prefix_index is None or indexed_codes is not codes:
+            self._prefix_index = AssetCodePrefixIndex(codes)
+        elif indexed_version != codes.version:
+            self._prefix_index.sync(codes)
+        self._indexed = (codes, codes.version)
+        return self._prefix_index
+
+    def _codes(self) -> AssetCodeSet:
+        # `available_codes` may have been reassigned to a plain set
+        if not isinstance(self.available_codes, AssetCodeSet):
+            self.available_codes = AssetCodeSet(self.available_codes)
+        return self.available_codes
 
 
 @dataclass(frozen=True)
@@ -50,7 +202,44 @@ class AssetResolutionPort(Protocol):
         code: str,
         product_id: int,
     ) -> None:
-        """Register a new canonical code (typically from fallback creation)."""
+        """Register a new canonical code (typically from fallback creation).
+
+        Implementations should add the code via `state.add_available_code`.
+        """
+
+
+@runtime_checkable
+class AssetBulkResolutionPort(AssetResolutionPort, Protocol):
+    """Port that can look up many product codes in one round trip."""
+
+    def get_product_ids(self, codes: list[str]) -> dict[str, int]:
+        """Return product IDs for the given canonical codes (missing codes omitted)."""
+
+
+@dataclass
+class AssetBatchResolution:
+    """Outcome of `AssetResolutionEngine.ensure_mappings`.
+
+    `mapping` is keyed by stripped raw code; values are what `ensure_mapping`
+    would have returned. `counters` counts codes per resolution stage;
+    "individual" is for same-key repeats whose first code left no reusable
+    raw-key match, which fall back to `ensure_mapping`.
+    """
+
+    mapping: dict[str, Optional[str]] = field(default_factory=dict)
+    counters: dict[str, int] = field(
+        default_factory=lambda: {
+            "empty": 0,
+            "duplicate": 0,
+            "known": 0,
+            "cached_raw_key": 0,
+            "matched": 0,
+            "fallback": 0,
+            "unresolved": 0,
+            "individual": 0,
+        }
+    )
+    product_lookups: int = 0
 
 
 @runtime_checkable
@@ -100,7 +289,7 @@ class BaseAssetMatchStrategy:
 
         return self.resolve_prefix_variants(
             code=code,
-            available_codes=state.available_codes,
+            available_codes=state.prefix_index(),
         )
 
     @staticmethod
@@ -123,7 +312,7 @@ class BaseAssetMatchStrategy:
     def resolve_prefix_variants(
         self,
         code: str,
-        available_codes: set[str],
+        available_codes: set[str] | AssetCodePrefixIndex,
     ) -> Optional[str]:
         """Resolve code by matching same-prefix variants with suffix preferences."""
         prefix, separator, _suffix = code.rpartition(self._prefix_policy.separator)
@@ -131,6 +320,9 @@ class BaseAssetMatchStrategy:
             return None
 
         prefix_with_separator = f"{prefix}{self._prefix_policy.separator}"
+        if isinstance(available_codes, AssetCodePrefixIndex):
+            return available_codes.resolve(prefix_with_separator, self._prefix_policy.preferred_suffixes)
+
         candidates = sorted(
             candidate for candidate in available_codes if candidate.startswith(prefix_with_separator)
         )
@@ -167,11 +359,13 @@ class GeneratedProductFallbackStrategy:
         ensure_product: Callable[[str, str], Optional[int]],
         build_name: Optional[Callable[[str, str], str]] = None,
         on_registered: Optional[Callable[[str, str], None]] = None,
+        ensure_products: Optional[Callable[[list[tuple[str, str]]], dict[str, int]]] = None,
     ):
         self._build_code = build_code
         self._ensure_product = ensure_product
         self._build_name = build_name or self._default_name_builder
         self._on_registered = on_registered
+        self._ensure_products = ensure_products
 
     @staticmethod
     def _default_name_builder(raw_code: str, _fallback_code: str) -> str:
@@ -207,6 +401,42 @@ class GeneratedProductFallbackStrategy:
             self._on_registered(fallback_code, raw_code)
         return fallback_code
 
+    def ensure_mappings(
+        self,
+        items: list[tuple[str, str]],
+        state: AssetResolutionState,
+        port: AssetResolutionPort,
+    ) -> dict[str, Optional[str]]:
+        """Batch form of `ensure_mapping` for `(raw_code, raw_key)` pairs.
+
+        With `ensure_products` every distinct fallback product is created or
+        reused in one call; otherwise `ensure_product` runs once per code.
+        """
+        planned: dict[str, tuple[str, str, str]] = {}
+        products: dict[str, str] = {}
+        for raw_code, raw_key in items:
+            fallback_code = self._build_code(raw_code)
+            planned[raw_code] = (raw_key, fallback_code, self._build_name(raw_code, fallback_code))
+            products.setdefault(fallback_code, planned[raw_code][2])
+
+        if self._ensure_products:
+            product_ids = self._ensure_products(list(products.items()))
+        else:
+            product_ids = {code: self._ensure_product(code, name) for code, name in products.items()}
+
+        resolved: dict[str, Optional[str]] = {}
+        for raw_code, (raw_key, fallback_code, _name) in planned.items():
+            product_id = product_ids.get(fallback_code)
+            if not product_id:
+                resolved[raw_code] = None
+                continue
+            port.register_resolved_code(state=state, code=fallback_code, product_id=product_id)
+            port.store_mapping(state=state, raw_code=raw_code, raw_key=raw_key, product_id=product_id)
+            if self._on_registered:
+                self._on_registered(fallback_code, raw_code)
+            resolved[raw_code] = fallback_code
+        return resolved
+
 
 class AssetResolutionEngine:
     """Generic engine that orchestrates match + fallback strategies."""
@@ -268,6 +498,124 @@ class AssetResolutionEngine:
 
         return None
 
+    def ensure_mappings(
+        self,
+        raw_codes: Iterable[str],
+        state: AssetResolutionState,
+        port: AssetResolutionPort,
+    ) -> AssetBatchResolution:
+        """Ensure many raw asset codes are mapped, batching the side effects.
+
+        Codes sharing a normalized key are resolved once (when raw-key reuse is
+        enabled), matching runs in memory against `state`, product IDs for all
+        matched codes come from one `get_product_ids` call on bulk ports, and
+        unmatched codes go to the fallback strategy together. Matching sees the
+        state as of the call, not products created by this batch's fallbacks.
+        """
+        batch = AssetBatchResolution()
+        counters = batch.counters
+        reuse_raw_keys = self._policy.reuse_cached_raw_key_matches
+        pending: dict[str, str] = {}
+        repeats: list[tuple[str, str]] = []
+        claimed_keys: set[str] = set()
+        for raw_code in raw_codes:
+            code = str(raw_code or "").strip()
+            if not code:
+                counters["empty"] += 1
+                continue
+            if code in batch.mapping:
+                counters["duplicate"] += 1
+                continue
+            raw_key = port.normalize_key(code)
+            if code in state.product_id_map:
+                batch.mapping[code] = code
+                counters["known"] += 1
+                continue
+            if reuse_raw_keys and raw_key:
+                cached_product_id = state.resolved_product_by_raw_key.get(raw_key)
+                if cached_product_id:
+                    state.product_id_map[code] = cached_product_id
+                    batch.mapping[code] = code
+                    counters["cached_raw_key"] += 1
+                    continue
+                if raw_key in claimed_keys:
+                    repeats.append((code, raw_key))
+                    batch.mapping[code] = None
+                    continue
+                claimed_keys.add(raw_key)
+            pending[code] = raw_key
+            batch.mapping[code] = None
+
+        matched: dict[str, str] = {}
+        for code in pending:
+            resolved_code = self._match_strategy.resolve_product_code(raw_code=code, state=state, port=port)
+            if resolved_code:
+                matched[code] = resolved_code
+        product_ids = self._lookup_product_ids(sorted(set(matched.values())), port, batch)
+
+        unmatched: list[tuple[str, str]] = []
+        for code, raw_key in pending.items():
+            resolved_code = matched.get(code)
+            product_id = product_ids.get(resolved_code) if resolved_code else None
+            if product_id:
+                port.store_mapping(state=state, raw_code=code, raw_key=raw_key, product_id=product_id)
+                batch.mapping[code] = resolved_code
+                counters["matched"] += 1
+            else:
+                unmatched.append((code, raw_key))
+
+        fallback = self._fallback_strategy if self._policy.allow_fallback_strategy else None
+        for code, resolved_code in self._ensure_fallbacks(unmatched, fallback, state, port).items():
+            batch.mapping[code] = resolved_code
+            counters["fallback" if resolved_code else "unresolved"] += 1
+
+        for code, raw_key in repeats:
+            cached_product_id = state.resolved_product_by_raw_key.get(raw_key)
+            if cached_product_id:
+                state.product_id_map[code] = cached_product_id
+                batch.mapping[code] = code
+                counters["cached_raw_key"] += 1
+                continue
+            batch.mapping[code] = self.ensure_mapping(raw_code=code, state=state, port=port)
+            counters["individual"] += 1
+        return batch
+
+    @staticmethod
+    def _lookup_product_ids(
+        codes: list[str],
+        port: AssetResolutionPort,
+        batch: AssetBatchResolution,
+    ) -> dict[str, int]:
+        if not codes:
+            return {}
+        if isinstance(port, AssetBulkResolutionPort):
+            batch.product_lookups += 1
+            return port.get_product_ids(codes)
+        product_ids: dict[str, int] = {}
+        for code in codes:
+            batch.product_lookups += 1
+            product_id = port.get_product_id(code)
+            if product_id:
+                product_ids[code] = product_id
+        return product_ids
+
+    @staticmethod
+    def _ensure_fallbacks(
+        items: list[tuple[str, str]],
+        fallback: Optional[AssetFallbackStrategy],
+        state: AssetResolutionState,
+        port: AssetResolutionPort,
+    ) -> dict[str, Optional[str]]:
+        if not items or fallback is None:
+            return {code: None for code, _raw_key in items}
+        bulk = getattr(fallback, "ensure_mappings", None)
+        if bulk is not None:
+            return bulk(items, state, port)
+        return {
+            code: fallback.ensure_mapping(raw_code=code, raw_key=raw_key, state=state, port=port)
+            for code, raw_key in items
+        }
+
 
 @runtime_checkable
 class AssetInclusionPolicy(Protocol, Generic[TAsset]):
@@ -6,10 +6,11 @@ Provides abstract base classes for repositories and services.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
 
 from lib.python.odoo_reusable.core.config import Configuration
 from lib.python.odoo_reusable.core.connection import OdooConnection
+from lib.python.odoo_reusable.core.exceptions import OperationError
 
 logger = logging.getLogger(__name__)
 
@@ -78,12 +79,75 @@ class BaseRepository(ABC, Generic[T]):
         logger.info("Created %s ID: %s", self._model_name, record_id)
         return record_id
 
-    def create_batch(self, values_list: List[Dict[str, Any]]) -> List[int]:
-        ids = []
+    def create_batch(
+        self,
+        values_list: List[Dict[str, Any]],
+        isolate_failures: bool = False,
+        on_failure: Optional[Callable[[int, Dict[str, Any], Exception], None]] = None,
+    ) -> List[Optional[int]]:
+        """
+        Create records with one multi-record `create` call per chunk.
+
+        Chunks follow `processing.batch_size`. IDs are returned in input order.
+        With `isolate_failures`, a failing chunk is bisected until the offending
+        rows are found; their positions hold None and `on_failure` receives
+        (index, values, error) for each of them. Bisection calls are single
+        attempts, so a bad row does not pay the retry delay at every level.
+        """
         for values in values_list:
-            ids.append(self.create(values))
+            self._validate_create(values)
+        if not values_list:
+            return []
+        if self._config.dry_run:
+            logger.info("[DRY RUN] Would create %s %s records", len(values_list), self._model_name)
+            return [-1] * len(values_list)
+
+        chunk_size = max(1, int(self._config.batch_size or 1))
+        ids: List[Optional[int]] = []
+        for start in range(0, len(values_list), chunk_size):
+            chunk = values_list[start:start + chunk_size]
+            if isolate_failures:
+                ids.extend(self._create_isolated(chunk, start, on_failure))
+            else:
+                ids.extend(self._create_chunk(chunk))
+        logger.info("Created %s %s records", sum(1 for item in ids if item is not None), self._model_name)
+        return ids
+
+    def _create_chunk(self, chunk: List[Dict[str, Any]], retry: bool = True) -> List[int]:
+        if retry:
+            created = self._conn.create(self._model_name, chunk)
+        else:
+            created = self._conn.execute_once(self._model_name, "create", chunk)
+        ids = [int(item) for item in created] if isinstance(created, list) else [int(created)]
+        if len(ids) != len(chunk):
+            raise OperationError(
+                f"Bulk create returned {len(ids)} IDs for {len(chunk)} rows",
+                model=self._model_name,
+                operation="create",
+            )
         return ids
 
+    def _create_isolated(
+        self,
+        chunk: List[Dict[str, Any]],
+        offset: int,
+        on_failure: Optional[Callable[[int, Dict[str, Any], Exception], None]],
+        retry: bool = True,
+    ) -> List[Optional[int]]:
+        try:
+            return list(self._create_chunk(chunk, retry=retry))
+        except Exception as exc:
+            if len(chunk) == 1:
+                logger.warning("Create failed for %s row %s: %s", self._model_name, offset, exc)
+                if on_failure:
+                    on_failure(offset, chunk[0], exc)
+                return [None]
+        middle = len(chunk) // 2
+        return [
+            *self._create_isolated(chunk[:middle], offset, on_failure, retry=False),
+            *self._create_isolated(chunk[middle:], offset + middle, on_failure, retry=False),
+        ]
+
     def write(self, ids: List[int], values: Dict[str, Any]) -> bool:
         self._validate_write(values)
         if self._config.dry_run:
@@ -153,7 +217,13 @@ class BaseService(ABC):
     def connection(self, value: OdooConnection) -> None:
         self._conn = value
 
-    def execute_in_transaction(self, operations: List[Dict[str, Any]]) -> List[Any]:
+    def execute_in_transaction(
+        self,
+        operations: List[Dict[str, Any]],
+        batched: bool = False,
+    ) -> List[Any]:
+        if batched:
+            return self._execute_batched(operations)
         results = []
         for operation in operations:
             model = operation["model"]
@@ -163,6 +233,20 @@ class BaseService(ABC):
             results.append(self.connection.execute(model, method, *args, **kwargs))
         return results
 
+    def _execute_batched(self, operations: List[Dict[str, Any]]) -> List[Any]:
+        """Send operations as JSON-RPC batches; raise the first failure in input order."""
+        with self.connection.batch() as batch:
+            futures = [
+                batch.execute(
+                    operation["model"],
+                    operation["method"],
+                    *operation.get("args", []),
+                    **operation.get("kwargs", {}),
+                )
+                for operation in operations
+            ]
+        return [future.result() for future in futures]
+
 
 class SingletonMeta(type):
     """Metaclass implementing the Singleton pattern."""
@@ -4,12 +4,14 @@ Odoo Connection Module
 Handles JSON-RPC connection to Odoo server with proper error handling.
 """
 
+import itertools
 import json
 import logging
 import ssl
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import Future
 from typing import Any, Dict, List, Optional
 
 from lib.python.odoo_reusable.core.config import Configuration
@@ -30,6 +32,8 @@ class OdooConnection:
         self._config = config or Configuration()
         self._uid: Optional[int] = None
         self._connected = False
+        self._request_ids = itertools.count(1)
+        self._batch_supported: Optional[bool] = None
 
         self._ssl_context = ssl.create_default_context()
         if not self._config.odoo_verify_ssl:
@@ -73,21 +77,22 @@ class OdooConnection:
             endpoint = f"/{endpoint}"
         return endpoint
 
-    def _json_call(
-        self,
-        service: str,
-        method: str,
-        args: List[Any],
-        kwargs: Optional[Dict[str, Any]] = None,
-    ) -> Any:
-        endpoint = f"{self.url.rstrip('/')}{self.jsonrpc_endpoint}"
+    def _timeout_seconds(self) -> float:
         try:
             timeout_seconds = float(self._config.get("odoo.timeout", 120))
             if timeout_seconds <= 0:
                 timeout_seconds = 120.0
         except Exception:
             timeout_seconds = 120.0
+        return timeout_seconds
 
+    def _build_envelope(
+        self,
+        service: str,
+        method: str,
+        args: List[Any],
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         params = {
             "service": service,
             "method": method,
@@ -96,14 +101,16 @@ class OdooConnection:
         if kwargs:
             params["kwargs"] = kwargs
 
-        data = {
+        return {
             "jsonrpc": "2.0",
             "method": "call",
             "params": params,
-            "id": int(time.time()),
+            "id": next(self._request_ids),
         }
 
-        encoded_data = json.dumps(data).encode("utf-8")
+    def _post(self, payload: Any) -> Any:
+        endpoint = f"{self.url.rstrip('/')}{self.jsonrpc_endpoint}"
+        encoded_data = json.dumps(payload).encode("utf-8")
         request = urllib.request.Request(
             endpoint,
             data=encoded_data,
@@ -114,15 +121,24 @@ class OdooConnection:
             with urllib.request.urlopen(
                 request,
                 context=self._ssl_context,
-                timeout=timeout_seconds,
+                timeout=self._timeout_seconds(),
             ) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                if "error" in result:
-                    raise Exception(f"JSON-RPC Error: {result['error']}")
-                return result.get("result")
+                return json.loads(response.read().decode("utf-8"))
         except urllib.error.URLError as exc:
             raise OdooConnectionError(f"Network error: {exc}", url=self.url)
 
+    def _json_call(
+        self,
+        service: str,
+        method: str,
+        args: List[Any],
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        result = self._post(self._build_envelope(service, method, args, kwargs))
+        if "error" in result:
+            raise Exception(f"JSON-RPC Error: {result['error']}")
+        return result.get("result")
+
     def connect(self) -> int:
         """Establish connection and authenticate with Odoo."""
         try:
@@ -174,30 +190,13 @@ class OdooConnection:
 
         for attempt in range(retry_attempts):
             try:
-                return self._json_call(
-                    "object",
-                    "execute_kw",
-                    [self.db, self.uid, self.password, model, method, list(args)],
-                    kwargs,
-                )
+                return self._execute_kw(model, method, args, kwargs)
             except Exception as exc:
-                error_msg = str(exc)
                 last_error = exc
 
-                if "does not exist" in error_msg.lower():
-                    raise NotFoundError(
-                        f"Record not found in {model}",
-                        resource_type=model,
-                        identifier=str(args),
-                    )
-
-                if "traceback" in error_msg.lower() or "fault" in error_msg.lower():
-                    raise OperationError(
-                        f"Odoo operation failed: {error_msg}",
-                        model=model,
-                        operation=method,
-                        original_error=exc,
-                    )
+                classified = self._classify_error(model, method, args, exc)
+                if classified is not None:
+                    raise classified
 
                 logger.warning(
                     "Operation attempt %s/%s failed: %s",
@@ -215,6 +214,60 @@ class OdooConnection:
             original_error=last_error,
         )
 
+    def execute_once(self, model: str, method: str, *args, **kwargs) -> Any:
+        """Execute a method on an Odoo model with a single attempt and no retry delay."""
+        if not self.is_connected:
+            self.connect()
+        try:
+            return self._execute_kw(model, method, args, kwargs)
+        except Exception as exc:
+            classified = self._classify_error(model, method, args, exc)
+            if classified is not None:
+                raise classified
+            raise OperationError(
+                f"Operation failed: {exc}",
+                model=model,
+                operation=method,
+                original_error=exc,
+            )
+
+    def _execute_kw(self, model: str, method: str, args: Any, kwargs: Dict[str, Any]) -> Any:
+        return self._json_call(
+            "object",
+            "execute_kw",
+            [self.db, self.uid, self.password, model, method, list(args)],
+            kwargs,
+        )
+
+    @staticmethod
+    def _classify_error(
+        model: str,
+        method: str,
+        args: Any,
+        exc: Exception,
+    ) -> Optional[Exception]:
+        """Map a raw JSON-RPC failure to a library exception, or None when retryable."""
+        error_msg = str(exc)
+        if "does not exist" in error_msg.lower():
+            return NotFoundError(
+                f"Record not found in {model}",
+                resource_type=model,
+                identifier=str(args),
+            )
+
+        if "traceback" in error_msg.lower() or "fault" in error_msg.lower():
+            return OperationError(
+                f"Odoo operation failed: {error_msg}",
+                model=model,
+                operation=method,
+                original_error=exc,
+            )
+        return None
+
+    def batch(self, max_size: Optional[int] = None) -> "OdooBatch":
+        """Queue execute_kw calls and send them as JSON-RPC array requests."""
+        return OdooBatch(self, max_size=max_size)
+
     def search(
         self,
         model: str,
@@ -263,7 +316,12 @@ class OdooConnection:
             kwargs["fields"] = fields
         return self.execute(model, "read", ids, **kwargs)
 
-    def create(self, model: str, values: Dict[str, Any]) -> int:
+    def create(
+        self,
+        model: str,
+        values: Dict[str, Any] | List[Dict[str, Any]],
+    ) -> int | List[int]:
+        """Create one record, or several when `values` is a list of dicts."""
         if self._config.dry_run:
             logger.info("[DRY RUN] Would create %s with values: %s", model, values)
             return -1
@@ -285,6 +343,167 @@ class OdooConnection:
         return OdooRecordSet(self, model, ids)
 
 
+class OdooBatch:
+    """
+    Context manager that coalesces execute_kw calls into JSON-RPC batch requests.
+
+    Calls return futures resolved on flush (automatically on clean context exit).
+    Servers that reject array payloads (a single error object in reply) are
+    remembered per connection and served by sequential `execute` calls instead.
+    Transport failures fail the pending futures: the server may already have
+    run the batch, so the calls are never replayed.
+    """
+
+    def __init__(self, connection: OdooConnection, max_size: Optional[int] = None):
+        self._conn = connection
+        self._max_size = max(1, int(max_size or connection.config.batch_size or 100))
+        self._pending: List[tuple[Dict[str, Any], Future]] = []
+        self.requests_sent = 0
+        self.calls_sent = 0
+
+    def __enter__(self) -> "OdooBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.flush()
+            return
+        for _call, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def execute(self, model: str, method: str, *args, **kwargs) -> Future:
+        future: Future = Future()
+        call = {"model": model, "method": method, "args": list(args), "kwargs": kwargs}
+        self._pending.append((call, future))
+        if len(self._pending) >= self._max_size:
+            self.flush()
+        return future
+
+    def create(self, model: str, values: Any) -> Future:
+        if self._conn.config.dry_run:
+            logger.info("[DRY RUN] Would create %s with values: %s", model, values)
+            return self._resolved(-1)
+        return self.execute(model, "create", values)
+
+    def write(self, model: str, ids: List[int], values: Dict[str, Any]) -> Future:
+        if self._conn.config.dry_run:
+            logger.info("[DRY RUN] Would update %s IDs %s with values: %s", model, ids, values)
+            return self._resolved(True)
+        return self.execute(model, "write", ids, values)
+
+    def unlink(self, model: str, ids: List[int]) -> Future:
+        if self._conn.config.dry_run:
+            logger.info("[DRY RUN] Would delete %s IDs: %s", model, ids)
+            return self._resolved(True)
+        return self.execute(model, "unlink", ids)
+
+    def flush(self) -> None:
+        """Send every queued call and resolve their futures."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        if not self._conn.is_connected:
+            self._conn.connect()
+
+        if len(pending) == 1 or self._conn._batch_supported is False:
+            self._execute_sequential(pending)
+            return
+
+        envelopes: Dict[int, tuple[Dict[str, Any], Future]] = {}
+        payload = []
+        for call, future in pending:
+            envelope = self._conn._build_envelope(
+                "object",
+                "execute_kw",
+                [
+                    self._conn.db,
+                    self._conn.uid,
+                    self._conn.password,
+                    call["model"],
+                    call["method"],
+                    call["args"],
+                ],
+                call["kwargs"],
+            )
+            envelopes[envelope["id"]] = (call, future)
+            payload.append(envelope)
+
+        try:
+            response = self._conn._post(payload)
+        except (OdooConnectionError, ValueError) as exc:
+            # The server may already have run the batch; never replay it.
+            logger.warning("JSON-RPC batch request failed: %s", exc)
+            for _call, future in pending:
+                future.set_exception(exc)
+            return
+
+        if isinstance(response, dict) and "error" in response:
+            logger.warning("Server rejected JSON-RPC batch payload; falling back to sequential calls")
+            self._conn._batch_supported = False
+            self._execute_sequential(pending)
+            return
+        if not isinstance(response, list):
+            exc = OdooConnectionError(f"Unexpected JSON-RPC batch response: {type(response).__name__}")
+            for _call, future in pending:
+                future.set_exception(exc)
+            return
+
+        self._conn._batch_supported = True
+        self.requests_sent += 1
+        self.calls_sent += len(pending)
+        for item in response:
+            entry = envelopes.pop(item.get("id"), None) if isinstance(item, dict) else None
+            if entry is None:
+                continue
+            call, future = entry
+            if "error" in item:
+                future.set_exception(self._call_error(call, item["error"]))
+            else:
+                future.set_result(item.get("result"))
+
+        for call, future in envelopes.values():
+            future.set_exception(
+                OperationError(
+                    "Missing response for batched call",
+                    model=call["model"],
+                    operation=call["method"],
+                )
+            )
+
+    def _execute_sequential(self, pending: List[tuple[Dict[str, Any], Future]]) -> None:
+        for call, future in pending:
+            self.requests_sent += 1
+            self.calls_sent += 1
+            try:
+                result = self._conn.execute(call["model"], call["method"], *call["args"], **call["kwargs"])
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def _call_error(self, call: Dict[str, Any], error: Any) -> Exception:
+        exc = Exception(f"JSON-RPC Error: {error}")
+        classified = self._conn._classify_error(call["model"], call["method"], call["args"], exc)
+        if classified is not None:
+            return classified
+        return OperationError(
+            f"Odoo operation failed: {exc}",
+            model=call["model"],
+            operation=call["method"],
+            original_error=exc,
+        )
+
+    @staticmethod
+    def _resolved(value: Any) -> Future:
+        future: Future = Future()
+        future.set_result(value)
+        return future
+
+
 class OdooRecordSet:
     """Proxy object for operating on a set of Odoo records."""
 
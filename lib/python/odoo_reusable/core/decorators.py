@@ -6,8 +6,11 @@ Implements decorators for logging, retries, validation, and performance.
 
 import functools
 import logging
+import math
+import threading
 import time
-from typing import Any, Callable, Optional, ParamSpec, TypeVar
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional, ParamSpec, TypeVar
 
 from lib.python.odoo_reusable.core.exceptions import RPRentalError, ValidationError
 
@@ -16,6 +19,8 @@ logger = logging.getLogger(__name__)
 P = ParamSpec("P")
 T = TypeVar("T")
 
+CACHE_MAX_SIZE = 1024
+
 
 def log_operation(
     operation_name: Optional[str] = None,
@@ -141,28 +146,166 @@ def validate_input(
     return decorator
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class _InFlight:
+    __slots__ = ("owner", "done", "result", "error")
+
+    def __init__(self) -> None:
+        self.owner = threading.get_ident()
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _ResultCache:
+    """LRU store behind `cache_result`; one lock per decorated function."""
+
+    def __init__(self, max_size: Optional[int], ttl_seconds: Optional[float]):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._in_flight: dict[Hashable, _InFlight] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any], name: str) -> Any:
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    logger.debug("Cache hit for %s", name)
+                    return entry[0]
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            flight = self._in_flight.get(key)
+            if flight is None:
+                flight = self._in_flight[key] = _InFlight()
+            elif flight.owner == threading.get_ident():
+                flight = None  # re-entrant call for a key this thread is computing
+
+        if flight is None:
+            result = compute()
+            self._store(key, result)
+            return result
+        if flight.owner != threading.get_ident():
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = compute()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        else:
+            self._store(key, flight.result)
+            logger.debug("Cached result for %s", name)
+            return flight.result
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+            flight.done.set()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._expirations,
+                self.max_size,
+                len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        with self._lock:
+            now = time.monotonic()
+            expires = now + self.ttl_seconds if self.ttl_seconds is not None else math.inf
+            self._entries[key] = (result, expires)
+            self._entries.move_to_end(key)
+            if self.ttl_seconds is not None and now >= self._next_sweep:
+                self._sweep(now)
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+
+    def _sweep(self, now: float) -> None:
+        expired = [key for key, (_result, expires) in self._entries.items() if expires <= now]
+        for key in expired:
+            del self._entries[key]
+        self._expirations += len(expired)
+        self._next_sweep = now + self.ttl_seconds  # type: ignore[operator]
+
+
+_FAST_KEY_TYPES = frozenset({str, int})
+_KWARGS_MARK = object()
+_REPR_KEY = object()
+
+
+def _make_cache_key(args: tuple, kwargs: dict) -> Hashable:
+    """Typed key like `functools._make_key(typed=True)`: `f(True)` and `f(1.0)` differ."""
+    if not kwargs and len(args) == 1 and type(args[0]) in _FAST_KEY_TYPES:
+        return args[0]
+    items = sorted(kwargs.items())
+    key: tuple = args
+    if items:
+        key += (_KWARGS_MARK,)
+        for item in items:
+            key += item
+    key += tuple(type(value) for value in args)
+    key += tuple(type(value) for _name, value in items)
+    try:
+        hash(key)
+    except TypeError:
+        return (_REPR_KEY, repr(key))
+    return key
+
+
 def cache_result(
     ttl_seconds: Optional[float] = None,
-    key_func: Optional[Callable[..., str]] = None,
+    key_func: Optional[Callable[..., Hashable]] = None,
+    max_size: Optional[int] = CACHE_MAX_SIZE,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
-    """Decorator to cache function results."""
-    cache: dict = {}
+    """Decorator to cache function results.
+
+    Each decorated function gets a thread-safe LRU of `max_size` entries
+    (None for unbounded); expired entries are swept at most once per TTL.
+    Hashable arguments and their types form the key, unhashable ones fall
+    back to their repr. Concurrent misses on one key wait for a single call.
+    `wrapper.cache_info()` and `wrapper.cache_clear()` mirror `functools.lru_cache`.
+    """
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        cache = _ResultCache(max_size, ttl_seconds)
+
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            key = key_func(*args, **kwargs) if key_func else str((args, tuple(sorted(kwargs.items()))))
-            if key in cache:
-                cached_result, cached_time = cache[key]
-                if ttl_seconds is None or time.time() - cached_time < ttl_seconds:
-                    logger.debug("Cache hit for %s", func.__name__)
-                    return cached_result
-
-            result = func(*args, **kwargs)
-            cache[key] = (result, time.time())
-            logger.debug("Cached result for %s", func.__name__)
-            return result
+            key = key_func(*args, **kwargs) if key_func else _make_cache_key(args, kwargs)
+            return cache.get_or_compute(key, lambda: func(*args, **kwargs), func.__name__)
 
+        wrapper.cache_info = cache.info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
@@ -0,0 +1,200 @@
+"""Shared ir.model / ir.model.fields metadata cache with on-disk persistence."""
+
+import hashlib
+import inspect
+import json
+import logging
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+FIELD_ATTRIBUTES = ["name", "ttype", "relation"]
+# Relative to the caller's project root; see `shared_metadata_cache`.
+METADATA_CACHE_DIR = Path(".cache/model_metadata")
+
+_SHARED_CACHES: "weakref.WeakKeyDictionary[Any, ModelMetadataCache]" = weakref.WeakKeyDictionary()
+
+
+class ModelMetadataCache:
+    """Answer ir.model / ir.model.fields lookups from memory.
+
+    All fields of a model are fetched with one `search_read` the first time the
+    model is touched. Entries persist to `<cache_dir>/<host+db digest>.json`
+    together with a fingerprint of installed modules; a changed fingerprint
+    (module install/upgrade) discards the stored entries. `search_read` is any
+    `(model, domain, fields=...) -> rows` callable, so every client type can
+    share this class through a small `shared_metadata_cache` adapter. A bound
+    method is held weakly, so a cache kept per client does not keep that
+    client alive.
+    """
+
+    def __init__(
+        self,
+        search_read: Callable[..., List[Dict[str, Any]]],
+        host: str,
+        db: str,
+        cache_dir: Optional[Path] = None,
+    ):
+        self._search_read: Callable[[], Optional[Callable[..., List[Dict[str, Any]]]]]
+        if inspect.ismethod(search_read):
+            self._search_read = weakref.WeakMethod(search_read)
+        else:
+            self._search_read = lambda: search_read
+        self.host = (host or "").strip().lower()
+        self.db = db
+        self.cache_dir = cache_dir
+        self._fingerprint: Optional[str] = None
+        self._models: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def search_read(self, model: str, domain: List[Any], **kwargs: Any) -> List[Dict[str, Any]]:
+        search_read = self._search_read()
+        if search_read is None:
+            raise ReferenceError("The client backing this metadata cache no longer exists")
+        return search_read(model, domain, **kwargs)
+
+    @property
+    def cache_path(self) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha1(f"{self.host}|{self.db}".encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{digest}.json"
+
+    def model_id(self, model: str) -> Optional[int]:
+        entry = self._model_entry(model)
+        return entry.get("id")
+
+    def fields(self, model: str) -> Dict[str, Dict[str, Any]]:
+        entry = self._model_entry(model)
+        if entry.get("fields") is None:
+            self.stats["misses"] += 1
+            rows = self.search_read(
+                "ir.model.fields",
+                [("model", "=", model)],
+                fields=FIELD_ATTRIBUTES,
+            )
+            entry["fields"] = {
+                str(row["name"]): {"ttype": row.get("ttype"), "relation": row.get("relation") or None}
+                for row in rows
+                if row.get("name")
+            }
+            self._save()
+        else:
+            self.stats["hits"] += 1
+        return entry["fields"]
+
+    def field_exists(self, model: str, field_name: str) -> bool:
+        return field_name in self.fields(model)
+
+    def prefetch_models(self, models: Iterable[str]) -> None:
+        """Resolve ids of several models with a single ir.model read."""
+        self._ensure_loaded()
+        missing = sorted({item for item in models if item and item not in self._models})
+        if not missing:
+            return
+        self.stats["misses"] += 1
+        rows = self.search_read("ir.model", [("model", "in", missing)], fields=["id", "model"])
+        ids = {str(row.get("model")): row.get("id") for row in rows}
+        for model in missing:
+            model_id = ids.get(model)
+            self._models[model] = {"id": int(model_id) if isinstance(model_id, int) else None, "fields": None}
+        self._save()
+
+    def refresh_fingerprint(self) -> bool:
+        """Re-read installed modules; drop cached entries when they changed."""
+        fingerprint = self._read_fingerprint()
+        changed = self._fingerprint is not None and fingerprint != self._fingerprint
+        self._fingerprint = fingerprint
+        if changed:
+            self.invalidate()
+        return changed
+
+    def invalidate(self) -> None:
+        self._models.clear()
+        self.stats["invalidations"] += 1
+        path = self.cache_path
+        if path and path.exists():
+            path.unlink()
+
+    def _model_entry(self, model: str) -> Dict[str, Any]:
+        self._ensure_loaded()
+        entry = self._models.get(model)
+        if entry is not None:
+            self.stats["hits"] += 1
+            return entry
+        self.prefetch_models([model])
+        return self._models[model]
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        self._fingerprint = self._read_fingerprint()
+        path = self.cache_path
+        if not path or not path.exists():
+            return
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Ignoring unreadable metadata cache: %s", path)
+            return
+        if payload.get("fingerprint") != self._fingerprint:
+            self.stats["invalidations"] += 1
+            return
+        models = payload.get("models")
+        if isinstance(models, dict):
+            self._models = models
+
+    def _read_fingerprint(self) -> str:
+        rows: List[Dict[str, Any]] = self.search_read(
+            "ir.module.module",
+            [("state", "=", "installed")],
+            fields=["name", "latest_version"],
+        )
+        parts = sorted(f"{row.get('name')}:{row.get('latest_version') or ''}" for row in rows)
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _save(self) -> None:
+        path = self.cache_path
+        if not path:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "host": self.host,
+            "db": self.db,
+            "fingerprint": self._fingerprint,
+            "models": self._models,
+        }
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(path)
+
+
+def shared_metadata_cache(
+    connection: Any,
+    cache_dir: Optional[Path] = None,
+    project_root: Optional[Path] = None,
+) -> ModelMetadataCache:
+    """Return the metadata cache shared by every helper using `connection`.
+
+    Without an explicit `cache_dir`, `files.metadata_cache_dir` (or
+    `METADATA_CACHE_DIR`) is resolved against `project_root`, defaulting to
+    the working directory.
+    """
+    cache = _SHARED_CACHES.get(connection)
+    if cache is None:
+        if cache_dir is None:
+            configured_dir = connection.config.get("files.metadata_cache_dir")
+            cache_dir = Path(project_root or ".") / (configured_dir or METADATA_CACHE_DIR)
+        cache = ModelMetadataCache(
+            connection.search_read,
+            host=urlparse(connection.url).hostname or "",
+            db=connection.db,
+            cache_dir=cache_dir,
+        )
+        _SHARED_CACHES[connection] = cache
+    return cache
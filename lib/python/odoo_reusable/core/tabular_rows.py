@@ -1,13 +1,23 @@
 """Reusable helpers for tolerant tabular row/header extraction."""
 
 import math
-from typing import Any, Mapping, MutableMapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable, Mapping, MutableMapping, Sequence
 
 DEFAULT_TABULAR_EMPTY_TOKENS = frozenset({"none", "nan"})
 
 
 def normalize_tabular_key(key: Any) -> str:
     """Normalize a header key so minor punctuation/spacing changes do not break lookup."""
+    try:
+        return _normalize_tabular_key(key)
+    except TypeError:
+        return "".join(ch.lower() for ch in str(key or "") if ch.isalnum())
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _normalize_tabular_key(key: Any) -> str:
     return "".join(ch.lower() for ch in str(key or "") if ch.isalnum())
 
 
@@ -64,6 +74,133 @@ def clean_tabular_text_value(
     return "" if text.lower() in empty_tokens else text
 
 
+def clean_tabular_text_column(
+    values: Iterable[Any],
+    empty_tokens: frozenset[str] = DEFAULT_TABULAR_EMPTY_TOKENS,
+) -> list[str]:
+    """Apply `clean_tabular_text_value` to one column, cleaning each distinct string once."""
+    cleaned: dict[str, str] = {}
+    result: list[str] = []
+    append = result.append
+    for value in values:
+        if type(value) is str:
+            text = cleaned.get(value)
+            if text is None:
+                text = cleaned[value] = clean_tabular_text_value(value, empty_tokens)
+            append(text)
+        else:
+            append(clean_tabular_text_value(value, empty_tokens))
+    return result
+
+
+@dataclass(frozen=True)
+class TabularSchema:
+    """Field aliases resolved to column positions for one header row.
+
+    Resolution follows `get_tabular_value_by_aliases`: per alias, the exact (or
+    space-padded) header first, then the last header with the same normalized
+    form; the first non-None cell wins. Rows may be header-keyed mappings or
+    value sequences in header order.
+    """
+
+    headers: tuple[Any, ...]
+    positions: dict[str, tuple[int, ...]]
+
+    @classmethod
+    def compile(cls, headers: Iterable[Any], fields: Mapping[str, Sequence[str]]) -> "TabularSchema":
+        headers = tuple(headers)
+        exact: dict[Any, int] = {}
+        normalized: dict[str, int] = {}
+        for position, header in enumerate(headers):
+            exact.setdefault(header, position)
+            normalized[normalize_tabular_key(header)] = position
+        positions: dict[str, tuple[int, ...]] = {}
+        for field_name, aliases in fields.items():
+            candidates: list[int] = []
+            for alias in aliases:
+                direct = exact.get(alias, exact.get(f" {alias} "))
+                if direct is not None:
+                    candidates.append(direct)
+                fallback = normalized.get(normalize_tabular_key(alias))
+                if fallback is not None:
+                    candidates.append(fallback)
+            positions[field_name] = tuple(dict.fromkeys(candidates))
+        return cls(headers=headers, positions=positions)
+
+    @property
+    def missing_fields(self) -> list[str]:
+        """Fields none of whose aliases matched a header."""
+        return [field_name for field_name, candidates in self.positions.items() if not candidates]
+
+    def value(self, row: Mapping[Any, Any] | Sequence[Any], field_name: str, default: Any = "") -> Any:
+        """Extract one field from one row."""
+        cells = self._cells(row)
+        for position in self.positions[field_name]:
+            cell = cells(position)
+            if cell is not None:
+                return cell
+        return default
+
+    def extract(self, row: Mapping[Any, Any] | Sequence[Any], default: Any = "") -> dict[str, Any]:
+        """Extract every field from one row."""
+        cells = self._cells(row)
+        values: dict[str, Any] = {}
+        for field_name, candidates in self.positions.items():
+            value = default
+            for position in candidates:
+                cell = cells(position)
+                if cell is not None:
+                    value = cell
+                    break
+            values[field_name] = value
+        return values
+
+    def extract_columns(
+        self,
+        rows: Iterable[Mapping[Any, Any] | Sequence[Any]],
+        clean: bool = True,
+        default: Any = "",
+        empty_tokens: frozenset[str] = DEFAULT_TABULAR_EMPTY_TOKENS,
+    ) -> dict[str, list[Any]]:
+        """Extract every field for a batch of rows as columns, cleaned column-wise."""
+        columns: dict[str, list[Any]] = {field_name: [] for field_name in self.positions}
+        fields = [(columns[field_name], candidates) for field_name, candidates in self.positions.items()]
+        for row in rows:
+            cells = self._cells(row)
+            for column, candidates in fields:
+                value = default
+                for position in candidates:
+                    cell = cells(position)
+                    if cell is not None:
+                        value = cell
+                        break
+                column.append(value)
+        if clean:
+            return {
+                field_name: clean_tabular_text_column(column, empty_tokens)
+                for field_name, column in columns.items()
+            }
+        return columns
+
+    def extract_rows(
+        self,
+        rows: Iterable[Mapping[Any, Any] | Sequence[Any]],
+        clean: bool = True,
+        default: Any = "",
+        empty_tokens: frozenset[str] = DEFAULT_TABULAR_EMPTY_TOKENS,
+    ) -> list[dict[str, Any]]:
+        """Row-oriented view of `extract_columns`."""
+        columns = self.extract_columns(rows, clean=clean, default=default, empty_tokens=empty_tokens)
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())] if names else []
+
+    def _cells(self, row: Mapping[Any, Any] | Sequence[Any]):
+        if isinstance(row, Mapping):
+            headers = self.headers
+            return lambda position: row.get(headers[position])
+        return lambda position: row[position] if position < len(row) else None
+
+
 def set_if_not_empty(target: MutableMapping[str, Any], key: str, value: Any) -> None:
     """Set one mapping key only when the incoming value is not empty."""
     if value is None:
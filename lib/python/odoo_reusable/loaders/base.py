@@ -4,11 +4,16 @@ Base Data Loader - Abstract Base Class for Data Loading
 Defines the interface and common functionality for data loaders.
 """
 
+import copy
 import logging
+import os
+import pickle
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Set, Tuple, TypeVar
 
 from lib.python.odoo_reusable.core.exceptions import DataLoadError
 
@@ -16,10 +21,29 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+ERROR_VALUE_SAMPLE_SIZE = 100
+ERROR_VALUE_MAX_CHARS = 500
 
-@dataclass
+# The pool only pays off when validating/transforming a row costs well over
+# what the parent spends pickling it out and the result back in. Measured with
+# scripts/benchmarks/data_loader_workers.py: the stock loaders do ~0.1 us of
+# work per row against ~7 us of pickling, so they always stay sequential.
+PARALLEL_MIN_COST_RATIO = 2.0
+
+_WORKER_LOADER: Optional["DataLoader"] = None
+
+
+@dataclass(slots=True)
 class DataLoadResult(Generic[T]):
-    """Result of a data loading operation."""
+    """Result of a data loading operation.
+
+    `data` holds the loaded row objects. With `compact=True`, dict rows that
+    share the first row's keys are instead packed as value tuples against
+    `header` in `packed_rows` (other rows are kept as-is, their positions in
+    `raw_positions`); `iter_data` rebuilds the dicts lazily. Only the first
+    `max_error_values` errors keep a stringified row value, cut to
+    `max_value_chars`.
+    """
 
     data: List[T] = field(default_factory=list)
     errors: List[Dict[str, Any]] = field(default_factory=list)
@@ -27,6 +51,12 @@ class DataLoadResult(Generic[T]):
     total_rows: int = 0
     successful_rows: int = 0
     failed_rows: int = 0
+    compact: bool = False
+    max_error_values: int = ERROR_VALUE_SAMPLE_SIZE
+    max_value_chars: int = ERROR_VALUE_MAX_CHARS
+    header: Optional[Tuple[str, ...]] = None
+    packed_rows: List[Any] = field(default_factory=list, repr=False)
+    raw_positions: Set[int] = field(default_factory=set, repr=False)
 
     @property
     def success(self) -> bool:
@@ -45,12 +75,13 @@ class DataLoadResult(Generic[T]):
         field: Optional[str] = None,
         value: Optional[Any] = None,
     ) -> None:
+        sampled = value is not None and len(self.errors) < self.max_error_values
         self.errors.append(
             {
                 "row": row_number,
                 "message": message,
                 "field": field,
-                "value": str(value) if value is not None else None,
+                "value": str(value)[: self.max_value_chars] if sampled else None,
             }
         )
         self.failed_rows += 1
@@ -70,9 +101,48 @@ class DataLoadResult(Generic[T]):
         )
 
     def add_success(self, data: T) -> None:
-        self.data.append(data)
+        if self.compact:
+            self._pack(data)
+        else:
+            self.data.append(data)
         self.successful_rows += 1
 
+    def merge(self, other: "DataLoadResult[T]") -> None:
+        """Append another result's rows, errors and counters (e.g. a later chunk)."""
+        if not self.compact:
+            self.data.extend(other.iter_data())
+        elif other.compact and other.header == self.header and not other.data:
+            offset = len(self.packed_rows)
+            self.raw_positions.update(position + offset for position in other.raw_positions)
+            self.packed_rows.extend(other.packed_rows)
+        else:
+            for item in other.iter_data():
+                self._pack(item)
+        for error in other.errors:
+            if error["value"] is not None and len(self.errors) >= self.max_error_values:
+                error = {**error, "value": None}
+            self.errors.append(error)
+        self.warnings.extend(other.warnings)
+        self.successful_rows += other.successful_rows
+        self.failed_rows += other.failed_rows
+
+    def iter_data(self) -> Iterator[T]:
+        """Yield every loaded row, rebuilding packed dict rows on the fly."""
+        yield from self.data
+        header = self.header
+        raw_positions = self.raw_positions
+        for position, item in enumerate(self.packed_rows):
+            if position in raw_positions:
+                yield item
+            else:
+                yield dict(zip(header, item))  # type: ignore[arg-type, misc]
+
+    def iter_packed(self) -> Iterator[Tuple[Any, ...]]:
+        """Yield the value tuples of rows packed against `header`."""
+        for position, item in enumerate(self.packed_rows):
+            if position not in self.raw_positions:
+                yield item
+
     def to_dict(self) -> dict:
         return {
             "total_rows": self.total_rows,
@@ -85,6 +155,16 @@ class DataLoadResult(Generic[T]):
             "warnings": self.warnings[:10],
         }
 
+    def _pack(self, data: Any) -> None:
+        if type(data) is dict:
+            if self.header is None and not self.packed_rows:
+                self.header = tuple(data)
+            if len(data) == len(self.header or ()) and tuple(data) == self.header:
+                self.packed_rows.append(tuple(data.values()))
+                return
+        self.raw_positions.add(len(self.packed_rows))
+        self.packed_rows.append(data)
+
 
 class DataLoader(ABC, Generic[T]):
     """Abstract base class for data loaders."""
@@ -100,9 +180,19 @@ class DataLoader(ABC, Generic[T]):
         self.transformer = transformer
         self._raw_data: List[Dict[str, Any]] = []
 
-    def load(self) -> DataLoadResult[T]:
-        """Load data from the file."""
-        result = DataLoadResult[T]()
+    def load(self, workers: int = 1, chunk_size: int = 20000, compact: bool = False) -> DataLoadResult[T]:
+        """Load data from the file.
+
+        With `workers > 1` (capped at the CPU count) the first `chunk_size`
+        rows are processed in-process and timed; the rest go to a process pool
+        only when that per-row cost is at least `PARALLEL_MIN_COST_RATIO`
+        times the cost of pickling the rows and results, so cheap
+        transformers never get slower. Pool tasks need a picklable validator
+        and transformer. Chunks are merged in file order, so the result
+        matches a sequential load. `compact` packs dict rows (see
+        `DataLoadResult`).
+        """
+        result = DataLoadResult[T](compact=compact)
 
         if not self.file_path.exists():
             raise DataLoadError(
@@ -123,20 +213,11 @@ class DataLoader(ABC, Generic[T]):
                 original_error=exc,
             )
 
-        for row_number, row in enumerate(self._raw_data, start=1):
-            try:
-                if self._is_empty_row(row):
-                    continue
-
-                if self.validator and not self.validator(row):
-                    result.add_error(row_number, "Validation failed", value=row)
-                    continue
-
-                data = self.transformer(row) if self.transformer else self._transform_row(row)  # type: ignore[arg-type]
-                result.add_success(data)
-            except Exception as exc:
-                result.add_error(row_number, f"Processing error: {exc}", value=row)
-                logger.debug("Row %s error: %s", row_number, exc)
+        if workers > 1 and len(self._raw_data) > chunk_size:
+            self._process_parallel(result, workers, chunk_size)
+        else:
+            for row_number, row in enumerate(self._raw_data, start=1):
+                self._process_row(result, row_number, row)
 
         logger.info(
             "Loaded %s/%s records (%.1f%% success rate)",
@@ -146,10 +227,89 @@ class DataLoader(ABC, Generic[T]):
         )
         return result
 
+    def iter_batches(self, batch_size: int = 1000, compact: bool = False) -> Iterator[DataLoadResult[T]]:
+        """Stream the file, yielding one validated/transformed result per chunk.
+
+        Rows are read lazily through `_iter_rows`, so at most `batch_size` raw
+        and transformed rows are held at a time. Row numbers in errors are
+        counted from the start of the file.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if not self.file_path.exists():
+            raise DataLoadError(
+                f"File not found: {self.file_path}",
+                file_path=str(self.file_path),
+            )
+
+        rows = self._iter_rows()
+        row_number = 0
+        while True:
+            batch = DataLoadResult[T](compact=compact)
+            try:
+                for row in rows:
+                    row_number += 1
+                    batch.total_rows += 1
+                    self._process_row(batch, row_number, row)
+                    if batch.total_rows >= batch_size:
+                        break
+            except DataLoadError:
+                raise
+            except Exception as exc:
+                raise DataLoadError(
+                    f"Failed to read file: {exc}",
+                    file_path=str(self.file_path),
+                    original_error=exc,
+                )
+            if not batch.total_rows:
+                return
+            yield batch
+
+    def _process_parallel(self, result: DataLoadResult[T], workers: int, chunk_size: int) -> None:
+        workers = min(workers, os.cpu_count() or 1)
+        sample = self._raw_data[:chunk_size]
+        started = time.perf_counter()
+        for row_number, row in enumerate(sample, start=1):
+            self._process_row(result, row_number, row)
+        work_seconds = time.perf_counter() - started
+
+        rest = range(chunk_size, len(self._raw_data), chunk_size)
+        if workers < 2 or work_seconds < PARALLEL_MIN_COST_RATIO * _pickle_seconds(sample, result):
+            logger.debug("Row processing too cheap for a process pool; loading sequentially")
+            for row_number in range(chunk_size + 1, len(self._raw_data) + 1):
+                self._process_row(result, row_number, self._raw_data[row_number - 1])
+            return
+
+        worker_loader = copy.copy(self)
+        worker_loader._raw_data = []
+        chunks = ((start + 1, self._raw_data[start:start + chunk_size]) for start in rest)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(worker_loader,)) as executor:
+            for chunk in executor.map(_process_chunk, chunks):
+                result.merge(chunk)
+
+    def _process_row(self, result: DataLoadResult[T], row_number: int, row: Dict[str, Any]) -> None:
+        try:
+            if self._is_empty_row(row):
+                return
+
+            if self.validator and not self.validator(row):
+                result.add_error(row_number, "Validation failed", value=row)
+                return
+
+            data = self.transformer(row) if self.transformer else self._transform_row(row)  # type: ignore[arg-type]
+            result.add_success(data)
+        except Exception as exc:
+            result.add_error(row_number, f"Processing error: {exc}", value=row)
+            logger.debug("Row %s error: %s", row_number, exc)
+
     @abstractmethod
     def _read_file(self) -> List[Dict[str, Any]]:
         """Read the file and return raw row dictionaries."""
 
+    def _iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield raw rows; loaders that can stream override this."""
+        return iter(self._read_file())
+
     @abstractmethod
     def _transform_row(self, row: Dict[str, Any]) -> T:
         """Transform one raw row into the target object."""
@@ -192,6 +352,32 @@ class DataLoader(ABC, Generic[T]):
             return 0
 
 
+def _init_worker(loader: DataLoader) -> None:
+    """Process-pool initializer: receive the loader once per worker, not once per chunk."""
+    global _WORKER_LOADER
+    _WORKER_LOADER = loader
+
+
+def _process_chunk(chunk: Tuple[int, List[Dict[str, Any]]]) -> DataLoadResult:
+    """Process-pool task: validate/transform one chunk, numbering rows from its offset."""
+    first_row_number, rows = chunk
+    result: DataLoadResult = DataLoadResult()
+    for row_number, row in enumerate(rows, start=first_row_number):
+        _WORKER_LOADER._process_row(result, row_number, row)  # type: ignore[union-attr]
+    return result
+
+
+def _pickle_seconds(rows: List[Dict[str, Any]], result: DataLoadResult) -> float:
+    """Parent-side pickling cost of shipping `rows` to a worker and `result` back."""
+    started = time.perf_counter()
+    try:
+        pickle.dumps(rows, pickle.HIGHEST_PROTOCOL)
+        pickle.loads(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return float("inf")  # the pool could not ship these rows anyway
+    return time.perf_counter() - started
+
+
 class DataLoaderFactory:
     """Factory for creating data loaders."""
 
@@ -4,14 +4,18 @@ CSV Data Loader - Loads data from CSV files
 Implements data loading from .csv files.
 """
 
+import codecs
 import csv
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
+from lib.python.odoo_reusable.core.exceptions import DataLoadError
 from lib.python.odoo_reusable.loaders.base import DataLoader, DataLoaderFactory
 
 logger = logging.getLogger(__name__)
 
+ENCODING_PROBE_BYTES = 1 << 16
+
 
 class CSVDataLoader(DataLoader):
     """Data loader for CSV files."""
@@ -34,42 +38,63 @@ class CSVDataLoader(DataLoader):
         self._headers: List[str] = []
 
     def _read_file(self) -> List[Dict[str, Any]]:
-        rows = []
-
+        return list(self._iter_rows())
+
+    def _iter_rows(self) -> Iterator[Dict[str, Any]]:
+        reader = self._iter_records(self.detect_encoding())
+
+        first_row = next(reader, None)
+        if first_row is None:
+            self._headers = []
+            return
+        if self.has_header:
+            self._headers = [header.strip() for header in first_row]
+        else:
+            self._headers = [f"col_{idx}" for idx in range(len(first_row))]
+            yield dict(zip(self._headers, first_row))
+
+        expected = len(self._headers)
+        for row in reader:
+            if len(row) == expected:
+                yield dict(zip(self._headers, row))
+            else:
+                logger.warning("Row has %s columns, expected %s", len(row), expected)
+
+    def _iter_records(self, encoding: str) -> Iterator[List[str]]:
+        """Stream raw CSV records; bytes past the probed prefix that fail to decode raise."""
+        consumed = 0
         try:
-            with open(self.file_path, "r", encoding=self.encoding, newline="") as file_obj:
-                reader = csv.reader(file_obj, delimiter=self.delimiter, quotechar=self.quotechar)
-
-                if self.has_header:
-                    self._headers = [header.strip() for header in next(reader)]
-                else:
-                    first_row = next(reader)
-                    self._headers = [f"col_{idx}" for idx in range(len(first_row))]
-                    rows.append(dict(zip(self._headers, first_row)))
-
-                for row in reader:
-                    if len(row) == len(self._headers):
-                        rows.append(dict(zip(self._headers, row)))
-                    else:
-                        logger.warning(
-                            "Row has %s columns, expected %s",
-                            len(row),
-                            len(self._headers),
-                        )
-
+            with open(self.file_path, "r", encoding=encoding, newline="") as file_obj:
+                for record in csv.reader(file_obj, delimiter=self.delimiter, quotechar=self.quotechar):
+                    consumed += 1
+                    yield record
+        except UnicodeDecodeError as exc:
+            raise DataLoadError(
+                f"File is not valid {encoding} after record {consumed}; pass encoding= explicitly",
+                file_path=str(self.file_path),
+                row_number=consumed + 1,
+                original_error=exc,
+            )
+
+    def detect_encoding(self) -> str:
+        """Pick the file encoding before parsing.
+
+        Only the first `ENCODING_PROBE_BYTES` are read. A UTF-8 BOM selects
+        `utf-8-sig`; otherwise the configured encoding must decode the prefix
+        or latin-1 is used. A multibyte sequence cut at the prefix boundary is
+        not an error. Bytes past the prefix are decoded while streaming, and a
+        failure there raises `DataLoadError` instead of re-reading the file.
+        """
+        with open(self.file_path, "rb") as file_obj:
+            head = file_obj.read(ENCODING_PROBE_BYTES)
+        if head.startswith(codecs.BOM_UTF8) and codecs.lookup(self.encoding).name == "utf-8":
+            return "utf-8-sig"
+        try:
+            codecs.getincrementaldecoder(self.encoding)().decode(head, final=len(head) < ENCODING_PROBE_BYTES)
         except UnicodeDecodeError:
-            logger.warning("Failed to decode with %s, trying latin-1", self.encoding)
-            with open(self.file_path, "r", encoding="latin-1", newline="") as file_obj:
-                reader = csv.reader(file_obj, delimiter=self.delimiter, quotechar=self.quotechar)
-
-                if self.has_header:
-                    self._headers = [header.strip() for header in next(reader)]
-
-                for row in reader:
-                    if len(row) == len(self._headers):
-                        rows.append(dict(zip(self._headers, row)))
-
-        return rows
+            logger.warning("File is not valid %s, using latin-1: %s", self.encoding, self.file_path)
+            return "latin-1"
+        return self.encoding
 
     def _transform_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         return row
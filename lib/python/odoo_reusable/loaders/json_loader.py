@@ -5,14 +5,27 @@ Implements data loading from .json files.
 """
 
 import json
-from typing import Any, Callable, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from lib.python.odoo_reusable.core.exceptions import DataLoadError
 from lib.python.odoo_reusable.loaders.base import DataLoader, DataLoaderFactory
 
+JSON_READ_CHUNK = 1 << 16
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+JSON_WHITESPACE = " \t\n\r"
+# A decode error this far before the end of the buffer cannot be a token cut
+# by the read boundary (the longest such token is `-Infinity` or a `\uXXXX`
+# escape), so it is reported instead of reading more input.
+JSON_TOKEN_MARGIN = 16
+
 
 class JSONDataLoader(DataLoader):
-    """Data loader for JSON files."""
+    """Data loader for JSON and JSON Lines files.
+
+    `_iter_rows` streams the top-level array (or the array under `data_key`)
+    one element at a time; `.jsonl`/`.ndjson` files, or `json_lines=True`,
+    are read one document per line.
+    """
 
     def __init__(
         self,
@@ -20,11 +33,17 @@ class JSONDataLoader(DataLoader):
         data_key: Optional[str] = None,
         validator: Optional[Callable] = None,
         transformer: Optional[Callable] = None,
+        json_lines: Optional[bool] = None,
     ):
         super().__init__(file_path, validator, transformer)
         self.data_key = data_key
+        if json_lines is None:
+            json_lines = self.file_path.suffix.lower() in JSON_LINES_SUFFIXES
+        self.json_lines = json_lines
 
     def _read_file(self) -> List[Dict[str, Any]]:
+        if self.json_lines:
+            return list(self._iter_rows())
         with open(self.file_path, "r", encoding="utf-8") as file_obj:
             data = json.load(file_obj)
 
@@ -45,10 +64,170 @@ class JSONDataLoader(DataLoader):
             file_path=str(self.file_path),
         )
 
+    def _iter_rows(self) -> Iterator[Dict[str, Any]]:
+        with open(self.file_path, "r", encoding="utf-8") as file_obj:
+            if self.json_lines:
+                yield from self._iter_lines(file_obj)
+                return
+            stream = _JSONStream(file_obj)
+            try:
+                yield from self._iter_document(stream)
+            except json.JSONDecodeError as exc:
+                raise DataLoadError(
+                    f"Invalid JSON: {exc.msg} at offset {stream.offset + exc.pos}",
+                    file_path=str(self.file_path),
+                    original_error=exc,
+                )
+
+    def _iter_lines(self, file_obj: IO[str]) -> Iterator[Dict[str, Any]]:
+        for line_number, line in enumerate(file_obj, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise DataLoadError(
+                    f"Invalid JSON on line {line_number}: {exc.msg}",
+                    file_path=str(self.file_path),
+                    original_error=exc,
+                )
+
+    def _iter_document(self, stream: "_JSONStream") -> Iterator[Dict[str, Any]]:
+        first = stream.peek()
+        if first == "[":
+            yield from stream.iter_array()
+            stream.expect_end()
+            return
+        if first != "{":
+            value = stream.decode_value()
+            raise DataLoadError(
+                f"Unexpected JSON structure: {type(value)}",
+                file_path=str(self.file_path),
+            )
+        if not self.data_key:
+            value = stream.decode_value()
+            stream.expect_end()
+            yield value
+            return
+
+        found = False
+        stream.expect("{")
+        if stream.peek() != "}":
+            while True:
+                if stream.peek() != '"':
+                    stream.fail("Expecting property name enclosed in double quotes")
+                key = stream.decode_value()
+                stream.expect(":")
+                if key == self.data_key and not found:
+                    if stream.peek() != "[":
+                        raise DataLoadError(
+                            f"Expected an array under key: {self.data_key}",
+                            file_path=str(self.file_path),
+                        )
+                    found = True
+                    yield from stream.iter_array()
+                else:
+                    stream.decode_value()
+                if stream.peek() == "}":
+                    break
+                stream.expect(",")
+        stream.expect("}")
+        stream.expect_end()
+        if not found:
+            raise DataLoadError(
+                f"Key not found in JSON: {self.data_key}",
+                file_path=str(self.file_path),
+            )
+
     def _transform_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         return row
 
 
+class _JSONStream:
+    """Incremental reader decoding one JSON value at a time from a text file.
+
+    Only the unconsumed tail of the file is buffered. A value is accepted
+    once a following character is buffered, so numbers and literals split
+    across reads are never decoded short. Decode errors that cannot be
+    explained by the read boundary are raised without reading further.
+    """
+
+    def __init__(self, file_obj: IO[str]):
+        self._file = file_obj
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self.offset = 0
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of input."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in JSON_WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._read():
+                return self._buffer[self._pos:self._pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            self.fail(f"Expecting {char!r}")
+        self._pos += 1
+
+    def expect_end(self) -> None:
+        if self.peek():
+            self.fail("Extra data")
+
+    def fail(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def decode_value(self) -> Any:
+        self.peek()
+        while True:
+            value, end = self._try_decode()
+            if end is not None:
+                self._pos = end
+                return value
+            if not self._read(grow=True):
+                value, self._pos = self._decoder.raw_decode(self._buffer, self._pos)
+                return value
+
+    def iter_array(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.decode_value()
+            if self.peek() == "]":
+                self._pos += 1
+                return
+            self.expect(",")
+
+    def _try_decode(self) -> Tuple[Any, Optional[int]]:
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as exc:
+            truncated = exc.msg.startswith("Unterminated string") or exc.pos + JSON_TOKEN_MARGIN >= len(self._buffer)
+            if self._eof or not truncated:
+                raise
+            return None, None
+        if end >= len(self._buffer) and not self._eof:
+            return None, None
+        return value, end
+
+    def _read(self, grow: bool = False) -> bool:
+        if self._eof:
+            return False
+        size = max(JSON_READ_CHUNK, len(self._buffer) - self._pos) if grow else JSON_READ_CHUNK
+        chunk = self._file.read(size)
+        self.offset += self._pos
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        if not chunk:
+            self._eof = True
+        return bool(chunk)
+
+
 class QCInspectionJSONLoader(JSONDataLoader):
     """Specialized loader for QC inspection data from JSON."""
 
@@ -69,4 +248,6 @@ class QCInspectionJSONLoader(JSONDataLoader):
 
 
 DataLoaderFactory.register("json", JSONDataLoader)
+DataLoaderFactory.register("jsonl", JSONDataLoader)
+DataLoaderFactory.register("ndjson", JSONDataLoader)
 
@@ -3,12 +3,19 @@
 import logging
 from typing import Any, Dict, Optional
 
+from lib.python.odoo_reusable.core.model_metadata import ModelMetadataCache, shared_metadata_cache
+
 logger = logging.getLogger(__name__)
 
 
 class ViewInfrastructureMixin:
     """Low-level Odoo view/action/menu CRUD helpers."""
 
+    @property
+    def model_metadata(self) -> ModelMetadataCache:
+        """Metadata cache shared by every helper bound to the same connection."""
+        return shared_metadata_cache(self.connection)
+
     def _search_with_inactive(
         self,
         model: str,
@@ -122,16 +129,7 @@ class ViewInfrastructureMixin:
 
     def _get_model_id(self, model_name: str) -> Optional[int]:
         """Get ir.model ID by technical model name."""
-        records = self.connection.search_read(
-            "ir.model",
-            [("model", "=", model_name)],
-            fields=["id"],
-            limit=1,
-        )
-        if not records:
-            return None
-        model_id = records[0].get("id")
-        return int(model_id) if isinstance(model_id, int) else None
+        return self.model_metadata.model_id(model_name)
 
     def _upsert_view(
         self,
@@ -314,12 +312,7 @@ class ViewInfrastructureMixin:
 
     def _field_exists(self, model: str, field_name: str) -> bool:
         """Check whether a field exists on a model."""
-        ids = self.connection.search(
-            "ir.model.fields",
-            [("model", "=", model), ("name", "=", field_name)],
-            limit=1,
-        )
-        return bool(ids)
+        return self.model_metadata.field_exists(model, field_name)
 
     def _find_view_id(self, model: str, name: str, view_type: str) -> Optional[int]:
         """Find a view ID by model + technical name + type."""
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lib.python.odoo_reusable.core.asset_labels import is_asset_key_match, normalize_asset_key  # noqa: E402
+from lib.python.odoo_reusable.core.asset_metadata import (  # noqa: E402
+    SERIAL_METADATA_LABELS,
+    normalize_legacy_metadata_value,
+    parse_serial_metadata_note,
+)
+
+
+def _legacy_normalize_asset_key(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "", str(value or "").lower())
+
+
+def _legacy_is_asset_key_match(candidate_value: str, target_key: str) -> bool:
+    normalized_target = _legacy_normalize_asset_key(target_key)
+    normalized_candidate = _legacy_normalize_asset_key(candidate_value)
+    if not normalized_target or not normalized_candidate:
+        return False
+    return normalized_candidate.startswith(normalized_target)
+
+
+def _legacy_parse_serial_metadata_note(note_value: Any) -> Dict[str, str]:
+    text = str(note_value or "")
+    parsed = {key: "" for key in SERIAL_METADATA_LABELS}
+    if not text:
+        return parsed
+    cleaned = re.sub(r"<[^>]+>", " ", text)
+    cleaned = cleaned.replace("&nbsp;", " ")
+    chunks = [chunk.strip() for chunk in re.split(r"[|\n\r]+", cleaned) if chunk.strip()]
+    for chunk in chunks:
+        upper = chunk.upper()
+        for key, label in SERIAL_METADATA_LABELS.items():
+            marker = f"{label.upper()}:"
+            if marker not in upper:
+                continue
+            if parsed[key]:
+                break
+            value = chunk.split(":", 1)[1].strip() if ":" in chunk else ""
+            parsed[key] = normalize_legacy_metadata_value(value)
+            break
+    return parsed
+
+
+def _rows(count: int, distinct: int) -> List[Dict[str, str]]:
+    rng = random.Random(7)
+    serials = [f"{rng.choice(['PSN', 'Esn', 'vin'])}-{rng.randint(0, 10**6):07d}/{rng.choice('ABCDEF')}" for _ in range(distinct)]
+    rows = []
+    for _ in range(count):
+        psn, esn, vin = rng.choice(serials), rng.choice(serials), rng.choice(serials)
+        note = rng.choice(
+            [
+                f"<p>PSN: {psn}</p><p>ESN: {esn}</p><p>VIN:&nbsp;{vin}</p>",
+                f"psn: {psn} | esn: {esn} | vin: none\nService note: checked",
+                f"Unit returned from site\nPSN: {psn}",
+                "",
+            ]
+        )
+        rows.append({"psn": psn, "target": esn[:8], "note": note})
+    return rows
+
+
+def _time(rows: List[Dict[str, str]], row_fn: Callable[[Dict[str, str]], Any], repeat: int) -> Dict[str, Any]:
+    # Best of `repeat` runs with the cyclic GC paused, like timeit: the kept result
+    # dicts otherwise trigger collections that swamp the per-row cost.
+    elapsed = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            results = [row_fn(row) for row in rows]
+            elapsed = min(elapsed, time.perf_counter() - started)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {"seconds": round(elapsed, 4), "us_per_row": round(elapsed / len(rows) * 1e6, 3), "results": results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark asset key normalization and serial note parsing per row")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--distinct", type=int, default=5_000, help="distinct serial values in the sample")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case; the fastest is reported")
+    args = parser.parse_args()
+
+    rows = _rows(args.rows, args.distinct)
+    cases = {
+        "normalize_asset_key": (
+            lambda row: _legacy_normalize_asset_key(row["psn"]),
+            lambda row: normalize_asset_key(row["psn"]),
+        ),
+        "is_asset_key_match": (
+            lambda row: _legacy_is_asset_key_match(row["psn"], row["target"]),
+            lambda row: is_asset_key_match(row["psn"], row["target"]),
+        ),
+        "parse_serial_metadata_note": (
+            lambda row: _legacy_parse_serial_metadata_note(row["note"]),
+            lambda row: parse_serial_metadata_note(row["note"]),
+        ),
+    }
+    report: Dict[str, Any] = {"rows": args.rows, "distinct": args.distinct, "cases": {}}
+    identical = True
+    for name, (before_fn, after_fn) in cases.items():
+        before = _time(rows, before_fn, args.repeat)
+        after = _time(rows, after_fn, args.repeat)
+        same = before.pop("results") == after.pop("results")
+        identical = identical and same
+        report["cases"][name] = {
+            "before": before,
+            "after": after,
+            "speedup": round(before["seconds"] / after["seconds"], 2) if after["seconds"] else None,
+            "identical": same,
+        }
+    report["identical"] = identical
+    print(json.dumps(report, indent=2))
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
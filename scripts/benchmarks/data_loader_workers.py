@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import functools
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lib.python.odoo_reusable.loaders import base as loader_base  # noqa: E402
+from lib.python.odoo_reusable.loaders.csv_loader import AssetCSVLoader  # noqa: E402
+
+HEADER = ["rpr_asset_number", "model_code", "psn", "esn", "vin", "cost", "list_price"]
+
+
+def _write_csv(path: Path, rows: int) -> None:
+    with path.open("w", encoding="utf-8", newline="") as file_obj:
+        writer = csv.writer(file_obj)
+        writer.writerow(HEADER)
+        for index in range(rows):
+            cost = "n/a" if index % 997 == 0 else f"{index % 5000}.50"
+            writer.writerow([f"RPR-{index:07d}", f"M{index % 40}", f"PSN{index}", f"ESN{index}", f"VIN{index}", cost, "99"])
+
+
+def _slow_transform(row: dict, cost_us: float) -> dict:
+    deadline = time.perf_counter() + cost_us / 1e6
+    while time.perf_counter() < deadline:
+        pass
+    return AssetCSVLoader._transform_asset(row)
+
+
+def _run(path: Path, workers: int, chunk_size: int, cost_us: float) -> dict:
+    loader = AssetCSVLoader(str(path))
+    if cost_us:
+        loader.transformer = functools.partial(_slow_transform, cost_us=cost_us)
+    pools = []
+    real_executor = loader_base.ProcessPoolExecutor
+    loader_base.ProcessPoolExecutor = lambda *args, **kwargs: pools.append(kwargs) or real_executor(*args, **kwargs)
+    started = time.perf_counter()
+    try:
+        result = loader.load(workers=workers, chunk_size=chunk_size)
+    finally:
+        loader_base.ProcessPoolExecutor = real_executor
+    return {
+        "workers": workers,
+        "pool_used": bool(pools),
+        "seconds": round(time.perf_counter() - started, 3),
+        "successful_rows": result.successful_rows,
+        "failed_rows": result.failed_rows,
+        "first_error_row": result.errors[0]["row"] if result.errors else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark DataLoader.load with and without a process pool")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--chunk-size", type=int, default=20000)
+    parser.add_argument(
+        "--row-cost-us",
+        type=float,
+        default=0.0,
+        help="extra busy-wait per row in the transformer, to find the pool crossover",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "assets.csv"
+        _write_csv(path, args.rows)
+        runs = [
+            _run(path, 1, args.chunk_size, args.row_cost_us),
+            _run(path, args.workers, args.chunk_size, args.row_cost_us),
+        ]
+
+    sequential, parallel = runs
+    identical = {key: sequential[key] for key in ("successful_rows", "failed_rows", "first_error_row")} == {
+        key: parallel[key] for key in ("successful_rows", "failed_rows", "first_error_row")
+    }
+    report = {
+        "rows": args.rows,
+        "chunk_size": args.chunk_size,
+        "row_cost_us": args.row_cost_us,
+        "cpu_count": os.cpu_count(),
+        "runs": runs,
+        "speedup": round(sequential["seconds"] / parallel["seconds"], 2) if parallel["seconds"] else None,
+        "identical": identical,
+    }
+    print(json.dumps(report, indent=2))
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,17 @@
 from odoo_bridge.app_ui.manager import ThemeManager
+from odoo_bridge.async_client import AsyncOdooClient
+from odoo_bridge.http_transport import PooledTransport, TransportConfig
 from odoo_bridge.invoice_api.manager import InvoiceApiBridgeManager
 from odoo_bridge.odoo_client import OdooClient, OdooCredentials
 from odoo_bridge.theme_framework.manager import ThemeFrameworkManager
 
 __all__ = [
+    "AsyncOdooClient",
     "ThemeManager",
     "ThemeFrameworkManager",
     "InvoiceApiBridgeManager",
     "OdooClient",
     "OdooCredentials",
+    "PooledTransport",
+    "TransportConfig",
 ]
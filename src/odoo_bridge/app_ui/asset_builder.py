@@ -1,91 +1,310 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
 
+from odoo_bridge.app_ui.build_cache import APP_UI_BUILD_DIR, BuildCache
+from odoo_bridge.app_ui.components import build_components_payload
 from odoo_bridge.app_ui.config import ThemeConfig
-from odoo_bridge.yaml_catalog import YamlCatalogLoader
+from odoo_bridge.app_ui.template import compile_template
+from odoo_bridge.minify import MINIFIER_VERSION, MINIFY_CACHE_DIR, MinifyCache, size_report, source_kind
+from odoo_bridge.yaml_catalog import YAML_CACHE_DIR, YamlCatalogLoader
+
+# Bumped when the stored section format changes.
+BUILD_FORMAT = 3
+
+# Attachment name -> (mimetype, URL placeholder, sections in load order).
+ATTACHMENT_BUNDLES: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "app_ui.css": ("text/css", "__ODOO_SHELL_CSS_URL__", ("__ODOO_SHELL_CSS__",)),
+    "app_ui_prelude.js": (
+        "application/javascript",
+        "__ODOO_SHELL_PRELUDE_JS_URL__",
+        ("__ODOO_SHELL_UNOCSS_RUNTIME_JS__",),
+    ),
+    "app_ui.js": (
+        "application/javascript",
+        "__ODOO_SHELL_JS_URL__",
+        (
+            "__ODOO_SHELL_CONFIG_JS__",
+            "__ODOO_SHELL_I18N_JS__",
+            "__ODOO_SHELL_API_JS__",
+            "__ODOO_SHELL_STATE_JS__",
+            "__ODOO_SHELL_DEMO_JS__",
+            "__ODOO_SHELL_DOM_JS__",
+            "__ODOO_SHELL_MARKUP_JS__",
+            "__ODOO_SHELL_COMPONENTS_JS__",
+            "__ODOO_SHELL_METRICS_JS__",
+            "__ODOO_SHELL_JS__",
+        ),
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ArchBuild:
+    arch: str
+    digest: str
+    reused: bool
+    rebuilt_sections: Tuple[str, ...]
+    inputs: Dict[str, str]
+    sections: Dict[str, str]
+    section_stats: Dict[str, Dict[str, Any]]
+
+    def manifest(self) -> Dict[str, Any]:
+        return {
+            "output_digest": self.digest,
+            "reused": self.reused,
+            "rebuilt_sections": list(self.rebuilt_sections),
+            "sections": self.sections,
+            "section_stats": self.section_stats,
+            "inputs": self.inputs,
+        }
+
+
+@dataclass(frozen=True)
+class AssetBundle:
+    name: str
+    mimetype: str
+    placeholder: str
+    content: str
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha1(self.content.encode("utf-8")).hexdigest()
 
 
 class AssetBuilder:
-    def __init__(self, project_root: Path, config: ThemeConfig):
+    def __init__(self, project_root: Path, config: ThemeConfig, cache: Optional[BuildCache] = None):
         self.project_root = project_root
         self.config = config
+        self.cache = cache or BuildCache(project_root / APP_UI_BUILD_DIR / f"build_{config.variant}.json")
+        self.minifier = MinifyCache(project_root / MINIFY_CACHE_DIR / f"app_ui_{config.variant}.json")
 
     def build_arch_db(self) -> str:
-        xml_template = self._read_asset(self.config.xml_template_path)
-        css_bundle = self._build_css_bundle()
-        config_js_template = self._read_asset(self.config.config_js_path)
-        i18n_js = self._read_asset(self.config.i18n_js_path)
-        api_js = self._read_asset(self.config.api_js_path)
-        state_js = self._read_asset(self.config.state_js_path)
-        demo_js = self._build_js_bundle(self.config.demo_js_parts)
-        dom_js = self._read_asset(self.config.dom_js_path)
-        markup_js = self._read_asset(self.config.markup_js_path)
-        components_js = self._read_asset(self.config.components_js_path)
-        metrics_js = self._read_asset(self.config.metrics_js_path)
-        js_template = self._read_asset(self.config.runtime_js_path)
-        unocss_runtime_js = (
-            self._read_asset(self.config.unocss_runtime_js_path)
-            if self.config.unocss_runtime_js_path
-            else ""
+        return self.build().arch
+
+    def build(self) -> ArchBuild:
+        sections, inputs, section_digests = self._section_digests()
+        template_path = self._asset_path(self.config.xml_template_path)
+        inputs[self._relative(template_path)] = self.cache.digest(template_path)
+        arch_digest = hashlib.sha1(
+            json.dumps([inputs[self._relative(template_path)], section_digests]).encode("utf-8")
+        ).hexdigest()
+
+        rebuilt: List[str] = []
+        stats: Dict[str, Dict[str, Any]] = {}
+        arch = self.cache.section("arch", arch_digest)
+        reused = arch is not None
+        if arch is None:
+            contents, rebuilt, stats = self._section_contents(sections, section_digests)
+            started = time.perf_counter()
+            arch = compile_template(template_path.read_text(encoding="utf-8").strip()).render(
+                {placeholder: self._for_cdata(content) for placeholder, content in contents.items()}
+            )
+            self.cache.store_section("arch", arch_digest, arch)
+            stats["render"] = self._section_stat(arch, started, cached=False)
+        self.cache.save()
+        self.minifier.save()
+
+        return ArchBuild(
+            arch=arch,
+            digest=hashlib.sha1(arch.encode("utf-8")).hexdigest(),
+            reused=reused,
+            rebuilt_sections=tuple(rebuilt),
+            inputs=inputs,
+            sections=section_digests,
+            section_stats=stats,
         )
 
-        components_map = self._collect_components_map()
-        i18n_catalog = self._read_i18n_catalog()
+    def build_bundles(self) -> Dict[str, AssetBundle]:
+        """CSS/JS bundles served as attachments by the `attachment` deployment mode."""
+        sections, _inputs, section_digests = self._section_digests()
+        contents, _rebuilt, _stats = self._section_contents(sections, section_digests)
+        self.cache.save()
+        self.minifier.save()
+        return {
+            name: AssetBundle(
+                name=name,
+                mimetype=mimetype,
+                placeholder=placeholder,
+                content="\n;\n".join(contents[key] for key in keys if contents[key]),
+            )
+            for name, (mimetype, placeholder, keys) in ATTACHMENT_BUNDLES.items()
+        }
 
-        config_js = config_js_template.replace(
-            "__ODOO_BOOTSTRAP_I18N_CATALOG__", json.dumps(i18n_catalog, ensure_ascii=False)
+    def build_attachment_arch(self, urls: Dict[str, str]) -> str:
+        template = self._read_asset(self.config.attachment_template_path)
+        return compile_template(template).render(
+            {ATTACHMENT_BUNDLES[name][1]: escape(url, {"\"": "&quot;"}) for name, url in urls.items()}
         )
-        js_runtime = js_template.replace(
-            "__ODOO_BOOTSTRAP_COMPONENTS_MAP__", json.dumps(components_map, ensure_ascii=False)
+
+    def minification_report(self) -> Dict[str, Any]:
+        """Raw vs. minified bytes of the CSS/JS inputs of each section."""
+        bundles: Dict[str, Dict[str, Any]] = {}
+        raw_total: List[str] = []
+        minified_total: List[str] = []
+        for placeholder, (paths, _render) in self._sections().items():
+            raw_parts: List[str] = []
+            minified_parts: List[str] = []
+            for path in paths:
+                kind = source_kind(path)
+                if not kind:
+                    continue
+                raw_parts.append(path.read_text(encoding="utf-8").strip())
+                minified_parts.append(self.minifier.minify_file(kind, path, self.cache.digest(path)))
+            if raw_parts:
+                bundles[placeholder] = size_report("\n\n".join(raw_parts), "\n\n".join(minified_parts))
+                raw_total.extend(raw_parts)
+                minified_total.extend(minified_parts)
+        self.cache.save()
+        self.minifier.save()
+        return {
+            "enabled": self.config.minify_bundles,
+            "bundles": bundles,
+            "total": size_report("\n\n".join(raw_total), "\n\n".join(minified_total)),
+        }
+
+    def _section_digests(
+        self,
+    ) -> Tuple[Dict[str, Tuple[List[Path], Callable[[], str]]], Dict[str, str], Dict[str, str]]:
+        sections = self._sections()
+        inputs: Dict[str, str] = {}
+        section_digests: Dict[str, str] = {}
+        salt = hashlib.sha1(f"{BUILD_FORMAT}|{MINIFIER_VERSION}|{self.config!r}".encode("utf-8")).hexdigest()
+        for placeholder, (paths, _render) in sections.items():
+            section_digests[placeholder] = self.cache.section_digest(placeholder, paths, salt)
+            inputs.update({self._relative(path): self.cache.digest(path) for path in paths})
+        return sections, inputs, section_digests
+
+    def _section_contents(
+        self,
+        sections: Dict[str, Tuple[List[Path], Callable[[], str]]],
+        section_digests: Dict[str, str],
+    ) -> Tuple[Dict[str, str], List[str], Dict[str, Dict[str, Any]]]:
+        contents: Dict[str, str] = {}
+        rebuilt: List[str] = []
+        stats: Dict[str, Dict[str, Any]] = {}
+        for placeholder, (_paths, render) in sections.items():
+            started = time.perf_counter()
+            content = self.cache.section(placeholder, section_digests[placeholder])
+            cached = content is not None
+            if content is None:
+                content = render()
+                self.cache.store_section(placeholder, section_digests[placeholder], content)
+                rebuilt.append(placeholder)
+            contents[placeholder] = content
+            stats[placeholder] = self._section_stat(content, started, cached)
+        return contents, rebuilt, stats
+
+    def _sections(self) -> Dict[str, Tuple[List[Path], Callable[[], str]]]:
+        """Placeholder -> (input files, renderer), in template substitution order."""
+        config = self.config
+
+        def single(relative_path: Optional[Path]) -> Tuple[List[Path], Callable[[], str]]:
+            if not relative_path:
+                return [], lambda: ""
+            return [self._asset_path(relative_path)], lambda: self._read_source(relative_path)
+
+        return {
+            "__ODOO_SHELL_CONFIG_JS__": (
+                [self._asset_path(config.config_js_path), self._asset_path(config.i18n_yaml_path)],
+                self._build_config_js,
+            ),
+            "__ODOO_SHELL_I18N_JS__": single(config.i18n_js_path),
+            "__ODOO_SHELL_API_JS__": single(config.api_js_path),
+            "__ODOO_SHELL_STATE_JS__": single(config.state_js_path),
+            "__ODOO_SHELL_DEMO_JS__": (
+                [self._asset_path(path) for path in config.demo_js_parts],
+                lambda: self._build_js_bundle(config.demo_js_parts),
+            ),
+            "__ODOO_SHELL_DOM_JS__": single(config.dom_js_path),
+            "__ODOO_SHELL_MARKUP_JS__": single(config.markup_js_path),
+            "__ODOO_SHELL_COMPONENTS_JS__": single(config.components_js_path),
+            "__ODOO_SHELL_METRICS_JS__": single(config.metrics_js_path),
+            "__ODOO_SHELL_UNOCSS_RUNTIME_JS__": single(config.unocss_runtime_js_path),
+            "__ODOO_SHELL_CSS__": (
+                [self._asset_path(path) for path in config.css_parts],
+                self._build_css_bundle,
+            ),
+            "__ODOO_SHELL_JS__": (
+                [self._asset_path(config.runtime_js_path), *self._component_files()],
+                self._build_runtime_js,
+            ),
+        }
+
+    @staticmethod
+    def _section_stat(content: str, started: float, cached: bool) -> Dict[str, Any]:
+        return {
+            "bytes": len(content.encode("utf-8")),
+            "seconds": round(time.perf_counter() - started, 6),
+            "cached": cached,
+        }
+
+    def _build_config_js(self) -> str:
+        return compile_template(self._read_source(self.config.config_js_path)).render(
+            {"__ODOO_BOOTSTRAP_I18N_CATALOG__": json.dumps(self._read_i18n_catalog(), ensure_ascii=False)}
         )
 
-        return (
-            xml_template
-            .replace("__ODOO_SHELL_CONFIG_JS__", self._for_cdata(config_js))
-            .replace("__ODOO_SHELL_I18N_JS__", self._for_cdata(i18n_js))
-            .replace("__ODOO_SHELL_API_JS__", self._for_cdata(api_js))
-            .replace("__ODOO_SHELL_STATE_JS__", self._for_cdata(state_js))
-            .replace("__ODOO_SHELL_DEMO_JS__", self._for_cdata(demo_js))
-            .replace("__ODOO_SHELL_DOM_JS__", self._for_cdata(dom_js))
-            .replace("__ODOO_SHELL_MARKUP_JS__", self._for_cdata(markup_js))
-            .replace("__ODOO_SHELL_COMPONENTS_JS__", self._for_cdata(components_js))
-            .replace("__ODOO_SHELL_METRICS_JS__", self._for_cdata(metrics_js))
-            .replace("__ODOO_SHELL_UNOCSS_RUNTIME_JS__", self._for_cdata(unocss_runtime_js))
-            .replace("__ODOO_SHELL_CSS__", self._for_cdata(css_bundle))
-            .replace("__ODOO_SHELL_JS__", self._for_cdata(js_runtime))
+    def _build_runtime_js(self) -> str:
+        return compile_template(self._read_source(self.config.runtime_js_path)).render(
+            {"__ODOO_BOOTSTRAP_COMPONENTS_MAP__": json.dumps(self._collect_components_payload()[0], ensure_ascii=False)}
         )
 
-    def _collect_components_map(self) -> Dict[str, str]:
-        components_map: Dict[str, str] = {}
+    def _component_files(self) -> List[Path]:
         components_dir = self.project_root / self.config.components_dir
         if not components_dir.exists():
-            return components_map
-        for file in sorted(components_dir.rglob("*.vue")):
-            source = file.read_text(encoding="utf-8").strip()
-            relative_key = file.relative_to(components_dir).as_posix()
-            basename = file.name
-            components_map[relative_key] = source
-            components_map[basename] = source
-            components_map[f"./{basename}"] = source
-        return components_map
+            return []
+        return sorted(components_dir.rglob("*.vue"))
+
+    def components_report(self) -> Dict[str, Any]:
+        return self._collect_components_payload()[1]
+
+    def _collect_components_payload(self) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Any]]:
+        return build_components_payload(
+            self.project_root / self.config.components_dir,
+            self._component_files(),
+            minify=self.config.minify_components,
+        )
 
     def _build_css_bundle(self) -> str:
-        return "\n\n".join(self._read_asset(path) for path in self.config.css_parts)
+        return "\n\n".join(self._read_source(path) for path in self.config.css_parts)
 
     def _build_js_bundle(self, relative_paths) -> str:
-        return "\n\n".join(self._read_asset(path) for path in relative_paths)
+        return "\n\n".join(self._read_source(path) for path in relative_paths)
 
-    def _read_asset(self, relative_path: Path) -> str:
+    def _asset_path(self, relative_path: Path) -> Path:
         path = self.project_root / relative_path
         if not path.exists():
             raise RuntimeError(f"Required asset not found: {path}")
-        return path.read_text(encoding="utf-8").strip()
+        return path
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _read_asset(self, relative_path: Path) -> str:
+        return self._asset_path(relative_path).read_text(encoding="utf-8").strip()
+
+    def _read_source(self, relative_path: Path) -> str:
+        """Read a CSS/JS input, minified when `minify_bundles` is enabled."""
+        path = self._asset_path(relative_path)
+        kind = source_kind(path)
+        if not self.config.minify_bundles or not kind:
+            return path.read_text(encoding="utf-8").strip()
+        return self.minifier.minify_file(kind, path, self.cache.digest(path))
 
     def _read_i18n_catalog(self) -> Dict[str, Any]:
-        loader = YamlCatalogLoader(self.project_root / self.config.i18n_yaml_path)
+        loader = YamlCatalogLoader(
+            self.project_root / self.config.i18n_yaml_path,
+            cache_dir=self.project_root / YAML_CACHE_DIR,
+        )
         return loader.load()
 
     @staticmethod
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+APP_UI_BUILD_DIR = Path(".cache/app_ui")
+
+
+class BuildCache:
+    """Input digests and built sections of the app UI arch, persisted as JSON.
+
+    File digests are reused while size and mtime are unchanged. A section is
+    reused when the digest of all its inputs matches the stored one.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._sections: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+        self._load()
+
+    def digest(self, path: Path) -> str:
+        stat = path.stat()
+        key = path.as_posix()
+        entry = self._files.get(key)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return str(entry["sha1"])
+        checksum = hashlib.sha1(path.read_bytes()).hexdigest()
+        self._files[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": checksum}
+        self._dirty = True
+        return checksum
+
+    def section_digest(self, name: str, paths: Iterable[Path], salt: str = "") -> str:
+        digest = hashlib.sha1(f"{name}\0{salt}".encode("utf-8"))
+        for path in paths:
+            digest.update(f"\0{path.as_posix()}\0{self.digest(path)}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def section(self, name: str, digest: str) -> Optional[str]:
+        entry = self._sections.get(name)
+        if entry and entry.get("digest") == digest:
+            return entry["content"]
+        return None
+
+    def store_section(self, name: str, digest: str, content: str) -> None:
+        self._sections[name] = {"digest": digest, "content": content}
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"files": self._files, "sections": self._sections}
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        files = payload.get("files")
+        sections = payload.get("sections")
+        self._files = files if isinstance(files, dict) else {}
+        self._sections = sections if isinstance(sections, dict) else {}
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Tuple
+
+TEMPLATE_BLOCK = re.compile(r"^<template>\n(?P<body>.*?)\n</template>", re.DOTALL)
+HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+WHITESPACE_SENSITIVE = re.compile(r"<(pre|textarea)\b", re.IGNORECASE)
+
+
+def build_components_payload(
+    components_dir: Path,
+    files: Iterable[Path],
+    minify: bool = False,
+) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Any]]:
+    """Return `{"sources", "aliases"}` with each SFC stored once, plus a size report.
+
+    Sources are keyed by path relative to `components_dir`. Lookups resolve
+    exactly as the old flat map did: each relative key, `name.vue` and
+    `./name.vue` belongs to the last file that wrote it, in `files` order.
+    Any key whose owner is not the source stored under that same key gets an
+    alias, and aliases take precedence over sources when resolving.
+    """
+    sources: Dict[str, str] = {}
+    owners: Dict[str, str] = {}
+    raw_bytes = 0
+    for file in files:
+        source = file.read_text(encoding="utf-8").strip()
+        raw_bytes += len(source.encode("utf-8"))
+        relative_key = file.relative_to(components_dir).as_posix()
+        sources[relative_key] = minify_component(source) if minify else source
+        owners[relative_key] = relative_key
+        owners[file.name] = relative_key
+        owners[f"./{file.name}"] = relative_key
+    aliases = {key: owner for key, owner in owners.items() if key != owner}
+
+    payload = {"sources": sources, "aliases": aliases}
+    legacy_map = {key: sources[owner] for key, owner in owners.items()}
+    report = {
+        "components": len(sources),
+        "aliases": len(aliases),
+        "minified": minify,
+        "source_bytes": raw_bytes,
+        "payload_bytes": _json_size(payload),
+        "legacy_payload_bytes": _json_size(legacy_map),
+    }
+    return payload, report
+
+
+def minify_component(source: str) -> str:
+    """Strip comments, indentation and blank lines from the `<template>` block.
+
+    Templates containing `<pre>`/`<textarea>` and the script/style blocks are
+    left untouched.
+    """
+    match = TEMPLATE_BLOCK.match(source)
+    if not match or WHITESPACE_SENSITIVE.search(match.group("body")):
+        return source
+    body = HTML_COMMENT.sub("", match.group("body"))
+    lines = [line.strip() for line in body.splitlines()]
+    compact = "\n".join(line for line in lines if line)
+    return f"<template>\n{compact}\n</template>{source[match.end():]}"
+
+
+def _json_size(payload: Any) -> int:
+    return len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
@@ -16,8 +16,15 @@ class ThemeConfig:
 
     enabled_param: str = "app_ui_bridge.enabled"
     version_param: str = "app_ui_bridge.version"
+    build_digest_param: str = "app_ui_bridge.build_digest"
+
+    # "inline" embeds every bundle in arch_db; "attachment" uploads content-hashed
+    # CSS/JS attachments and keeps only <link>/<script defer> tags in arch_db.
+    deployment_mode: str = "inline"
+    attachment_prefix: str = "[AppUI]"
 
     xml_template_path: Path = Path("data/app_ui_unocss/assets_backend.xml")
+    attachment_template_path: Path = Path("data/app_ui_unocss/assets_backend_attachments.xml")
     core_css_path: Path = Path("data/app_ui_unocss/css/00_core.css")
     dashboard_css_path: Path = Path("data/app_ui_unocss/css/10_dashboard.css")
     components_css_path: Path = Path("data/app_ui_unocss/css/20_shell_layout.css")
@@ -36,6 +43,8 @@ class ThemeConfig:
     components_dir: Path = Path("data/app_ui_unocss/components")
     i18n_yaml_path: Path = Path("data/app_ui_unocss/i18n/messages.yml")
     unocss_runtime_js_path: Optional[Path] = Path("data/app_ui_unocss/js/unocss_runtime.js")
+    minify_components: bool = False
+    minify_bundles: bool = False
 
     css_bundle_paths: Tuple[Path, ...] = (
         Path("data/app_ui_unocss/css/00_core.css"),
@@ -89,15 +98,22 @@ class ThemeConfig:
 
     @property
     def parameter_keys(self) -> Tuple[str, ...]:
-        return (self.enabled_param, self.version_param)
+        return (self.enabled_param, self.version_param, self.build_digest_param)
 
     @property
     def candidate_view_keys(self) -> Tuple[str, ...]:
         return (self.view_key,)
 
 
-def build_theme_config(variant: str = "unocss") -> ThemeConfig:
+def build_theme_config(
+    variant: str = "unocss",
+    deployment_mode: str = "inline",
+    minify: bool = False,
+) -> ThemeConfig:
     normalized = (variant or "unocss").strip().lower()
     if normalized != "unocss":
         raise ValueError(f"Unsupported app UI variant: {variant}")
-    return ThemeConfig()
+    mode = (deployment_mode or "inline").strip().lower()
+    if mode not in {"inline", "attachment"}:
+        raise ValueError(f"Unsupported app UI deployment mode: {deployment_mode}")
+    return ThemeConfig(deployment_mode=mode, minify_components=minify, minify_bundles=minify)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from odoo_bridge.app_ui.asset_builder import AssetBuilder
+from odoo_bridge.app_ui.asset_builder import AssetBuilder, AssetBundle
 from odoo_bridge.app_ui.config import ThemeConfig, build_theme_config
+from odoo_bridge.async_client import AsyncOdooClient
+from odoo_bridge.config_params import ConfigParamSync
+from odoo_bridge.model_metadata import METADATA_CACHE_DIR, shared_metadata_cache
 from odoo_bridge.odoo_client import OdooClient
 
 
@@ -13,24 +19,61 @@ class ThemeManager:
         self.client = client
         self.project_root = project_root
         self.config = config or build_theme_config()
+        self.params = ConfigParamSync(client)
         self.assets = AssetBuilder(project_root=project_root, config=self.config)
+        self.metadata = shared_metadata_cache(client, cache_dir=project_root / METADATA_CACHE_DIR)
 
     def apply(self) -> Dict[str, Any]:
         webclient_bootstrap_id = self._webclient_bootstrap_view_id()
-        view_id = self._upsert_assets_view(
-            base_view_id=webclient_bootstrap_id,
-            arch_db=self.assets.build_arch_db(),
-        )
-        self._upsert_param(self.config.enabled_param, "1")
-        self._upsert_param(self.config.version_param, self.config.version)
+        if self.config.deployment_mode == "attachment":
+            arch_db, build_report = self._build_attachment_arch()
+        else:
+            build = self.assets.build()
+            arch_db = build.arch
+            build_report = {
+                "reused": build.reused,
+                "rebuilt_sections": list(build.rebuilt_sections),
+                "sections": build.section_stats,
+            }
+        digest = hashlib.sha1(arch_db.encode("utf-8")).hexdigest()
+        desired_params = {
+            self.config.enabled_param: "1",
+            self.config.version_param: self.config.version,
+            self.config.build_digest_param: digest,
+        }
+        param_diff = ConfigParamSync.diff(desired_params, self.params.read(desired_params.keys()))
+        current = self._current_view()
+        view_written = not self._is_deployed(current, webclient_bootstrap_id, param_diff)
+        if view_written:
+            view_id = self._upsert_assets_view(
+                base_view_id=webclient_bootstrap_id,
+                arch_db=arch_db,
+                current=current,
+            )
+        else:
+            view_id = int(current["id"])  # type: ignore[index]
+        self.params.apply_diff(param_diff)
         return {
             "status": "ready",
             "view_id": view_id,
             "view_key": self.config.view_key,
             "version": self.config.version,
+            "deployment_mode": self.config.deployment_mode,
             "webclient_bootstrap_id": webclient_bootstrap_id,
+            "view_written": view_written,
+            "build": {
+                "output_digest": digest,
+                "bytes": len(arch_db.encode("utf-8")),
+                **build_report,
+            },
         }
 
+    def build_manifest(self) -> Dict[str, Any]:
+        manifest = self.assets.build().manifest()
+        manifest["components"] = self.assets.components_report()
+        manifest["minification"] = self.assets.minification_report()
+        return {"status": "ok", **manifest}
+
     def status(self) -> Dict[str, Any]:
         view = self._current_view()
         params = self.client.search_read(
@@ -41,6 +84,24 @@ class ThemeManager:
         )
         return {"status": "ok", "view": view, "params": params}
 
+    async def status_async(self, client: Optional[AsyncOdooClient] = None) -> Dict[str, Any]:
+        async_client = client or AsyncOdooClient(self.client)
+        view_rows, params = await asyncio.gather(
+            async_client.search_read(
+                "ir.ui.view",
+                [("key", "in", list(self.config.candidate_view_keys))],
+                fields=["id", "name", "key", "active", "inherit_id", "priority"],
+                limit=2,
+            ),
+            async_client.search_read(
+                "ir.config_parameter",
+                [("key", "in", list(self.config.parameter_keys))],
+                fields=["id", "key", "value"],
+                limit=20,
+            ),
+        )
+        return {"status": "ok", "view": self._pick_current_view(view_rows), "params": params}
+
     def rollback(self) -> Dict[str, Any]:
         view = self._current_view()
         deactivated = False
@@ -64,6 +125,53 @@ class ThemeManager:
             "deleted_params": len(param_ids),
         }
 
+    def _build_attachment_arch(self) -> Tuple[str, Dict[str, Any]]:
+        bundles = self.assets.build_bundles()
+        prefix = f"{self.config.attachment_prefix}:{self.config.variant}"
+        names = {f"{prefix}:{name}": bundle for name, bundle in bundles.items()}
+        rows = self.client.search_read(
+            "ir.attachment",
+            [("name", "in", sorted(names)), ("type", "=", "binary")],
+            fields=["id", "name", "checksum", "mimetype"],
+        )
+        existing: Dict[str, Dict[str, Any]] = {}
+        for row in sorted(rows, key=lambda item: int(item["id"])):
+            existing.setdefault(str(row["name"]), row)
+
+        urls: Dict[str, str] = {}
+        attachments: Dict[str, Dict[str, Any]] = {}
+        for name, bundle in names.items():
+            row = existing.get(name)
+            checksum = bundle.checksum
+            uploaded = not row or str(row.get("checksum") or "") != checksum
+            if uploaded:
+                attachment_id = self._upload_bundle(name, bundle, int(row["id"]) if row else None)
+            else:
+                attachment_id = int(row["id"])  # type: ignore[index]
+                if str(row.get("mimetype") or "") != bundle.mimetype:  # type: ignore[union-attr]
+                    self.client.write("ir.attachment", [attachment_id], {"mimetype": bundle.mimetype})
+            urls[bundle.name] = f"/web/content/{attachment_id}?download=false&unique={checksum}"
+            attachments[bundle.name] = {
+                "id": attachment_id,
+                "bytes": len(bundle.content.encode("utf-8")),
+                "uploaded": uploaded,
+            }
+        return self.assets.build_attachment_arch(urls), {"attachments": attachments}
+
+    def _upload_bundle(self, name: str, bundle: AssetBundle, attachment_id: Optional[int]) -> int:
+        values: Dict[str, Any] = {
+            "name": name,
+            "type": "binary",
+            "datas": base64.b64encode(bundle.content.encode("utf-8")).decode("ascii"),
+            "mimetype": bundle.mimetype,
+        }
+        if self.metadata.field_exists("ir.attachment", "public"):
+            values["public"] = True
+        if attachment_id:
+            self.client.write("ir.attachment", [attachment_id], values)
+            return attachment_id
+        return self.client.create("ir.attachment", values)
+
     def _webclient_bootstrap_view_id(self) -> int:
         rows = self.client.search_read(
             "ir.ui.view",
@@ -82,6 +190,9 @@ class ThemeManager:
             fields=["id", "name", "key", "active", "inherit_id", "priority"],
             limit=2,
         )
+        return self._pick_current_view(rows)
+
+    def _pick_current_view(self, rows: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         if not rows:
             return None
         for row in rows:
@@ -89,8 +200,29 @@ class ThemeManager:
                 return row
         return rows[0]
 
-    def _upsert_assets_view(self, base_view_id: int, arch_db: str) -> int:
-        current = self._current_view()
+    def _is_deployed(
+        self,
+        current: Optional[Dict[str, Any]],
+        base_view_id: int,
+        param_diff: Dict[str, Any],
+    ) -> bool:
+        if not current or not current.get("id") or not current.get("active"):
+            return False
+        if current.get("key") != self.config.view_key:
+            return False
+        inherit_id = current.get("inherit_id")
+        if isinstance(inherit_id, (list, tuple)):
+            inherit_id = inherit_id[0] if inherit_id else None
+        if inherit_id != base_view_id or current.get("priority") != 95:
+            return False
+        return self.config.build_digest_param in param_diff["report"]["unchanged"]
+
+    def _upsert_assets_view(
+        self,
+        base_view_id: int,
+        arch_db: str,
+        current: Optional[Dict[str, Any]],
+    ) -> int:
         values = {
             "name": self.config.view_name,
             "type": "qweb",
@@ -106,17 +238,3 @@ class ThemeManager:
             self.client.write("ir.ui.view", [view_id], values)
             return view_id
         return self.client.create("ir.ui.view", values)
-
-    def _upsert_param(self, key: str, value: str) -> None:
-        rows = self.client.search_read(
-            "ir.config_parameter",
-            [("key", "=", key)],
-            fields=["id", "value"],
-            limit=1,
-        )
-        if rows:
-            row_id = int(rows[0]["id"])
-            if str(rows[0].get("value") or "") != value:
-                self.client.write("ir.config_parameter", [row_id], {"value": value})
-            return
-        self.client.create("ir.config_parameter", {"key": key, "value": value})
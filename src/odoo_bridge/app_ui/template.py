@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import List, Mapping, Tuple
+
+# Names are single-underscore separated, so a placeholder followed by more
+# underscores or by another placeholder (`__ODOO_A____ODOO_B__`) still ends
+# at its own closing `__`.
+PLACEHOLDER_PATTERN = re.compile(r"__ODOO_[A-Z0-9]+(?:_[A-Z0-9]+)*__")
+
+
+class PlaceholderTemplate:
+    """Template split once into literal segments and `__ODOO_*__` placeholders.
+
+    Rendering joins segments and substituted values in a single pass, so
+    injected payloads are never rescanned for placeholders. Placeholders
+    without a value are kept verbatim.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        literals: List[str] = []
+        placeholders: List[str] = []
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            literals.append(source[position:match.start()])
+            placeholders.append(match.group(0))
+            position = match.end()
+        literals.append(source[position:])
+        self.literals: Tuple[str, ...] = tuple(literals)
+        self.placeholders: Tuple[str, ...] = tuple(placeholders)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        parts: List[str] = [self.literals[0]]
+        for placeholder, literal in zip(self.placeholders, self.literals[1:]):
+            parts.append(values.get(placeholder, placeholder))
+            parts.append(literal)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=32)
+def compile_template(source: str) -> PlaceholderTemplate:
+    return PlaceholderTemplate(source)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 from pathlib import Path
 
 from odoo_bridge.app_ui.config import build_theme_config
 from odoo_bridge.app_ui.manager import ThemeManager
 from odoo_bridge.cli_common import build_client
+from odoo_bridge.yaml_catalog import catalog_cache_stats
 
 
 def main() -> int:
@@ -14,25 +16,38 @@ def main() -> int:
     parser.add_argument("--project-root", default=str(Path(__file__).resolve().parents[2]))
     parser.add_argument("--allow-host", default="jesus-chavez-galaviz.odoo.com")
     parser.add_argument("--allow-any-host", action="store_true")
+    parser.add_argument(
+        "--deployment-mode",
+        choices=("inline", "attachment"),
+        default="inline",
+        help="inline: embed bundles in arch_db; attachment: serve cacheable CSS/JS attachments",
+    )
+    parser.add_argument("--minify", action="store_true", help="Minify CSS/JS bundles and component templates")
     mode = parser.add_mutually_exclusive_group()
     mode.add_argument("--status", action="store_true", help="Read app UI theme status")
     mode.add_argument("--rollback", action="store_true", help="Disable app UI theme")
+    mode.add_argument("--manifest", action="store_true", help="Print build digests and payload size report")
     args = parser.parse_args()
 
     client = build_client(args.allow_host, args.allow_any_host)
     manager = ThemeManager(
         client,
         project_root=Path(args.project_root),
-        config=build_theme_config(),
+        config=build_theme_config(deployment_mode=args.deployment_mode, minify=args.minify),
     )
 
     if args.status:
-        result = manager.status()
+        result = asyncio.run(manager.status_async())
     elif args.rollback:
         result = manager.rollback()
+    elif args.manifest:
+        result = manager.build_manifest()
     else:
         result = manager.apply()
 
+    result["transport"] = client.transport_stats()
+    result["catalog_cache"] = catalog_cache_stats()
+    client.close()
     print(json.dumps(result, indent=2, ensure_ascii=False))
     return 0 if result.get("status") in {"ready", "ok", "rolled_back"} else 1
 
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import xmlrpc.client
+from typing import Any, Dict, List, Optional
+
+from odoo_bridge.http_transport import TransportConfig
+from odoo_bridge.odoo_client import (
+    INITIAL_BACKOFF_SECONDS,
+    RETRY_ATTEMPTS,
+    OdooClient,
+    OdooCredentials,
+    is_retryable_error,
+)
+
+
+class AsyncOdooClient:
+    """asyncio facade over OdooClient for independent reads.
+
+    Calls run in worker threads on the wrapped client's pooled transport, so the
+    default concurrency limit matches the pool size and every in-flight call has
+    a keep-alive connection. 429/503 responses back off with `asyncio.sleep`
+    using the same schedule as `OdooClient._exec`.
+    """
+
+    def __init__(self, client: OdooClient, max_concurrency: Optional[int] = None):
+        self.client = client
+        limit = max_concurrency or client.transport.config.pool_size
+        self.max_concurrency = max(1, int(limit))
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._connect_lock = asyncio.Lock()
+
+    @classmethod
+    def from_credentials(
+        cls,
+        creds: OdooCredentials,
+        transport_config: Optional[TransportConfig] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> "AsyncOdooClient":
+        return cls(OdooClient(creds, transport_config=transport_config), max_concurrency=max_concurrency)
+
+    @property
+    def creds(self) -> OdooCredentials:
+        return self.client.creds
+
+    async def connect(self) -> int:
+        async with self._connect_lock:
+            if self.client.uid:
+                return self.client.uid
+            return await asyncio.to_thread(self.client.connect)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.client.close)
+
+    async def _exec(self, model: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        if not self.client.uid:
+            await self.connect()
+        backoff_seconds = INITIAL_BACKOFF_SECONDS
+        last_error: Optional[Exception] = None
+        for _attempt in range(RETRY_ATTEMPTS):
+            try:
+                async with self._semaphore:
+                    return await asyncio.to_thread(self.client._exec_once, model, method, list(args), kwargs)
+            except xmlrpc.client.ProtocolError as exc:
+                last_error = exc
+                if not is_retryable_error(exc):
+                    raise
+                await asyncio.sleep(backoff_seconds)
+                backoff_seconds *= 2.0
+        if last_error:
+            raise last_error
+        raise RuntimeError("Unexpected XML-RPC execution failure")
+
+    async def search_read(
+        self,
+        model: str,
+        domain: List[Any],
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {}
+        if fields is not None:
+            params["fields"] = fields
+        if limit is not None:
+            params["limit"] = limit
+        if order is not None:
+            params["order"] = order
+        if context is not None:
+            params["context"] = context
+        return await self._exec(model, "search_read", domain, **params)
+
+    async def search(
+        self,
+        model: str,
+        domain: List[Any],
+        limit: Optional[int] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[int]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if context is not None:
+            params["context"] = context
+        return await self._exec(model, "search", domain, **params)
+
+    async def create(self, model: str, values: Dict[str, Any]) -> int:
+        return int(await self._exec(model, "create", values))
+
+    async def write(self, model: str, ids: List[int], values: Dict[str, Any]) -> bool:
+        return bool(await self._exec(model, "write", ids, values))
+
+    async def execute(self, model: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._exec(model, method, *args, **kwargs)
+
+    def transport_stats(self) -> Dict[str, Any]:
+        return self.client.transport_stats()
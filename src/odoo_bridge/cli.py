@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 from pathlib import Path
 
@@ -22,12 +23,14 @@ def main() -> int:
     manager = InvoiceApiBridgeManager(client, project_root=Path(args.project_root))
 
     if args.status:
-        result = manager.status()
+        result = asyncio.run(manager.status_async())
     elif args.rollback:
         result = manager.rollback()
     else:
         result = manager.run()
 
+    result["transport"] = client.transport_stats()
+    client.close()
     print(json.dumps(result, indent=2, ensure_ascii=False))
     return 0 if result.get("status") in {"ready", "ok", "rolled_back"} else 1
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from urllib.parse import urlparse
 
+from odoo_bridge.http_transport import TransportConfig
 from odoo_bridge.odoo_client import OdooClient, OdooCredentials
 
 
@@ -13,6 +14,25 @@ def required_env(name: str) -> str:
     return value
 
 
+def optional_env_number(name: str, default: float) -> float:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid numeric env var: {name}={value}") from exc
+
+
+def build_transport_config() -> TransportConfig:
+    defaults = TransportConfig()
+    return TransportConfig(
+        pool_size=int(optional_env_number("ODOO_POOL_SIZE", defaults.pool_size)),
+        idle_timeout=optional_env_number("ODOO_POOL_IDLE_TIMEOUT", defaults.idle_timeout),
+        timeout=optional_env_number("ODOO_TIMEOUT", defaults.timeout),
+    )
+
+
 def build_client(allow_host: str, allow_any_host: bool) -> OdooClient:
     creds = OdooCredentials(
         url=required_env("ODOO_URL"),
@@ -27,6 +47,6 @@ def build_client(allow_host: str, allow_any_host: bool) -> OdooClient:
             f"Blocked target host '{host}'. Expected '{expected_host}'. "
             "Use --allow-any-host only when intentional."
         )
-    client = OdooClient(creds)
+    client = OdooClient(creds, transport_config=build_transport_config())
     client.connect()
     return client
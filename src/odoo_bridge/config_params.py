@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping
+
+
+class ConfigParamSync:
+    """Bring ir.config_parameter keys to a desired state with minimal RPCs.
+
+    One `search_read` fetches every target key, new keys are created with one
+    multi-record `create`, and changed keys are written grouped by value.
+    """
+
+    model = "ir.config_parameter"
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    def sync(self, values: Mapping[str, str]) -> Dict[str, List[str]]:
+        desired = {str(key): str(value) for key, value in values.items()}
+        if not desired:
+            return {"created": [], "updated": [], "unchanged": []}
+        diff = self.diff(desired, self.read(desired.keys()))
+        self.apply_diff(diff)
+        return diff["report"]
+
+    def upsert(self, key: str, value: str) -> Dict[str, List[str]]:
+        return self.sync({key: value})
+
+    def read(self, keys: Iterable[str]) -> List[Dict[str, Any]]:
+        return self.client.search_read(
+            self.model,
+            [("key", "in", list(keys))],
+            fields=["id", "key", "value"],
+        )
+
+    @staticmethod
+    def diff(desired: Mapping[str, str], rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Compare desired values with already-read rows without touching the server."""
+        report: Dict[str, List[str]] = {"created": [], "updated": [], "unchanged": []}
+        current: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            current.setdefault(str(row.get("key") or ""), row)
+
+        to_create: List[Dict[str, str]] = []
+        ids_by_value: Dict[str, List[int]] = {}
+        for key, value in desired.items():
+            row = current.get(key)
+            if row is None:
+                to_create.append({"key": key, "value": value})
+                report["created"].append(key)
+            elif str(row.get("value") or "") != value:
+                ids_by_value.setdefault(value, []).append(int(row["id"]))
+                report["updated"].append(key)
+            else:
+                report["unchanged"].append(key)
+        return {"create": to_create, "write": ids_by_value, "report": report}
+
+    @staticmethod
+    def rpc_count(diff: Mapping[str, Any]) -> int:
+        return (1 if diff["create"] else 0) + len(diff["write"])
+
+    def apply_diff(self, diff: Mapping[str, Any]) -> None:
+        if diff["create"]:
+            self.client.create_many(self.model, diff["create"])
+        for value, ids in diff["write"].items():
+            self.client.write(self.model, ids, {"value": value})
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import http.client
+import itertools
+import threading
+import time
+import xmlrpc.client
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+_BROKEN_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.ResponseNotReady,
+    BrokenPipeError,
+    ConnectionAbortedError,
+    ConnectionResetError,
+)
+
+
+@dataclass(slots=True)
+class TransportConfig:
+    pool_size: int = 4
+    idle_timeout: float = 60.0
+    timeout: float = 120.0
+    reconnect_attempts: int = 1
+
+
+@dataclass(slots=True)
+class _PooledConnection:
+    id: int
+    conn: http.client.HTTPConnection
+    created_at: float
+    last_used: float
+    requests: int = 0
+    extra_headers: List[tuple[str, str]] = field(default_factory=list)
+
+
+class PooledTransport(xmlrpc.client.Transport):
+    """XML-RPC transport keeping a bounded pool of keep-alive HTTP/1.1 connections.
+
+    One instance is meant to be shared by every ServerProxy of a client so the
+    `common` and `object` endpoints reuse the same TLS sessions.
+    """
+
+    def __init__(self, use_https: bool, config: Optional[TransportConfig] = None):
+        super().__init__()
+        self.use_https = use_https
+        self.config = config or TransportConfig()
+        self._idle: List[_PooledConnection] = []
+        self._active: Dict[int, _PooledConnection] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._counters = {"requests": 0, "reused": 0, "opened": 0, "reconnects": 0, "expired": 0}
+        # closed connections are folded into totals so long-running processes stay bounded
+        self._retired = {"connections": 0, "requests": 0, "reuses": 0}
+
+    def request(self, host, handler, request_body, verbose=False):
+        self.verbose = verbose
+        attempts = max(0, int(self.config.reconnect_attempts)) + 1
+        for attempt in range(attempts):
+            pooled = self._acquire(host)
+            try:
+                result, reusable = self._single_request(pooled, host, handler, request_body)
+            except xmlrpc.client.Fault:
+                self._release(pooled)
+                raise
+            except _BROKEN_CONNECTION_ERRORS:
+                self._discard(pooled)
+                if attempt + 1 >= attempts:
+                    raise
+                with self._lock:
+                    self._counters["reconnects"] += 1
+                continue
+            except Exception:
+                self._discard(pooled)
+                raise
+            if reusable:
+                self._release(pooled)
+            else:
+                self._discard(pooled)
+            return result
+        raise RuntimeError("Unexpected XML-RPC transport failure")
+
+    def close(self) -> None:
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for pooled in idle:
+            self._retire(pooled)
+        super().close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            live = [*self._idle, *self._active.values()]
+            connections = [
+                {"id": item.id, "requests": item.requests, "reuses": max(0, item.requests - 1), "open": True}
+                for item in sorted(live, key=lambda item: item.id)
+            ]
+            return {
+                "pool_size": self.config.pool_size,
+                "idle_timeout": self.config.idle_timeout,
+                "requests": self._counters["requests"],
+                "connections_opened": self._counters["opened"],
+                "connections_reused": self._counters["reused"],
+                "reconnects": self._counters["reconnects"],
+                "expired": self._counters["expired"],
+                "connections": connections,
+                "retired": dict(self._retired),
+            }
+
+    def _single_request(self, pooled: _PooledConnection, host, handler, request_body) -> tuple[Any, bool]:
+        conn = pooled.conn
+        headers = [*self._headers, *pooled.extra_headers]
+        if self.accept_gzip_encoding:
+            conn.putrequest("POST", handler, skip_accept_encoding=True)
+            headers.append(("Accept-Encoding", "gzip"))
+        else:
+            conn.putrequest("POST", handler)
+        headers.append(("Content-Type", "text/xml"))
+        headers.append(("User-Agent", self.user_agent))
+        self.send_headers(conn, headers)
+        self.send_content(conn, request_body)
+
+        response = conn.getresponse()
+        pooled.requests += 1
+        if response.status == 200:
+            return self.parse_response(response), not response.will_close
+
+        if response.getheader("content-length", ""):
+            response.read()
+        raise xmlrpc.client.ProtocolError(
+            host + handler,
+            response.status,
+            response.reason,
+            dict(response.getheaders()),
+        )
+
+    def _acquire(self, host) -> _PooledConnection:
+        now = time.monotonic()
+        expired: List[_PooledConnection] = []
+        pooled: Optional[_PooledConnection] = None
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if now - candidate.last_used > self.config.idle_timeout:
+                    expired.append(candidate)
+                    continue
+                pooled = candidate
+                break
+            self._counters["expired"] += len(expired)
+            self._counters["requests"] += 1
+            if pooled is not None:
+                self._counters["reused"] += 1
+                self._active[pooled.id] = pooled
+        for item in expired:
+            self._retire(item)
+        if pooled is not None:
+            return pooled
+        return self._open(host)
+
+    def _open(self, host) -> _PooledConnection:
+        chost, extra_headers, x509 = self.get_host_info(host)
+        if self.use_https:
+            conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+                chost,
+                timeout=self.config.timeout,
+                **(x509 or {}),
+            )
+        else:
+            conn = http.client.HTTPConnection(chost, timeout=self.config.timeout)
+        now = time.monotonic()
+        pooled = _PooledConnection(
+            id=next(self._ids),
+            conn=conn,
+            created_at=now,
+            last_used=now,
+            extra_headers=list(extra_headers or []),
+        )
+        with self._lock:
+            self._counters["opened"] += 1
+            self._active[pooled.id] = pooled
+        return pooled
+
+    def _release(self, pooled: _PooledConnection) -> None:
+        pooled.last_used = time.monotonic()
+        with self._lock:
+            self._active.pop(pooled.id, None)
+            if len(self._idle) < max(1, int(self.config.pool_size)):
+                self._idle.append(pooled)
+                return
+        self._retire(pooled)
+
+    def _discard(self, pooled: _PooledConnection) -> None:
+        with self._lock:
+            self._active.pop(pooled.id, None)
+        self._retire(pooled)
+
+    def _retire(self, pooled: _PooledConnection) -> None:
+        try:
+            pooled.conn.close()
+        finally:
+            with self._lock:
+                self._retired["connections"] += 1
+                self._retired["requests"] += pooled.requests
+                self._retired["reuses"] += max(0, pooled.requests - 1)
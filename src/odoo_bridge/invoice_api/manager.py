@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import secrets
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from odoo_bridge.async_client import AsyncOdooClient
+from odoo_bridge.config_params import ConfigParamSync
 from odoo_bridge.invoice_api.config import InvoiceApiConfig
 from odoo_bridge.invoice_api.server_actions import (
     code_addenda_bridge,
@@ -15,6 +18,7 @@ from odoo_bridge.invoice_api.server_actions import (
     code_invoice_bridge,
     code_payment_bridge,
 )
+from odoo_bridge.model_metadata import METADATA_CACHE_DIR, shared_metadata_cache
 from odoo_bridge.odoo_client import OdooClient
 
 logger = logging.getLogger(__name__)
@@ -27,6 +31,8 @@ class InvoiceApiBridgeManager:
         self.client = client
         self.project_root = project_root
         self.config = config or InvoiceApiConfig()
+        self.params = ConfigParamSync(client)
+        self.metadata = shared_metadata_cache(client, cache_dir=project_root / METADATA_CACHE_DIR)
 
     def run(self) -> Dict[str, Any]:
         result: Dict[str, Any] = {
@@ -46,7 +52,7 @@ class InvoiceApiBridgeManager:
             result["token"]["created"] = created
             logger.info("Token ready (%s)", "created" if created else "existing")
 
-            self._upsert_param(self.config.complements_baseline_param, json.dumps(self.config.baseline_complements, ensure_ascii=True))
+            self.params.upsert(self.config.complements_baseline_param, json.dumps(self.config.baseline_complements, ensure_ascii=True))
 
             result["modules"]["l10n_mx_edi"] = self._ensure_module("l10n_mx_edi", required=True)
             for mod in self.config.optional_complement_modules:
@@ -56,11 +62,14 @@ class InvoiceApiBridgeManager:
 
             discovery = self._discover_complements()
             result["discovery"] = discovery
-            self._upsert_param(self.config.complements_discovery_param, json.dumps(discovery, ensure_ascii=True))
+            self.params.upsert(self.config.complements_discovery_param, json.dumps(discovery, ensure_ascii=True))
 
+            self.metadata.prefetch_models(
+                ["l10n_mx_edi.addenda", "sale.order", "account.move", "stock.picking"]
+            )
             addenda_sync = self._sync_known_addendas()
             result["addendas"] = addenda_sync
-            self._upsert_param(self.config.addendas_known_param, json.dumps(addenda_sync, ensure_ascii=True))
+            self.params.upsert(self.config.addendas_known_param, json.dumps(addenda_sync, ensure_ascii=True))
 
             sale_order_model = self._model_id("sale.order")
             move_model = self._model_id("account.move")
@@ -108,18 +117,38 @@ class InvoiceApiBridgeManager:
         return result
 
     def status(self) -> Dict[str, Any]:
-        actions = self.client.search_read(
-            "ir.actions.server",
-            [("name", "in", self.config.action_names)],
-            fields=["id", "name", "state", "model_id", "binding_model_id"],
-            limit=200,
-        )
-        params = self.client.search_read(
-            "ir.config_parameter",
-            [("key", "in", self.config.parameter_keys)],
-            fields=["id", "key", "value"],
-            limit=200,
+        rows = {
+            name: self.client.search_read(model, domain, **params)
+            for name, (model, domain, params) in self._status_reads().items()
+        }
+        return self._status_payload(rows)
+
+    async def status_async(self, client: Optional[AsyncOdooClient] = None) -> Dict[str, Any]:
+        async_client = client or AsyncOdooClient(self.client)
+        reads = self._status_reads()
+        results = await asyncio.gather(
+            *(async_client.search_read(model, domain, **params) for model, domain, params in reads.values())
         )
+        return self._status_payload(dict(zip(reads.keys(), results)))
+
+    def _status_reads(self) -> Dict[str, tuple[str, List[Any], Dict[str, Any]]]:
+        return {
+            "actions": (
+                "ir.actions.server",
+                [("name", "in", self.config.action_names)],
+                {"fields": ["id", "name", "state", "model_id", "binding_model_id"], "limit": 200},
+            ),
+            "params": (
+                "ir.config_parameter",
+                [("key", "in", self.config.parameter_keys)],
+                {"fields": ["id", "key", "value"], "limit": 200},
+            ),
+        }
+
+    @staticmethod
+    def _status_payload(rows: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        actions = rows["actions"]
+        params = rows["params"]
         return {
             "status": "ok",
             "action_count": len(actions),
@@ -182,22 +211,13 @@ class InvoiceApiBridgeManager:
         if legacy_row:
             legacy_token = str(legacy_row.get("value") or "").strip()
             if legacy_token:
-                self._upsert_param(self.config.token_param, legacy_token)
+                self.params.upsert(self.config.token_param, legacy_token)
                 return legacy_token, True
 
         token = secrets.token_urlsafe(32)
-        self._upsert_param(self.config.token_param, token)
+        self.params.upsert(self.config.token_param, token)
         return token, True
 
-    def _upsert_param(self, key: str, value: str) -> None:
-        rows = self.client.search_read("ir.config_parameter", [("key", "=", key)], fields=["id", "value"], limit=1)
-        if rows:
-            row_id = int(rows[0]["id"])
-            if str(rows[0].get("value") or "") != value:
-                self.client.write("ir.config_parameter", [row_id], {"value": value})
-            return
-        self.client.create("ir.config_parameter", {"key": key, "value": value})
-
     def _ensure_module(self, name: str, required: bool) -> str:
         rows = self.client.search_read("ir.module.module", [("name", "=", name)], fields=["id", "state"], limit=1)
         if not rows:
@@ -211,6 +231,7 @@ class InvoiceApiBridgeManager:
         if state in {"to install", "to upgrade"}:
             return state
         self.client.execute("ir.module.module", "button_immediate_install", [module_id])
+        self.metadata.refresh_fingerprint()
         return "installed"
 
     def _discover_complements(self) -> Dict[str, Any]:
@@ -312,11 +333,7 @@ class InvoiceApiBridgeManager:
         return seed
 
     def _model_id(self, model_name: str) -> Optional[int]:
-        rows = self.client.search_read("ir.model", [("model", "=", model_name)], fields=["id"], limit=1)
-        if not rows:
-            return None
-        model_id = rows[0].get("id")
-        return int(model_id) if isinstance(model_id, int) else None
+        return self.metadata.model_id(model_name)
 
     def _upsert_action(self, model_id: int, name: str, code: str) -> int:
         rows = self.client.search(
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+MINIFY_CACHE_DIR = Path(".cache/minify")
+# bump when minifier output changes so cached results are not reused
+MINIFIER_VERSION = 2
+
+CSS_TIGHT_CHARS = frozenset("{};,>")
+CSS_RULE_LIST_AT_RULES = ("@media", "@supports", "@layer", "@container", "@document", "@scope")
+JS_REGEX_PRECEDERS = frozenset("(,=:[!&|?{};+-*%<>~^")
+JS_AMBIGUOUS_SLASH_PRECEDERS = frozenset({")"})
+JS_REGEX_KEYWORDS = ("return", "typeof", "case", "do", "else", "in", "of", "void", "yield", "await", "delete")
+
+
+def minify_css(source: str) -> str:
+    """Drop comments and collapse whitespace; strings and `/*! */` comments are kept.
+
+    Whitespace around `{};,>` is removed, and around `:` inside declaration
+    blocks; in selectors a space before `:` (`a :hover`) is significant.
+    """
+    out: List[str] = []
+    pending_space = False
+    # one entry per open block: True when it holds declarations (not @media-style rule lists)
+    blocks: List[bool] = []
+    statement_start = 0
+    index = 0
+    length = len(source)
+    while index < length:
+        char = source[index]
+        if char == "/" and source.startswith("/*", index):
+            end = source.find("*/", index + 2)
+            end = length if end < 0 else end + 2
+            if source.startswith("/*!", index):
+                out.append(source[index:end])
+            index = end
+            continue
+        if char in "\"'":
+            end = _string_end(source, index)
+            if pending_space and out and out[-1][-1:] not in CSS_TIGHT_CHARS and out[-1] != ":":
+                out.append(" ")
+            pending_space = False
+            out.append(source[index:end])
+            index = end
+            continue
+        if char.isspace():
+            pending_space = True
+            index += 1
+            continue
+        if char in CSS_TIGHT_CHARS:
+            if char == "}" and out and out[-1] == ";":
+                out.pop()
+            if char == "{":
+                prelude = "".join(out[statement_start:]).strip()
+                blocks.append(not prelude.startswith(CSS_RULE_LIST_AT_RULES))
+            elif char == "}" and blocks:
+                blocks.pop()
+            out.append(char)
+            if char in "{};":
+                statement_start = len(out)
+        elif char == ":" and blocks and blocks[-1]:
+            out.append(char)
+        else:
+            if pending_space and out and out[-1][-1:] not in CSS_TIGHT_CHARS and out[-1] != ":":
+                out.append(" ")
+            out.append(char)
+        pending_space = False
+        index += 1
+    return "".join(out).strip()
+
+
+def minify_js(source: str) -> str:
+    """Conservative JS minification: drop comments, indentation and blank lines.
+
+    Strings, template literals and regex literals are copied verbatim and line
+    breaks are kept, so automatic semicolon insertion behaves as before. A `/`
+    after `)` can start a regex or a division, so the rest of that line is
+    copied unminified.
+    """
+    out: List[str] = []
+    index = 0
+    length = len(source)
+    last_token = ""
+    pending = ""
+    while index < length:
+        char = source[index]
+        if char in " \t\r\n\f\v":
+            if char == "\n":
+                pending = "\n"
+            elif not pending:
+                pending = " "
+            index += 1
+            continue
+        if char == "/" and source.startswith("//", index):
+            end = source.find("\n", index)
+            index = length if end < 0 else end
+            continue
+        if char == "/" and source.startswith("/*", index):
+            end = source.find("*/", index + 2)
+            end = length if end < 0 else end + 2
+            if "\n" in source[index:end]:
+                pending = "\n"
+            elif not pending:
+                pending = " "
+            index = end
+            continue
+
+        if pending and out:
+            out.append("\n" if pending == "\n" else " ")
+        pending = ""
+
+        if char == "/" and last_token in JS_AMBIGUOUS_SLASH_PRECEDERS:
+            # `) /x/` may be a regex or a division: keep the rest of the line as is
+            end = _verbatim_end(source, index)
+            out.append(source[index:end])
+            last_token = source[index:end].rstrip()[-1:] or last_token
+            index = end
+            continue
+        if char in "\"'":
+            end = _string_end(source, index)
+        elif char == "`":
+            end = _template_end(source, index)
+        elif char == "/" and _regex_allowed(last_token):
+            end = _regex_end(source, index)
+        elif char in "+-" and source.startswith(char * 2, index):
+            end = index + 2
+        else:
+            end = index + 1
+            if char.isalnum() or char in "_$":
+                while end < length and (source[end].isalnum() or source[end] in "_$"):
+                    end += 1
+        token = source[index:end]
+        out.append(token)
+        last_token = token
+        index = end
+    return "".join(out).strip()
+
+
+def minify_source(kind: str, source: str) -> str:
+    if kind == "css":
+        return minify_css(source)
+    if kind == "js":
+        return minify_js(source)
+    return source
+
+
+def source_kind(path: Path, mimetype: str = "") -> str:
+    suffix = path.suffix.lower()
+    if suffix == ".css" or mimetype == "text/css":
+        return "css"
+    if suffix in {".js", ".mjs"} or mimetype in {"text/javascript", "application/javascript"}:
+        return "js"
+    return ""
+
+
+def size_report(raw: str, minified: str) -> Dict[str, Any]:
+    raw_bytes = len(raw.encode("utf-8"))
+    minified_data = minified.encode("utf-8")
+    return {
+        "raw_bytes": raw_bytes,
+        "minified_bytes": len(minified_data),
+        "gzip_bytes": len(gzip.compress(minified_data, compresslevel=9, mtime=0)),
+        "saved_ratio": round(1 - len(minified_data) / raw_bytes, 4) if raw_bytes else 0.0,
+    }
+
+
+class MinifyCache:
+    """Minified output keyed by source content hash, persisted as JSON.
+
+    `minify_file` keys entries by the sha1 of the raw file (as already computed
+    by the callers' digest caches), so a cached file is not even read. The
+    least recently used entries are dropped beyond `max_entries`.
+    """
+
+    def __init__(self, path: Optional[Path], max_entries: int = 512):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: Dict[str, str] = {}
+        self._dirty = False
+        self.stats = {"hits": 0, "misses": 0}
+        self._load()
+
+    def minify(self, kind: str, source: str) -> str:
+        if not kind:
+            return source
+        digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        return self._lookup(f"{kind}:{MINIFIER_VERSION}:{digest}", lambda: minify_source(kind, source))
+
+    def minify_file(self, kind: str, path: Path, digest: str) -> str:
+        """Minified text of `path`; `digest` is the sha1 of its raw bytes."""
+        if not kind:
+            return path.read_text(encoding="utf-8")
+        return self._lookup(
+            f"{kind}:{MINIFIER_VERSION}:{digest}",
+            lambda: minify_source(kind, path.read_text(encoding="utf-8").strip()),
+        )
+
+    def _lookup(self, key: str, build: Callable[[], str]) -> str:
+        cached = self._entries.pop(key, None)
+        if cached is not None:
+            self._entries[key] = cached
+            self.stats["hits"] += 1
+            return cached
+        self.stats["misses"] += 1
+        minified = build()
+        self._entries[key] = minified
+        while len(self._entries) > self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._dirty = True
+        return minified
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._entries, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(payload, dict):
+            self._entries = {str(key): str(value) for key, value in payload.items()}
+
+
+def _string_end(source: str, start: int) -> int:
+    quote = source[start]
+    index = start + 1
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == quote or char == "\n":
+            return index + 1
+        index += 1
+    return len(source)
+
+
+def _template_end(source: str, start: int) -> int:
+    index = start + 1
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "`":
+            return index + 1
+        if char == "$" and source.startswith("${", index):
+            index = _expression_end(source, index + 2)
+            continue
+        index += 1
+    return len(source)
+
+
+def _expression_end(source: str, start: int) -> int:
+    depth = 1
+    index = start
+    while index < len(source):
+        char = source[index]
+        if char in "\"'":
+            index = _string_end(source, index)
+            continue
+        if char == "`":
+            index = _template_end(source, index)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return len(source)
+
+
+def _regex_end(source: str, start: int) -> int:
+    index = start + 1
+    in_class = False
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "\n":
+            return index
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            index += 1
+            while index < len(source) and (source[index].isalnum() or source[index] == "_"):
+                index += 1
+            return index
+        index += 1
+    return len(source)
+
+
+def _verbatim_end(source: str, start: int) -> int:
+    """End of the line at `start`, or of the source if a template literal or
+    block comment could continue past it."""
+    end = source.find("\n", start)
+    if end < 0:
+        return len(source)
+    line = source[start:end]
+    if "`" in line or "/*" in line:
+        return len(source)
+    return end
+
+
+def _regex_allowed(last_token: str) -> bool:
+    if not last_token:
+        return True
+    if last_token in JS_REGEX_KEYWORDS:
+        return True
+    if last_token in ("++", "--"):
+        return False
+    return last_token[-1] in JS_REGEX_PRECEDERS
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import weakref
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from lib.python.odoo_reusable.core.model_metadata import METADATA_CACHE_DIR, ModelMetadataCache  # noqa: F401
+
+_SHARED_CACHES: "weakref.WeakKeyDictionary[Any, ModelMetadataCache]" = weakref.WeakKeyDictionary()
+
+
+def shared_metadata_cache(client: Any, cache_dir: Optional[Path] = None) -> ModelMetadataCache:
+    """Return the metadata cache shared by every manager using `client`."""
+    cache = _SHARED_CACHES.get(client)
+    if cache is None:
+        creds = client.creds
+        cache = ModelMetadataCache(
+            client.search_read,
+            host=urlparse(creds.url).hostname or "",
+            db=creds.db,
+            cache_dir=cache_dir,
+        )
+        _SHARED_CACHES[client] = cache
+    return cache
@@ -4,6 +4,17 @@ import time
 import xmlrpc.client
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from odoo_bridge.http_transport import PooledTransport, TransportConfig
+
+RETRY_ATTEMPTS = 4
+INITIAL_BACKOFF_SECONDS = 1.0
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+
+def is_retryable_error(exc: Exception) -> bool:
+    return isinstance(exc, xmlrpc.client.ProtocolError) and int(getattr(exc, "errcode", 0)) in RETRYABLE_STATUS_CODES
 
 
 @dataclass(slots=True)
@@ -15,10 +26,13 @@ class OdooCredentials:
 
 
 class OdooClient:
-    def __init__(self, creds: OdooCredentials):
+    def __init__(self, creds: OdooCredentials, transport_config: Optional[TransportConfig] = None):
         self.creds = creds
-        self.common = xmlrpc.client.ServerProxy(f"{creds.url.rstrip('/')}/xmlrpc/2/common")
-        self.models = xmlrpc.client.ServerProxy(f"{creds.url.rstrip('/')}/xmlrpc/2/object")
+        base_url = creds.url.rstrip("/")
+        use_https = urlparse(base_url).scheme.lower() == "https"
+        self.transport = PooledTransport(use_https=use_https, config=transport_config)
+        self.common = xmlrpc.client.ServerProxy(f"{base_url}/xmlrpc/2/common", transport=self.transport)
+        self.models = xmlrpc.client.ServerProxy(f"{base_url}/xmlrpc/2/object", transport=self.transport)
         self.uid: Optional[int] = None
 
     def connect(self) -> int:
@@ -28,26 +42,23 @@ class OdooClient:
         self.uid = int(uid)
         return self.uid
 
+    def close(self) -> None:
+        self.transport.close()
+
+    def transport_stats(self) -> Dict[str, Any]:
+        return self.transport.stats()
+
     def _exec(self, model: str, method: str, *args: Any, **kwargs: Any) -> Any:
         if not self.uid:
             self.connect()
-        retries = 4
-        backoff_seconds = 1.0
+        backoff_seconds = INITIAL_BACKOFF_SECONDS
         last_error: Optional[Exception] = None
-        for _attempt in range(retries):
+        for _attempt in range(RETRY_ATTEMPTS):
             try:
-                return self.models.execute_kw(
-                    self.creds.db,
-                    self.uid,
-                    self.creds.password,
-                    model,
-                    method,
-                    list(args),
-                    kwargs,
-                )
+                return self._exec_once(model, method, list(args), kwargs)
             except xmlrpc.client.ProtocolError as exc:
                 last_error = exc
-                if int(getattr(exc, "errcode", 0)) not in {429, 503}:
+                if not is_retryable_error(exc):
                     raise
                 time.sleep(backoff_seconds)
                 backoff_seconds *= 2.0
@@ -55,6 +66,17 @@ class OdooClient:
             raise last_error
         raise RuntimeError("Unexpected XML-RPC execution failure")
 
+    def _exec_once(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        return self.models.execute_kw(
+            self.creds.db,
+            self.uid,
+            self.creds.password,
+            model,
+            method,
+            args,
+            kwargs,
+        )
+
     def search_read(
         self,
         model: str,
@@ -92,6 +114,12 @@ class OdooClient:
     def create(self, model: str, values: Dict[str, Any]) -> int:
         return int(self._exec(model, "create", values))
 
+    def create_many(self, model: str, values_list: List[Dict[str, Any]]) -> List[int]:
+        if not values_list:
+            return []
+        created = self._exec(model, "create", values_list)
+        return [int(item) for item in created] if isinstance(created, list) else [int(created)]
+
     def write(self, model: str, ids: List[int], values: Dict[str, Any]) -> bool:
         return bool(self._exec(model, "write", ids, values))
 
@@ -6,6 +6,8 @@ from odoo_bridge.theme_framework.contracts import (
     ThemeSpec,
 )
 from odoo_bridge.theme_framework.manager import ThemeFrameworkManager
+from odoo_bridge.theme_framework.planner import ThemeDeployPlan, ThemeDeployPlanner
+from odoo_bridge.theme_framework.resolver import ThemeResolver
 
 __all__ = [
     "ThemeAssetSpec",
@@ -14,5 +16,8 @@ __all__ = [
     "ThemeCatalogSpec",
     "ThemeCatalogLoader",
     "ThemeFrameworkManager",
+    "ThemeDeployPlan",
+    "ThemeDeployPlanner",
+    "ThemeResolver",
 ]
 
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+ASSET_MANIFEST_DIR = Path(".cache/theme_framework")
+
+
+class AssetManifest:
+    """Local record of asset digests and last-deployed attachment checksums.
+
+    File digests are keyed by path and reused while size and mtime are
+    unchanged, so unchanged assets are neither re-read nor re-hashed.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._attachments: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_target(cls, cache_dir: Path, host: str, db: str) -> "AssetManifest":
+        digest = hashlib.sha1(f"{host}|{db}".encode("utf-8")).hexdigest()[:16]
+        return cls(cache_dir / f"deploy_{digest}.json")
+
+    def digest(self, path: Path) -> str:
+        stat = path.stat()
+        key = path.as_posix()
+        entry = self._files.get(key)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return str(entry["sha1"])
+        checksum = hashlib.sha1(path.read_bytes()).hexdigest()
+        self._files[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": checksum}
+        self._dirty = True
+        return checksum
+
+    def deployed_checksum(self, attachment_name: str) -> Optional[str]:
+        entry = self._attachments.get(attachment_name)
+        return str(entry["checksum"]) if entry and entry.get("checksum") else None
+
+    def record_deployed(self, attachment_name: str, attachment_id: int, checksum: str) -> None:
+        entry = {"id": int(attachment_id), "checksum": checksum}
+        if self._attachments.get(attachment_name) != entry:
+            self._attachments[attachment_name] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"files": self._files, "attachments": self._attachments}
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        files = payload.get("files")
+        attachments = payload.get("attachments")
+        self._files = files if isinstance(files, dict) else {}
+        self._attachments = attachments if isinstance(attachments, dict) else {}
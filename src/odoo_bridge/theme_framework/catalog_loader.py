@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Iterable
 
 from odoo_bridge.theme_framework.contracts import ThemeCatalogSpec
-from odoo_bridge.yaml_catalog import YamlCatalogLoader
+from odoo_bridge.yaml_catalog import YAML_CACHE_DIR, YamlCatalogLoader
 
 
 class ThemeCatalogLoader:
@@ -15,7 +15,7 @@ class ThemeCatalogLoader:
 
     def load_one(self, catalog_path: Path) -> ThemeCatalogSpec:
         absolute = self._resolve(catalog_path)
-        payload = YamlCatalogLoader(absolute).load()
+        payload = YamlCatalogLoader(absolute, cache_dir=self.project_root / YAML_CACHE_DIR).load()
         return ThemeCatalogSpec.from_dict(payload)
 
     def load_many(self, catalog_paths: Iterable[Path]) -> ThemeCatalogSpec:
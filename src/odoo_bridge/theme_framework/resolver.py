@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple, TypeVar
+
+from odoo_bridge.theme_framework.contracts import ThemeCatalogSpec, ThemeSpec
+
+T = TypeVar("T")
+
+
+class ThemeResolver:
+    """Resolve theme inheritance once per catalog.
+
+    Themes are visited in dependency order with an explicit stack and every
+    resolved spec is cached, so shared ancestors of a diamond are merged once.
+    Inherited assets and views are deduplicated by identity, keeping the first
+    occurrence in inheritance order.
+    """
+
+    def __init__(self, catalog: ThemeCatalogSpec):
+        self.catalog = catalog
+        self._resolved: Dict[str, ThemeSpec] = {}
+
+    def resolve(self, key: str) -> ThemeSpec:
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            return resolved
+        for theme_key in self._dependency_order(key):
+            self._resolved[theme_key] = self._merge(self.catalog.themes[theme_key])
+        return self._resolved[key]
+
+    def resolve_all(self) -> Dict[str, ThemeSpec]:
+        return {key: self.resolve(key) for key in sorted(self.catalog.themes)}
+
+    def _dependency_order(self, root: str) -> List[str]:
+        order: List[str] = []
+        done = set(self._resolved)
+        visiting: Dict[str, int] = {}
+        path: List[str] = []
+        stack: List[Tuple[str, int]] = [(root, 0)]
+        while stack:
+            key, index = stack.pop()
+            theme = self.catalog.themes[key]
+            if index == 0:
+                visiting[key] = len(path)
+                path.append(key)
+            if index < len(theme.inherits):
+                stack.append((key, index + 1))
+                parent_key = theme.inherits[index]
+                if parent_key not in self.catalog.themes:
+                    raise RuntimeError(f"Theme '{key}' inherits unknown parent '{parent_key}'")
+                if parent_key in visiting:
+                    cycle = " -> ".join([*path[visiting[parent_key]:], parent_key])
+                    raise RuntimeError(f"Cyclic theme inheritance detected: {cycle}")
+                if parent_key not in done:
+                    stack.append((parent_key, 0))
+                continue
+            path.pop()
+            visiting.pop(key)
+            done.add(key)
+            order.append(key)
+        return order
+
+    def _merge(self, theme: ThemeSpec) -> ThemeSpec:
+        if not theme.inherits:
+            return theme
+        parents = [self._resolved[parent_key] for parent_key in theme.inherits]
+        params: Dict[str, str] = {}
+        for parent in parents:
+            params.update(parent.params)
+        params.update(theme.params)
+        return ThemeSpec(
+            key=theme.key,
+            title=theme.title,
+            description=theme.description,
+            inherits=theme.inherits,
+            assets=_unique([*(asset for parent in parents for asset in parent.assets), *theme.assets]),
+            qweb_views=_unique([*(view for parent in parents for view in parent.qweb_views), *theme.qweb_views]),
+            params=params,
+            hosts=tuple(dict.fromkeys([*(host for parent in parents for host in parent.hosts), *theme.hosts])),
+        )
+
+
+def _unique(items: Iterable[T]) -> Tuple[T, ...]:
+    seen: Dict[int, T] = {}
+    for item in items:
+        seen.setdefault(id(item), item)
+    return tuple(seen.values())
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 from pathlib import Path
 
 from odoo_bridge.cli_common import build_client
-from odoo_bridge.theme_framework.manager import ThemeFrameworkManager
+from odoo_bridge.theme_framework.manager import ThemeFrameworkConfig, ThemeFrameworkManager
+from odoo_bridge.yaml_catalog import catalog_cache_stats
 
 
 def _parse_theme_list(raw: str) -> list[str]:
@@ -22,24 +24,35 @@ def main() -> int:
         default="",
         help="Comma-separated theme keys. Empty means catalog-driven default scope.",
     )
+    parser.add_argument("--minify", action="store_true", help="Upload minified CSS/JS theme assets")
     mode = parser.add_mutually_exclusive_group()
     mode.add_argument("--status", action="store_true", help="Read framework status")
     mode.add_argument("--rollback", action="store_true", help="Rollback deployed themes")
+    mode.add_argument("--plan", action="store_true", help="Print the deploy plan without applying it")
     args = parser.parse_args()
 
     client = build_client(args.allow_host, args.allow_any_host)
-    manager = ThemeFrameworkManager(client=client, project_root=Path(args.project_root))
+    manager = ThemeFrameworkManager(
+        client=client,
+        project_root=Path(args.project_root),
+        config=ThemeFrameworkConfig(minify_assets=args.minify),
+    )
     themes = _parse_theme_list(args.themes)
 
     if args.status:
-        result = manager.status()
+        result = asyncio.run(manager.status_async())
     elif args.rollback:
         result = manager.rollback(themes)
+    elif args.plan:
+        result = manager.plan(themes).to_dict()
     else:
         result = manager.apply(themes)
 
+    result["transport"] = client.transport_stats()
+    result["catalog_cache"] = catalog_cache_stats()
+    client.close()
     print(json.dumps(result, indent=2, ensure_ascii=False))
-    return 0 if result.get("status") in {"ready", "ok", "rolled_back"} else 1
+    return 0 if result.get("status") in {"ready", "ok", "rolled_back", "planned"} else 1
 
 
 if __name__ == "__main__":
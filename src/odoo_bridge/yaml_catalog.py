@@ -1,24 +1,118 @@
 ﻿from __future__ import annotations
 
+import hashlib
+import pickle
+import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+YAML_CACHE_DIR = Path(".cache/yaml_catalog")
+
+# path -> (size, mtime_ns, sha1, pickled payload)
+_MEMORY_CACHE: Dict[str, Tuple[int, int, str, bytes]] = {}
+_STATS: Dict[str, Any] = {
+    "loader": SafeLoader.__name__,
+    "parsed": 0,
+    "parse_seconds": 0.0,
+    "memory_hits": 0,
+    "disk_hits": 0,
+    "hit_seconds": 0.0,
+}
+
 
 class YamlCatalogLoader:
-    """Load YAML catalogs with a strict dict root for predictable injection."""
+    """Load YAML catalogs with a strict dict root for predictable injection.
+
+    Parsed catalogs are kept in memory and, when `cache_dir` is given, pickled
+    to disk keyed by path. Entries are reused while size and mtime match, or
+    when the content hash is unchanged after a touch.
+    """
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, cache_dir: Optional[Path] = None):
         self.path = path
+        self.cache_dir = cache_dir
 
     def load(self) -> Dict[str, Any]:
         if not self.path.exists():
             raise RuntimeError(f"Required YAML catalog not found: {self.path}")
 
-        data = yaml.safe_load(self.path.read_text(encoding="utf-8"))
+        started = time.perf_counter()
+        stat = self.path.stat()
+        key = self.path.resolve().as_posix()
+        entry = _MEMORY_CACHE.get(key)
+        if entry and entry[:2] == (stat.st_size, stat.st_mtime_ns):
+            return self._hit(entry[3], "memory_hits", started)
+
+        raw = self.path.read_bytes()
+        checksum = hashlib.sha1(raw).hexdigest()
+        counter = "memory_hits"
+        if entry is None:
+            entry = self._read_disk(key)
+            counter = "disk_hits"
+        if entry and entry[2] == checksum:
+            current = (stat.st_size, stat.st_mtime_ns, checksum, entry[3])
+            self._remember(key, current, persist=current != entry)
+            return self._hit(entry[3], counter, started)
+
+        data = yaml.load(raw.decode("utf-8"), Loader=SafeLoader)
         if data is None:
-            return {}
+            data = {}
         if not isinstance(data, dict):
             raise RuntimeError(f"YAML catalog root must be a mapping: {self.path}")
+        payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        self._remember(key, (stat.st_size, stat.st_mtime_ns, checksum, payload), persist=True)
+        _STATS["parsed"] += 1
+        _STATS["parse_seconds"] += time.perf_counter() - started
         return data
+
+    def _hit(self, payload: bytes, counter: str, started: float) -> Dict[str, Any]:
+        data = pickle.loads(payload)
+        _STATS[counter] += 1
+        _STATS["hit_seconds"] += time.perf_counter() - started
+        return data
+
+    def _remember(self, key: str, entry: Tuple[int, int, str, bytes], persist: bool) -> None:
+        _MEMORY_CACHE[key] = entry
+        path = self._disk_path(key)
+        if not persist or path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(pickle.dumps({"path": key, "entry": entry}, pickle.HIGHEST_PROTOCOL))
+        tmp_path.replace(path)
+
+    def _read_disk(self, key: str) -> Optional[Tuple[int, int, str, bytes]]:
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        # Anything unreadable or oddly shaped is a miss; the caller re-parses and rewrites the file.
+        try:
+            stored = pickle.loads(path.read_bytes())
+            if not isinstance(stored, dict) or stored.get("path") != key:
+                return None
+            size, mtime_ns, checksum, payload = stored["entry"]
+            if not isinstance(checksum, str) or not isinstance(payload, bytes):
+                return None
+            return (int(size), int(mtime_ns), checksum, payload)
+        except Exception:
+            return None
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.pickle"
+
+
+def catalog_cache_stats() -> Dict[str, Any]:
+    """Parse vs. cache-hit counters and cumulative timings for this process."""
+    stats = dict(_STATS)
+    stats["parse_seconds"] = round(stats["parse_seconds"], 6)
+    stats["hit_seconds"] = round(stats["hit_seconds"], 6)
+    return stats
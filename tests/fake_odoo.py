@@ -0,0 +1,78 @@
+import base64
+import hashlib
+import itertools
+from types import SimpleNamespace
+
+
+class FakeOdoo:
+    """In-memory Odoo that honours `fields`, so missing reads show up as diffs."""
+
+    def __init__(self, records=None, fields=None):
+        self.creds = SimpleNamespace(url="https://odoo.test", db="db")
+        self.db = {model: {row["id"]: dict(row) for row in rows} for model, rows in (records or {}).items()}
+        self.fields = fields or {}
+        self.ids = itertools.count(1000)
+        self.calls = []
+
+    def _match(self, row, domain):
+        for name, op, value in domain:
+            current = row.get(name)
+            if op == "=" and current != value:
+                return False
+            if op == "in" and current not in value:
+                return False
+            if op == "ilike" and not str(current or "").lower().startswith(str(value).rstrip("%").lower()):
+                return False
+        return True
+
+    def search_read(self, model, domain, fields=None, limit=None, order=None, context=None):
+        self.calls.append(("search_read", model))
+        if model == "ir.module.module":
+            return [{"name": "base", "latest_version": "17.0"}]
+        if model == "ir.model":
+            return [{"id": idx, "model": name} for idx, name in enumerate(domain[0][2], 1)]
+        if model == "ir.model.fields":
+            names = self.fields.get(domain[0][2], ())
+            return [{"name": name, "ttype": "char", "relation": False} for name in names]
+        rows = [row for row in self.db.get(model, {}).values() if self._match(row, domain)]
+        if fields:
+            rows = [{name: row.get(name) for name in ["id", *fields] if name in row} for row in rows]
+        return rows[:limit] if limit else rows
+
+    def search(self, model, domain, limit=None, context=None):
+        return [row["id"] for row in self.search_read(model, domain, limit=limit)]
+
+    def _store(self, model, values):
+        record_id = next(self.ids)
+        row = dict(values, id=record_id)
+        if model == "ir.attachment" and "datas" in values:
+            row["checksum"] = hashlib.sha1(base64.b64decode(values["datas"])).hexdigest()
+        self.db.setdefault(model, {})[record_id] = row
+        return record_id
+
+    def create(self, model, values):
+        self.calls.append(("create", model))
+        return self._store(model, values)
+
+    def create_many(self, model, values_list):
+        self.calls.append(("create_many", model))
+        return [self._store(model, values) for values in values_list]
+
+    def write(self, model, ids, values):
+        self.calls.append(("write", model, tuple(sorted(values))))
+        for record_id in ids:
+            row = self.db[model][record_id]
+            row.update(values)
+            if model == "ir.attachment" and "datas" in values:
+                row["checksum"] = hashlib.sha1(base64.b64decode(values["datas"])).hexdigest()
+        return True
+
+    def execute(self, model, method, *args, **kwargs):
+        self.calls.append((method, model))
+        if method == "unlink":
+            for record_id in args[0]:
+                self.db[model].pop(record_id, None)
+        return True
+
+    def writes(self):
+        return [call for call in self.calls if call[0] in {"create", "create_many", "write"}]
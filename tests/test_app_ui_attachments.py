@@ -0,0 +1,83 @@
+import shutil
+from pathlib import Path
+
+from odoo_bridge.app_ui.config import build_theme_config
+from odoo_bridge.app_ui.manager import ThemeManager
+
+from fake_odoo import FakeOdoo
+
+APP_UI_DATA = Path(__file__).resolve().parents[1] / "data" / "app_ui_unocss"
+BUNDLES = ["[AppUI]:unocss:app_ui.css", "[AppUI]:unocss:app_ui.js", "[AppUI]:unocss:app_ui_prelude.js"]
+
+
+def _project(tmp_path):
+    shutil.copytree(APP_UI_DATA, tmp_path / "data" / "app_ui_unocss")
+    return tmp_path
+
+
+def _client():
+    return FakeOdoo(
+        records={"ir.ui.view": [{"id": 1, "key": "web.webclient_bootstrap", "type": "qweb", "name": "bootstrap"}]},
+        fields={"ir.attachment": ["public"]},
+    )
+
+
+def _apply(project_root, client):
+    config = build_theme_config(deployment_mode="attachment")
+    return ThemeManager(client, project_root=project_root, config=config).apply()
+
+
+def _attachment_writes(client):
+    return [call for call in client.writes() if call[1] == "ir.attachment"]
+
+
+def test_first_apply_uploads_every_bundle_and_links_them(tmp_path):
+    project_root = _project(tmp_path)
+    client = _client()
+
+    result = _apply(project_root, client)
+
+    assert result["view_written"]
+    assert _attachment_writes(client) == [("create", "ir.attachment")] * 3
+    attachments = client.db["ir.attachment"]
+    assert sorted(row["name"] for row in attachments.values()) == BUNDLES
+    assert all(row["public"] and row["type"] == "binary" for row in attachments.values())
+    arch = next(row["arch_db"] for row in client.db["ir.ui.view"].values() if row["key"] == result["view_key"])
+    for attachment_id, row in attachments.items():
+        assert f"/web/content/{attachment_id}?download=false&amp;unique={row['checksum']}" in arch
+    assert "__ODOO_" not in arch
+
+
+def test_unchanged_bundles_skip_uploads_and_the_view_write(tmp_path):
+    project_root = _project(tmp_path)
+    client = _client()
+    first = _apply(project_root, client)
+    client.calls.clear()
+
+    second = _apply(project_root, client)
+
+    assert client.writes() == []
+    assert not second["view_written"]
+    assert second["view_id"] == first["view_id"]
+    assert second["build"]["output_digest"] == first["build"]["output_digest"]
+    assert not any(item["uploaded"] for item in second["build"]["attachments"].values())
+
+
+def test_only_the_changed_bundle_is_uploaded(tmp_path):
+    project_root = _project(tmp_path)
+    client = _client()
+    first = _apply(project_root, client)
+    forms_css = project_root / "data" / "app_ui_unocss" / "css" / "30_forms.css"
+    forms_css.write_text(forms_css.read_text(encoding="utf-8") + "\n.o_app_ui_probe { color: teal; }\n", encoding="utf-8")
+    client.calls.clear()
+
+    result = _apply(project_root, client)
+
+    uploaded = {name for name, item in result["build"]["attachments"].items() if item["uploaded"]}
+    assert uploaded == {"app_ui.css"}
+    assert _attachment_writes(client) == [("write", "ir.attachment", ("datas", "mimetype", "name", "public", "type"))]
+    assert {name: item["id"] for name, item in result["build"]["attachments"].items()} == {
+        name: item["id"] for name, item in first["build"]["attachments"].items()
+    }
+    assert result["view_written"]
+    assert result["build"]["output_digest"] != first["build"]["output_digest"]
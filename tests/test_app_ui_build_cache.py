@@ -0,0 +1,66 @@
+import shutil
+from pathlib import Path
+
+from odoo_bridge.app_ui.asset_builder import AssetBuilder
+from odoo_bridge.app_ui.build_cache import BuildCache
+from odoo_bridge.app_ui.config import build_theme_config
+
+APP_UI_DATA = Path(__file__).resolve().parents[1] / "data" / "app_ui_unocss"
+
+
+def _project(tmp_path):
+    shutil.copytree(APP_UI_DATA, tmp_path / "data" / "app_ui_unocss")
+    return tmp_path
+
+
+def _builder(project_root):
+    return AssetBuilder(project_root=project_root, config=build_theme_config())
+
+
+def test_unchanged_inputs_reuse_the_stored_arch(tmp_path):
+    project_root = _project(tmp_path)
+    first = _builder(project_root).build()
+
+    second = _builder(project_root).build()
+
+    assert not first.reused
+    assert set(first.rebuilt_sections) == set(first.sections)
+    assert second.reused
+    assert second.rebuilt_sections == ()
+    assert second.arch == first.arch
+    assert second.digest == first.digest
+
+
+def test_changed_section_is_rebuilt_and_the_rest_reused(tmp_path):
+    project_root = _project(tmp_path)
+    first = _builder(project_root).build()
+    forms_css = project_root / "data" / "app_ui_unocss" / "css" / "30_forms.css"
+    forms_css.write_text(forms_css.read_text(encoding="utf-8") + "\n.o_app_ui_probe { color: teal; }\n", encoding="utf-8")
+
+    changed = _builder(project_root).build()
+
+    assert not changed.reused
+    assert changed.rebuilt_sections == ("__ODOO_SHELL_CSS__",)
+    assert {name for name, stat in changed.section_stats.items() if name != "render" and not stat["cached"]} == {
+        "__ODOO_SHELL_CSS__"
+    }
+    assert [name for name in first.sections if first.sections[name] != changed.sections[name]] == ["__ODOO_SHELL_CSS__"]
+    assert ".o_app_ui_probe { color: teal; }" in changed.arch
+    cold = AssetBuilder(project_root=project_root, config=build_theme_config(), cache=BuildCache(None)).build()
+    assert changed.arch == cold.arch
+
+
+def test_file_digest_follows_content_and_section_lookup_checks_the_digest(tmp_path):
+    source = tmp_path / "a.css"
+    source.write_text("a{}", encoding="utf-8")
+    cache = BuildCache(tmp_path / "cache.json")
+    digest = cache.section_digest("css", [source])
+    cache.store_section("css", digest, "built")
+    cache.save()
+
+    reloaded = BuildCache(tmp_path / "cache.json")
+    assert reloaded.section("css", reloaded.section_digest("css", [source])) == "built"
+    source.write_text("b{color:red}", encoding="utf-8")
+    changed = reloaded.section_digest("css", [source])
+    assert changed != digest
+    assert reloaded.section("css", changed) is None
@@ -0,0 +1,64 @@
+import random
+from pathlib import Path
+
+from odoo_bridge.app_ui.asset_builder import AssetBuilder
+from odoo_bridge.app_ui.config import build_theme_config
+from odoo_bridge.app_ui.template import PlaceholderTemplate, compile_template
+
+APP_UI_DATA = Path(__file__).resolve().parents[1] / "data" / "app_ui_unocss"
+PLACEHOLDERS = ["__ODOO_SHELL_CSS__", "__ODOO_SHELL_JS__", "__ODOO_SHELL_CONFIG_JS__"]
+
+
+def _chained_replace(template, contents):
+    # AssetBuilder._render before PlaceholderTemplate replaced it.
+    rendered = template
+    for placeholder, content in contents.items():
+        rendered = rendered.replace(placeholder, content)
+    return rendered
+
+
+def test_render_matches_chained_replace():
+    rng = random.Random(12)
+    pieces = [*PLACEHOLDERS, "__ODOO_UNKNOWN__", "__ODOO_", "__", "_", "<t>", "x", "\n"]
+    for _ in range(2000):
+        template = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+        contents = {key: f"<{key.lower()}|{rng.randint(0, 9)}>" for key in rng.sample(PLACEHOLDERS, rng.randint(0, 3))}
+        assert PlaceholderTemplate(template).render(contents) == _chained_replace(template, contents), template
+
+
+def test_adjacent_placeholders_and_trailing_underscores_are_substituted():
+    template = "__ODOO_SHELL_CSS____ODOO_SHELL_JS__|__ODOO_SHELL_CSS___|___ODOO_SHELL_JS__"
+    contents = {"__ODOO_SHELL_CSS__": "css", "__ODOO_SHELL_JS__": "js"}
+
+    assert PlaceholderTemplate(template).render(contents) == "cssjs|css_|_js"
+    assert PlaceholderTemplate(template).render(contents) == _chained_replace(template, contents)
+
+
+def test_placeholders_already_substituted_stay_verbatim_in_later_values():
+    template = "<style>__ODOO_SHELL_CSS__</style><script>__ODOO_SHELL_JS__</script>"
+    contents = {"__ODOO_SHELL_CSS__": "a{}", "__ODOO_SHELL_JS__": "log('__ODOO_SHELL_CSS__')"}
+
+    rendered = PlaceholderTemplate(template).render(contents)
+
+    assert rendered == _chained_replace(template, contents)
+    assert rendered == "<style>a{}</style><script>log('__ODOO_SHELL_CSS__')</script>"
+
+
+def test_values_are_not_rescanned_for_later_placeholders():
+    template = "<script>__ODOO_SHELL_JS__</script><style>__ODOO_SHELL_CSS__</style>"
+    contents = {"__ODOO_SHELL_JS__": "log('__ODOO_SHELL_CSS__')", "__ODOO_SHELL_CSS__": "a{}"}
+
+    rendered = PlaceholderTemplate(template).render(contents)
+
+    # The chained replace substituted CSS into the JS payload; a single pass keeps it verbatim.
+    assert _chained_replace(template, contents) == "<script>log('a{}')</script><style>a{}</style>"
+    assert rendered == "<script>log('__ODOO_SHELL_CSS__')</script><style>a{}</style>"
+
+
+def test_shipped_arch_template_matches_chained_replace():
+    builder = AssetBuilder(project_root=APP_UI_DATA.parents[1], config=build_theme_config())
+    template = (APP_UI_DATA / "assets_backend.xml").read_text(encoding="utf-8").strip()
+    contents = {placeholder: f"/* {placeholder} */" for placeholder in builder._sections()}
+
+    assert compile_template(template).render(contents) == _chained_replace(template, contents)
+    assert set(compile_template(template).placeholders) <= set(contents)
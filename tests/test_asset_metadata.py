@@ -0,0 +1,58 @@
+import random
+import re
+
+from lib.python.odoo_reusable.core.asset_metadata import (
+    SERIAL_METADATA_LABELS,
+    normalize_legacy_metadata_value,
+    parse_serial_metadata_note,
+)
+
+
+def _legacy_parse(note_value, labels=SERIAL_METADATA_LABELS):
+    text = str(note_value or "")
+    parsed = {key: "" for key in labels}
+    if not text:
+        return parsed
+    cleaned = re.sub(r"<[^>]+>", " ", text)
+    cleaned = cleaned.replace("&nbsp;", " ")
+    chunks = [chunk.strip() for chunk in re.split(r"[|\n\r]+", cleaned) if chunk.strip()]
+    for chunk in chunks:
+        upper = chunk.upper()
+        for key, label in labels.items():
+            marker = f"{label.upper()}:"
+            if marker not in upper:
+                continue
+            if parsed[key]:
+                break
+            value = chunk.split(":", 1)[1].strip() if ":" in chunk else ""
+            parsed[key] = normalize_legacy_metadata_value(value)
+            break
+    return parsed
+
+
+def test_parse_serial_note_extracts_labelled_values():
+    note = "<p>PSN: P-1</p>|<p>esn : skipped</p>|Esn:E-2 | vin: none\nVIN:&nbsp;V-3 | PSN: later"
+    assert parse_serial_metadata_note(note) == {"psn": "P-1", "esn": "E-2", "vin": "V-3"}
+
+
+def test_parse_serial_note_first_label_in_label_order_wins_per_chunk():
+    assert parse_serial_metadata_note("VIN: PSN: x") == {"psn": "PSN: x", "esn": "", "vin": ""}
+    assert parse_serial_metadata_note("Note: no markers | PSN:") == {"psn": "", "esn": "", "vin": ""}
+
+
+def test_parse_serial_note_custom_labels():
+    labels = {"tag": "Asset Tag", "serial": "S/N"}
+    note = "asset tag: T-9\ns/n: 123 | S/N: 456"
+    assert parse_serial_metadata_note(note, labels) == {"tag": "T-9", "serial": "123"}
+    assert parse_serial_metadata_note(note, labels) == _legacy_parse(note, labels)
+
+
+def test_parse_serial_note_matches_legacy_parser():
+    alphabet = [
+        "PSN:", "psn:", "ESN:", "Vin:", "vin :", "PESN:", ":", "|", "\n", "\r", "\t", " ",
+        "<b>", "</b>", "<", ">", "&nbsp;", "&", "<p title='PSN:x'>", "abc", "123", "none", "NaN", "-",
+    ]
+    rng = random.Random(23)
+    for _ in range(20000):
+        note = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14)))
+        assert parse_serial_metadata_note(note) == _legacy_parse(note), note
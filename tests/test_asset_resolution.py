@@ -0,0 +1,181 @@
+import re
+from collections import Counter
+
+from lib.python.odoo_reusable.core.asset_labels import AssetKeyIndex, is_asset_key_match
+from lib.python.odoo_reusable.core.asset_resolution import (
+    AssetPrefixMatchPolicy,
+    AssetResolutionEngine,
+    AssetResolutionState,
+    BaseAssetMatchStrategy,
+    GeneratedProductFallbackStrategy,
+)
+
+
+def _state(codes):
+    return AssetResolutionState({}, {}, set(codes), {}, {})
+
+
+def _resolve(state, code):
+    strategy = BaseAssetMatchStrategy(AssetPrefixMatchPolicy(preferred_suffixes=("STD",)))
+    return strategy.resolve_prefix_variants(code=code, available_codes=state.prefix_index())
+
+
+def test_prefix_index_prefers_suffix_then_smallest_code():
+    state = _state({"P1-A", "P1-STD", "P1-B", "P2-B"})
+
+    assert _resolve(state, "P1-X") == "P1-STD"
+    assert _resolve(state, "P2-X") == "P2-B"
+    assert _resolve(state, "P3-X") is None
+
+
+def test_prefix_index_follows_same_size_swaps_on_the_set():
+    state = _state({"P1-A", "P2-A"})
+    assert _resolve(state, "P1-X") == "P1-A"
+
+    state.available_codes.discard("P1-A")
+    state.available_codes.add("P1-B")
+
+    assert _resolve(state, "P1-X") == "P1-B"
+
+
+def test_prefix_index_follows_added_codes_and_reassignment():
+    state = _state({"P1-B"})
+    assert _resolve(state, "P1-X") == "P1-B"
+
+    state.add_available_code("P1-STD", "p1std")
+    assert _resolve(state, "P1-X") == "P1-STD"
+    assert state.available_code_norm_map == {"p1std": "P1-STD"}
+
+    state.available_codes = {"P1-C"}
+    assert _resolve(state, "P1-X") == "P1-C"
+
+
+def test_asset_key_index_matches_brute_force(tmp_path):
+    lots = ["PSN-0001/A", "psn 0001", "PSN-00012", "ESN-77", "", "--"]
+    index = AssetKeyIndex((lot, position) for position, lot in enumerate(lots))
+
+    for target in ("psn0001", "PSN-0001/a", "esn", "x", ""):
+        for allow_prefix in (True, False):
+            expected = sorted(p for p, lot in enumerate(lots) if is_asset_key_match(lot, target, allow_prefix))
+            assert sorted(index.match(target, allow_prefix)) == expected
+
+    path = tmp_path / "index.json"
+    index.save(path, fingerprint="v1")
+    assert AssetKeyIndex.load(path, fingerprint="v1").match("psn0001") == index.match("psn0001")
+    assert AssetKeyIndex.load(path, fingerprint="v2") is None
+
+
+class FakeProducts:
+    """Port plus fallback product store; `calls` counts every simulated RPC."""
+
+    def __init__(self):
+        self.products = {"PUMP-100": 1, "ENG-7-A": 2, "HOSE-01": 3, "KNOWN-1": 4}
+        self.calls = Counter()
+
+    def normalize_key(self, value):
+        return re.sub(r"[^a-z0-9]+", "", str(value or "").lower())
+
+    def get_product_id(self, code):
+        self.calls["get_product_id"] += 1
+        return self.products.get(code)
+
+    def get_product_ids(self, codes):
+        self.calls["get_product_ids"] += 1
+        return {code: self.products[code] for code in codes if code in self.products}
+
+    def store_mapping(self, state, raw_code, raw_key, product_id):
+        state.product_id_map[raw_code] = product_id
+        if raw_key:
+            state.resolved_product_by_raw_key[raw_key] = product_id
+
+    def register_resolved_code(self, state, code, product_id):
+        state.product_id_map[code] = product_id
+        state.add_available_code(code, self.normalize_key(code))
+
+    def ensure_product(self, code, _name):
+        self.calls["ensure_product"] += 1
+        return self._create(code)
+
+    def ensure_products(self, items):
+        self.calls["ensure_products"] += 1
+        return {code: self._create(code) for code, _name in items if code != "FB-BROKEN"}
+
+    def _create(self, code):
+        if code == "FB-BROKEN":
+            return None
+        return self.products.setdefault(code, 100 + len(self.products))
+
+
+class SingleLookupPort(FakeProducts):
+    get_product_ids = None  # not an AssetBulkResolutionPort
+
+
+def _engine_state(port, bulk_fallback):
+    state = AssetResolutionState(
+        product_id_map={"KNOWN-1": 4},
+        resolved_product_by_raw_key={},
+        available_codes={"PUMP-100", "ENG-7-A", "HOSE-01", "GHOST-1"},
+        available_code_norm_map={"pump100": "PUMP-100"},
+        description_map={"hosekit": "HOSE-01"},
+    )
+    fallback = GeneratedProductFallbackStrategy(
+        build_code=lambda raw: f"FB-{port.normalize_key(raw).upper()}",
+        ensure_product=port.ensure_product,
+        ensure_products=port.ensure_products if bulk_fallback else None,
+    )
+    return AssetResolutionEngine(BaseAssetMatchStrategy(), fallback), state
+
+
+RAW_CODES = [
+    "PUMP-100", "pump 100", " PUMP-100 ", "", "KNOWN-1", "ENG-7-B", "Hose Kit",
+    "mystery", "Mystery!", "GHOST-1", "unknown-9", "eng-7-b", "broken", "Broken!",
+]
+
+
+def _snapshot(state):
+    return (
+        state.product_id_map,
+        state.resolved_product_by_raw_key,
+        set(state.available_codes),
+        state.available_code_norm_map,
+    )
+
+
+def test_ensure_mappings_matches_per_row_resolution():
+    row_port = SingleLookupPort()
+    row_engine, row_state = _engine_state(row_port, bulk_fallback=False)
+    expected = {}
+    for raw in RAW_CODES:
+        code = raw.strip()
+        if code and code not in expected:
+            expected[code] = row_engine.ensure_mapping(raw, row_state, row_port)
+
+    bulk_port = FakeProducts()
+    bulk_engine, bulk_state = _engine_state(bulk_port, bulk_fallback=True)
+    batch = bulk_engine.ensure_mappings(RAW_CODES, bulk_state, bulk_port)
+
+    assert batch.mapping == expected
+    assert _snapshot(bulk_state) == _snapshot(row_state)
+    assert batch.counters == {
+        "empty": 1,
+        "duplicate": 1,
+        "known": 1,
+        "cached_raw_key": 3,
+        "matched": 3,
+        "fallback": 3,
+        "unresolved": 1,
+        "individual": 1,
+    }
+    # one bulk lookup and one bulk create instead of one RPC per code
+    assert row_port.calls == Counter(get_product_id=4, ensure_product=5)
+    # the unresolved repeat ("Broken!") retries through ensure_mapping on its own
+    assert bulk_port.calls == Counter(get_product_ids=1, ensure_products=1, ensure_product=1)
+    assert batch.product_lookups == 1
+
+
+def test_ensure_mappings_without_bulk_port_looks_codes_up_once_each():
+    port = SingleLookupPort()
+    engine, state = _engine_state(port, bulk_fallback=False)
+    batch = engine.ensure_mappings(RAW_CODES, state, port)
+    assert port.calls["get_product_id"] == batch.product_lookups == 4
+    assert port.calls["ensure_product"] == 5
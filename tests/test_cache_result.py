@@ -0,0 +1,88 @@
+import threading
+import time
+
+import pytest
+
+from lib.python.odoo_reusable.core.decorators import cache_result
+
+
+def test_equal_values_of_different_types_get_separate_entries():
+    @cache_result()
+    def describe(value, flag=None):
+        return (type(value).__name__, type(flag).__name__)
+
+    assert describe(True) == ("bool", "NoneType")
+    assert describe(1.0) == ("float", "NoneType")
+    assert describe(1) == ("int", "NoneType")
+    assert describe(1, flag=True) == ("int", "bool")
+    assert describe(1, flag=1.0) == ("int", "float")
+    assert describe.cache_info().misses == 5
+
+
+def test_repr_fallback_cannot_collide_with_real_arguments():
+    @cache_result()
+    def echo(*args):
+        return args
+
+    unhashable = echo([1])
+    assert echo("repr", repr(([1], list))) == ("repr", repr(([1], list)))
+    assert echo([1]) == unhashable
+
+
+def test_lru_eviction_and_stats():
+    @cache_result(max_size=2)
+    def square(value):
+        return value * value
+
+    for value in (1, 2, 1, 3, 2):
+        square(value)
+
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 4, 2, 2)
+
+
+def test_expired_entries_are_recomputed():
+    calls = []
+
+    @cache_result(ttl_seconds=0.01)
+    def load(value):
+        calls.append(value)
+        return value
+
+    load(1)
+    time.sleep(0.02)
+    load(1)
+    assert calls == [1, 1]
+    assert load.cache_info().expirations == 1
+
+
+def test_concurrent_misses_share_one_call():
+    calls = []
+
+    @cache_result()
+    def slow(value):
+        calls.append(value)
+        time.sleep(0.05)
+        return value * 2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow(3))) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [3]
+    assert results == [6] * 6
+
+
+def test_errors_are_not_cached():
+    @cache_result()
+    def fail(value):
+        raise ValueError(value)
+
+    with pytest.raises(ValueError):
+        fail(1)
+    with pytest.raises(ValueError):
+        fail(1)
+    assert fail.cache_info().currsize == 0
@@ -0,0 +1,31 @@
+from odoo_bridge.app_ui.components import build_components_payload
+
+
+def _resolve(payload, key):
+    aliases = payload["aliases"]
+    return payload["sources"][aliases[key]] if key in aliases else payload["sources"].get(key)
+
+
+def _legacy_map(components_dir, files):
+    legacy = {}
+    for file in files:
+        source = file.read_text(encoding="utf-8").strip()
+        relative_key = file.relative_to(components_dir).as_posix()
+        legacy[relative_key] = source
+        legacy[file.name] = source
+        legacy[f"./{file.name}"] = source
+    return legacy
+
+
+def test_lookups_match_the_legacy_last_file_wins_map(tmp_path):
+    (tmp_path / "nested").mkdir()
+    root_card = tmp_path / "card.vue"
+    nested_card = tmp_path / "nested" / "card.vue"
+    root_card.write_text("<template><p>root</p></template>", encoding="utf-8")
+    nested_card.write_text("<template><p>nested</p></template>", encoding="utf-8")
+
+    for files in ([root_card, nested_card], [nested_card, root_card]):
+        payload, report = build_components_payload(tmp_path, files)
+        legacy = _legacy_map(tmp_path, files)
+        assert {key: _resolve(payload, key) for key in legacy} == legacy
+        assert len(payload["sources"]) == report["components"] == 2
@@ -0,0 +1,98 @@
+from fake_odoo import FakeOdoo
+
+from odoo_bridge.config_params import ConfigParamSync
+
+MODEL = "ir.config_parameter"
+
+
+def _odoo():
+    return FakeOdoo(
+        {
+            MODEL: [
+                {"id": 1, "key": "web.base.url", "value": "https://old.test"},
+                {"id": 2, "key": "app.theme", "value": "dark"},
+                {"id": 3, "key": "app.flag", "value": "1"},
+                {"id": 4, "key": "app.other_flag", "value": "0"},
+            ]
+        }
+    )
+
+
+def test_diff_classifies_create_update_and_noop():
+    desired = {
+        "web.base.url": "https://new.test",
+        "app.theme": "dark",
+        "app.flag": "0",
+        "app.other_flag": "0",
+        "app.new": "x",
+        "app.second_new": "",
+    }
+    odoo = _odoo()
+    sync = ConfigParamSync(odoo)
+    calls_before = len(odoo.calls)
+
+    diff = sync.diff(desired, sync.read(desired))
+
+    assert odoo.calls[calls_before:] == [("search_read", MODEL)]
+    assert diff["report"] == {
+        "created": ["app.new", "app.second_new"],
+        "updated": ["web.base.url", "app.flag"],
+        "unchanged": ["app.theme", "app.other_flag"],
+    }
+    assert diff["create"] == [{"key": "app.new", "value": "x"}, {"key": "app.second_new", "value": ""}]
+    assert diff["write"] == {"https://new.test": [1], "0": [3]}
+    assert ConfigParamSync.rpc_count(diff) == 3
+
+
+def test_diff_groups_writes_by_value():
+    rows = [{"id": 1, "key": "a", "value": "old"}, {"id": 2, "key": "b", "value": False}, {"id": 3, "key": "c", "value": "x"}]
+    diff = ConfigParamSync.diff({"a": "new", "b": "new", "c": "other"}, rows)
+
+    assert diff["write"] == {"new": [1, 2], "other": [3]}
+    assert diff["create"] == []
+    assert ConfigParamSync.rpc_count(diff) == 2
+
+
+def test_apply_diff_creates_in_one_batch_and_writes_per_value():
+    odoo = _odoo()
+    sync = ConfigParamSync(odoo)
+    desired = {"web.base.url": "https://new.test", "app.flag": "0", "app.theme": "dark", "app.new": "x", "app.more": "y"}
+    diff = sync.diff(desired, sync.read(desired))
+    calls_before = len(odoo.calls)
+
+    sync.apply_diff(diff)
+
+    calls = odoo.calls[calls_before:]
+    assert calls.count(("create_many", MODEL)) == 1
+    assert ("create", MODEL) not in calls
+    assert len(calls) == ConfigParamSync.rpc_count(diff) == 3
+    values = {row["key"]: row["value"] for row in odoo.db[MODEL].values()}
+    assert values == {
+        "web.base.url": "https://new.test",
+        "app.theme": "dark",
+        "app.flag": "0",
+        "app.other_flag": "0",
+        "app.new": "x",
+        "app.more": "y",
+    }
+
+
+def test_sync_is_a_noop_once_applied():
+    odoo = _odoo()
+    sync = ConfigParamSync(odoo)
+    desired = {"web.base.url": "https://new.test", "app.new": "x"}
+
+    assert sync.sync(desired) == {"created": ["app.new"], "updated": ["web.base.url"], "unchanged": []}
+    calls_before = len(odoo.calls)
+    report = sync.sync(desired)
+
+    assert report == {"created": [], "updated": [], "unchanged": ["web.base.url", "app.new"]}
+    assert odoo.calls[calls_before:] == [("search_read", MODEL)]
+    assert odoo.writes().count(("create_many", MODEL)) == 1
+
+
+def test_sync_without_values_makes_no_rpc():
+    odoo = _odoo()
+
+    assert ConfigParamSync(odoo).sync({}) == {"created": [], "updated": [], "unchanged": []}
+    assert odoo.calls == []
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+from lib.python.odoo_reusable.core.connection import OdooBatch, OdooConnection
+from lib.python.odoo_reusable.core.exceptions import OdooConnectionError
+
+
+class FakeConnection(OdooConnection):
+    def __init__(self, responses: List[Any]):
+        super().__init__(
+            config=SimpleNamespace(  # type: ignore[arg-type]
+                odoo_verify_ssl=True,
+                odoo_url="http://odoo.test",
+                odoo_db="db",
+                odoo_password="secret",
+                batch_size=100,
+                dry_run=False,
+            )
+        )
+        self._uid = 2
+        self._connected = True
+        self.responses = responses
+        self.posts: List[Any] = []
+        self.executed: List[tuple] = []
+
+    def _post(self, payload: Any) -> Any:
+        self.posts.append(payload)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        if response == "echo":
+            return [{"jsonrpc": "2.0", "id": item["id"], "result": index} for index, item in enumerate(payload)]
+        return response
+
+    def execute(self, model: str, method: str, *args, **kwargs) -> Any:
+        self.executed.append((model, method, args))
+        return len(self.executed)
+
+
+def _queue_creates(batch: OdooBatch) -> list:
+    return [batch.create("res.partner", {"name": name}) for name in ("a", "b", "c")]
+
+
+@pytest.mark.parametrize("failure", [OdooConnectionError("HTTP Error 502"), ValueError("bad json")])
+def test_transport_failure_fails_futures_without_replay(failure):
+    conn = FakeConnection([failure])
+    batch = OdooBatch(conn)
+    futures = _queue_creates(batch)
+    batch.flush()
+
+    assert conn.executed == []
+    assert conn._batch_supported is None
+    for future in futures:
+        with pytest.raises(type(failure)):
+            future.result()
+
+
+def test_transient_failure_keeps_batching_enabled():
+    conn = FakeConnection([OdooConnectionError("timeout"), "echo"])
+    batch = OdooBatch(conn)
+    _queue_creates(batch)
+    batch.flush()
+    futures = _queue_creates(batch)
+    batch.flush()
+
+    assert len(conn.posts) == 2
+    assert conn._batch_supported is True
+    assert [future.result() for future in futures] == [0, 1, 2]
+
+
+def test_rejected_array_payload_falls_back_to_sequential():
+    conn = FakeConnection([{"jsonrpc": "2.0", "id": None, "error": {"message": "Invalid JSON data"}}])
+    batch = OdooBatch(conn)
+    futures = _queue_creates(batch)
+    batch.flush()
+
+    assert conn._batch_supported is False
+    assert [future.result() for future in futures] == [1, 2, 3]
+    assert len(conn.executed) == 3
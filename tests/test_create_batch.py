@@ -0,0 +1,99 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from lib.python.odoo_reusable.core import base as core_base
+from lib.python.odoo_reusable.core import connection as core_connection
+from lib.python.odoo_reusable.core.base import BaseRepository
+from lib.python.odoo_reusable.core.connection import OdooConnection
+
+
+class FakeConfig:
+    odoo_verify_ssl = True
+    odoo_url = "http://odoo.test"
+    odoo_db = "db"
+    odoo_password = "secret"
+    dry_run = False
+    batch_size = 4
+    retry_attempts = 3
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return default
+
+
+class FakeServer(OdooConnection):
+    """Answers execute_kw create calls; rows flagged `bad` fail the whole call."""
+
+    def __init__(self):
+        super().__init__(config=FakeConfig())  # type: ignore[arg-type]
+        self._uid = 2
+        self._connected = True
+        self.rpcs: List[int] = []
+        self.next_id = 100
+
+    def _post(self, payload: Any) -> Any:
+        values = payload["params"]["args"][5][0]
+        rows = values if isinstance(values, list) else [values]
+        self.rpcs.append(len(rows))
+        if any(row.get("bad") for row in rows):
+            return {"error": {"message": "constraint violated"}}
+        ids = list(range(self.next_id, self.next_id + len(rows)))
+        self.next_id += len(rows)
+        return {"result": ids if isinstance(values, list) else ids[0]}
+
+
+class Repository(BaseRepository[Dict[str, Any]]):
+    _model_name = "res.partner"
+
+    def _validate_create(self, values: Dict[str, Any]) -> None:
+        pass
+
+    def _validate_write(self, values: Dict[str, Any]) -> None:
+        pass
+
+    def to_dto(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        return record
+
+    def from_dto(self, dto: Dict[str, Any]) -> Dict[str, Any]:
+        return dto
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls: List[float] = []
+    monkeypatch.setattr(core_base, "Configuration", FakeConfig)
+    monkeypatch.setattr(core_connection.time, "sleep", calls.append)
+    return calls
+
+
+def test_clean_batch_is_one_rpc_per_chunk_in_input_order(sleeps):
+    server = FakeServer()
+    rows = [{"name": f"row {idx}"} for idx in range(10)]
+    ids = Repository(server).create_batch(rows)
+    assert ids == list(range(100, 110))
+    assert server.rpcs == [4, 4, 2]
+    assert sleeps == []
+
+
+def test_isolate_failures_reports_exactly_the_bad_rows(sleeps):
+    server = FakeServer()
+    rows = [{"name": f"row {idx}", "bad": idx in {1, 6, 7}} for idx in range(10)]
+    failed = []
+    ids = Repository(server).create_batch(
+        rows,
+        isolate_failures=True,
+        on_failure=lambda index, values, error: failed.append((index, values["name"])),
+    )
+    assert failed == [(1, "row 1"), (6, "row 6"), (7, "row 7")]
+    assert [item is None for item in ids] == [row["bad"] for row in rows]
+    good_ids = [item for item in ids if item is not None]
+    assert good_ids == sorted(good_ids)
+
+
+def test_bisection_does_not_retry(sleeps):
+    server = FakeServer()
+    rows = [{"name": f"row {idx}", "bad": idx == 2} for idx in range(4)]
+    Repository(server).create_batch(rows, isolate_failures=True)
+    # the whole chunk keeps its retries; each bisection step is one attempt
+    assert server.rpcs == [4, 4, 4, 2, 2, 1, 1]
+    assert len(sleeps) == 2
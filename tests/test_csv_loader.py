@@ -0,0 +1,60 @@
+import pytest
+
+from lib.python.odoo_reusable.core.exceptions import DataLoadError
+from lib.python.odoo_reusable.loaders import csv_loader
+from lib.python.odoo_reusable.loaders.csv_loader import ENCODING_PROBE_BYTES, CSVDataLoader
+
+
+def _ascii_rows(count):
+    return b"".join(b"code-%06d,plain\r\n" % idx for idx in range(count))
+
+
+def test_detect_encoding_reads_only_the_probe_prefix(tmp_path, monkeypatch):
+    path = tmp_path / "rows.csv"
+    path.write_bytes(b"code,name\r\n" + _ascii_rows(8000))
+    reads = []
+    real_open = open
+
+    def tracking_open(file, mode="r", *args, **kwargs):
+        handle = real_open(file, mode, *args, **kwargs)
+        if "b" in mode:
+            real_read = handle.read
+            handle.read = lambda size=-1: reads.append(size) or real_read(size)
+        return handle
+
+    monkeypatch.setattr(csv_loader, "open", tracking_open, raising=False)
+    assert CSVDataLoader(str(path)).detect_encoding() == "utf-8"
+    assert reads == [ENCODING_PROBE_BYTES]
+
+
+def test_multibyte_sequence_split_at_probe_boundary_is_not_an_error(tmp_path):
+    header = b"code,name\r\n"
+    filler = b"x" * (ENCODING_PROBE_BYTES - len(header) - 1)
+    path = tmp_path / "split.csv"
+    path.write_bytes(header + filler + "é,ok\r\n".encode("utf-8"))
+    loader = CSVDataLoader(str(path), has_header=True)
+    assert loader.detect_encoding() == "utf-8"
+    assert list(loader._iter_rows()) == [{"code": filler.decode() + "é", "name": "ok"}]
+
+
+def test_invalid_bytes_past_the_prefix_raise_without_rereading(tmp_path):
+    body = _ascii_rows(8000)
+    path = tmp_path / "tail.csv"
+    path.write_bytes(b"code,name\r\n" + "été,utf8\r\n".encode("utf-8") + body + b"caf\xe9,latin\r\n")
+    loader = CSVDataLoader(str(path))
+    assert loader.detect_encoding() == "utf-8"
+    rows = loader._iter_rows()
+    assert next(rows) == {"code": "été", "name": "utf8"}
+    with pytest.raises(DataLoadError, match="not valid utf-8") as excinfo:
+        list(rows)
+    assert excinfo.value.details["row_number"] > 1
+
+
+def test_latin1_prefix_reads_the_whole_file_as_latin1(tmp_path):
+    path = tmp_path / "latin.csv"
+    path.write_bytes(b"code,name\r\ncaf\xe9,latin\r\n" + _ascii_rows(5000))
+    loader = CSVDataLoader(str(path))
+    assert loader.detect_encoding() == "latin-1"
+    rows = list(loader._iter_rows())
+    assert rows[0] == {"code": "café", "name": "latin"}
+    assert len(rows) == 5001
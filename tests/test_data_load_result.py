@@ -0,0 +1,68 @@
+import dataclasses
+import pickle
+
+from lib.python.odoo_reusable.loaders.base import DataLoadResult
+from lib.python.odoo_reusable.loaders.csv_loader import CSVDataLoader
+
+
+def test_data_is_a_mutable_list_of_row_objects():
+    result = DataLoadResult()
+    result.add_success({"x": 1})
+    result.data[0]["x"] = 2
+    result.data.append({"x": 3})
+
+    assert result.data == [{"x": 2}, {"x": 3}]
+    assert list(result.iter_data()) == [{"x": 2}, {"x": 3}]
+
+
+def test_result_is_still_a_dataclass():
+    result = DataLoadResult(data=[{"x": 1}], total_rows=1, successful_rows=1)
+
+    assert dataclasses.asdict(result)["data"] == [{"x": 1}]
+    assert dataclasses.replace(result, total_rows=5).total_rows == 5
+
+
+def test_compact_rows_are_packed_against_one_header():
+    result = DataLoadResult(compact=True)
+    for row in ({"a": 1, "b": 2}, {"a": 3}, [4], {"a": 5, "b": 6}):
+        result.add_success(row)
+
+    assert result.data == []
+    assert result.header == ("a", "b")
+    assert list(result.iter_packed()) == [(1, 2), (5, 6)]
+    assert list(result.iter_data()) == [{"a": 1, "b": 2}, {"a": 3}, [4], {"a": 5, "b": 6}]
+    assert list(pickle.loads(pickle.dumps(result)).iter_data()) == list(result.iter_data())
+
+
+def test_error_values_are_sampled_and_truncated():
+    result = DataLoadResult(max_error_values=2, max_value_chars=5)
+    for row_number in range(4):
+        result.add_error(row_number, "bad", value="x" * 10)
+
+    assert [error["value"] for error in result.errors] == ["xxxxx", "xxxxx", None, None]
+    assert result.failed_rows == 4
+
+
+def test_merge_keeps_order_and_counters():
+    first = DataLoadResult(compact=True)
+    second = DataLoadResult(compact=True)
+    first.add_success({"a": 1})
+    second.add_success("raw")
+    second.add_success({"a": 2})
+    second.add_error(9, "bad", value={"a": "?"})
+    first.merge(second)
+
+    assert list(first.iter_data()) == [{"a": 1}, "raw", {"a": 2}]
+    assert (first.successful_rows, first.failed_rows, first.errors[0]["row"]) == (3, 1, 9)
+
+
+def test_loader_compact_load_matches_plain_load(tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text("a,b\n1,2\n3,4\n,\n5,6\n", encoding="utf-8")
+
+    plain = CSVDataLoader(str(path)).load()
+    compact = CSVDataLoader(str(path)).load(compact=True)
+    batches = list(CSVDataLoader(str(path)).iter_batches(batch_size=2, compact=True))
+
+    assert list(compact.iter_data()) == plain.data == [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}, {"a": "5", "b": "6"}]
+    assert [row for batch in batches for row in batch.iter_data()] == plain.data
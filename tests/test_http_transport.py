@@ -0,0 +1,105 @@
+import http.client
+import threading
+import xmlrpc.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from odoo_bridge.http_transport import PooledTransport, TransportConfig
+
+
+class XmlRpcHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections.append(self.client_address)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        params, method = xmlrpc.client.loads(body)
+        self.server.calls.append(method)
+        mode = self.server.modes.pop(0) if self.server.modes else "ok"
+        if mode == "drop":
+            # hang up without answering
+            self.close_connection = True
+            return
+        payload = xmlrpc.client.dumps((params[0] if params else method,), methodresponse=True).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        # "stale": advertise keep-alive, then close, as an idle-timeout on the server would
+        self.close_connection = mode == "stale"
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), XmlRpcHandler)
+    httpd.connections, httpd.calls, httpd.modes = [], [], []
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _proxy(server, **config):
+    transport = PooledTransport(use_https=False, config=TransportConfig(**config))
+    host, port = server.server_address
+    return xmlrpc.client.ServerProxy(f"http://{host}:{port}/xmlrpc/2/object", transport=transport), transport
+
+
+def test_sequential_calls_reuse_one_connection(server):
+    proxy, transport = _proxy(server)
+    assert [proxy.echo(idx) for idx in range(3)] == [0, 1, 2]
+
+    stats = transport.stats()
+    assert len(server.connections) == 1
+    assert (stats["requests"], stats["connections_opened"], stats["connections_reused"]) == (3, 1, 2)
+    assert stats["connections"] == [{"id": 1, "requests": 3, "reuses": 2, "open": True}]
+
+
+def test_reconnects_once_when_the_server_dropped_the_idle_connection(server):
+    proxy, transport = _proxy(server)
+    server.modes = ["stale"]
+    assert proxy.echo("first") == "first"
+    assert proxy.echo("second") == "second"
+
+    stats = transport.stats()
+    assert stats["reconnects"] == 1
+    assert stats["connections_opened"] == 2
+    assert stats["retired"] == {"connections": 1, "requests": 1, "reuses": 0}
+    assert server.calls == ["echo", "echo"]
+
+
+def test_gives_up_after_the_configured_reconnects(server):
+    proxy, transport = _proxy(server, reconnect_attempts=1)
+    server.modes = ["drop", "drop"]
+    with pytest.raises((http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)):
+        proxy.echo("lost")
+
+    stats = transport.stats()
+    assert stats["reconnects"] == 1
+    assert stats["connections_opened"] == 2
+    assert stats["connections"] == []
+    assert stats["retired"]["connections"] == 2
+
+
+def test_retired_connections_are_totals_not_a_growing_list(server):
+    proxy, transport = _proxy(server)
+    server.modes = ["stale"] * 20
+    for idx in range(20):
+        assert proxy.echo(idx) == idx
+    transport.close()
+
+    stats = transport.stats()
+    assert stats["connections"] == []
+    assert stats["retired"] == {"connections": 20, "requests": 20, "reuses": 0}
+    # every stale reuse costs one reconnect; attempts are counted as requests
+    assert stats["reconnects"] == 19
+    assert stats["requests"] == 20 + stats["reconnects"]
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from lib.python.odoo_reusable.core.exceptions import DataLoadError
+from lib.python.odoo_reusable.loaders import json_loader
+from lib.python.odoo_reusable.loaders.json_loader import JSONDataLoader
+
+ROWS = [
+    {"code": "PSN-%04d" % idx, "hours": idx * 1.5, "ok": idx % 2 == 0, "note": "é\\u00e9 \"q\"", "n": None}
+    for idx in range(40)
+]
+
+
+@pytest.fixture(params=[1, 3, 7, 64])
+def tiny_chunks(request, monkeypatch):
+    monkeypatch.setattr(json_loader, "JSON_READ_CHUNK", request.param)
+    return request.param
+
+
+def _rows(tmp_path, text, name="data.json", **kwargs):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return list(JSONDataLoader(str(path), **kwargs)._iter_rows())
+
+
+def test_values_split_across_chunks(tmp_path, tiny_chunks):
+    text = json.dumps(ROWS + [12345678901234567890, -1.5e-10, True, "tail"])
+    assert _rows(tmp_path, text) == json.loads(text)
+
+
+def test_nested_data_key_array(tmp_path, tiny_chunks):
+    document = {
+        "meta": {"inspections": [{"skip": True}], "list": [1, [2, 3]]},
+        "inspections": [{"id": 1, "items": [{"k": [1, 2]}]}, {"id": 2, "items": []}],
+        "after": {"x": [1]},
+    }
+    assert _rows(tmp_path, json.dumps(document), data_key="inspections") == document["inspections"]
+
+
+def test_missing_data_key(tmp_path, tiny_chunks):
+    with pytest.raises(DataLoadError, match="Key not found"):
+        _rows(tmp_path, '{"a": [1], "b": {"inspections": []}}', data_key="inspections")
+
+
+def test_json_lines_skip_blank_lines(tmp_path):
+    text = '{"id": 1}\n\n   \n{"id": 2}\r\n\n'
+    assert _rows(tmp_path, text, name="rows.jsonl") == [{"id": 1}, {"id": 2}]
+
+
+def test_json_lines_report_the_bad_line(tmp_path):
+    with pytest.raises(DataLoadError, match="line 3"):
+        _rows(tmp_path, '{"id": 1}\n\n{"id": \n', name="rows.jsonl")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": 1 "inspections": []}',
+        '{"a": 1, "inspections": [{"id": 1} {"id": 2}]}',
+        '{"a": 1,, "inspections": []}',
+        '{"a": 1, "inspections": [], }',
+        '{"inspections": [1, 2,]}',
+        '{"inspections": [1]} trailing',
+        '{"inspections": [1]',
+    ],
+)
+def test_malformed_data_key_documents_are_rejected(tmp_path, tiny_chunks, text):
+    with pytest.raises(DataLoadError, match="Invalid JSON"):
+        _rows(tmp_path, text, data_key="inspections")
+
+
+@pytest.mark.parametrize("text", ['[{"id": 1} {"id": 2}]', "[1, 2] [3]", '[{"id": tru}]'])
+def test_malformed_arrays_are_rejected(tmp_path, tiny_chunks, text):
+    with pytest.raises(DataLoadError, match="Invalid JSON"):
+        _rows(tmp_path, text)
+
+
+def test_malformed_value_fails_without_reading_to_eof(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_loader, "JSON_READ_CHUNK", 64)
+    path = tmp_path / "data.json"
+    path.write_text('[{"id": 1}, {"id": nope}, ' + ", ".join(['{"id": 2}'] * 50000) + "]", encoding="utf-8")
+    reads = []
+    real_read = json_loader._JSONStream._read
+    monkeypatch.setattr(json_loader._JSONStream, "_read", lambda self, grow=False: reads.append(grow) or real_read(self, grow))
+    rows = JSONDataLoader(str(path))._iter_rows()
+    assert next(rows) == {"id": 1}
+    with pytest.raises(DataLoadError, match="offset 19"):
+        next(rows)
+    assert len(reads) <= 2
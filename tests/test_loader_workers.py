@@ -0,0 +1,60 @@
+import time
+
+from lib.python.odoo_reusable.loaders import base as loader_base
+from lib.python.odoo_reusable.loaders.csv_loader import CSVDataLoader
+
+
+def _slow_transform(row):
+    time.sleep(0.0002)
+    if row["qty"] == "bad":
+        raise ValueError("bad qty")
+    return {"code": row["code"], "qty": int(row["qty"])}
+
+
+def _cheap_transform(row):
+    return {"code": row["code"]}
+
+
+def _write(tmp_path, rows):
+    path = tmp_path / "rows.csv"
+    lines = ["code,qty"] + [f"C{idx},{'bad' if idx % 37 == 0 else idx}" for idx in range(rows)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def _track_pools(monkeypatch):
+    pools = []
+    real_executor = loader_base.ProcessPoolExecutor
+    monkeypatch.setattr(
+        loader_base, "ProcessPoolExecutor", lambda *args, **kwargs: pools.append(kwargs) or real_executor(*args, **kwargs)
+    )
+    monkeypatch.setattr(loader_base.os, "cpu_count", lambda: 4)
+    return pools
+
+
+def _summary(result):
+    return result.data, result.errors, result.successful_rows, result.failed_rows
+
+
+def test_cheap_rows_stay_sequential(tmp_path, monkeypatch):
+    pools = _track_pools(monkeypatch)
+    path = _write(tmp_path, 600)
+    parallel = CSVDataLoader(path, transformer=_cheap_transform).load(workers=4, chunk_size=100)
+    assert pools == []
+    assert _summary(parallel) == _summary(CSVDataLoader(path, transformer=_cheap_transform).load())
+
+
+def test_expensive_rows_use_the_pool_and_match_a_sequential_load(tmp_path, monkeypatch):
+    pools = _track_pools(monkeypatch)
+    path = _write(tmp_path, 600)
+    parallel = CSVDataLoader(path, transformer=_slow_transform).load(workers=4, chunk_size=100)
+    assert len(pools) == 1 and pools[0]["max_workers"] == 4
+    assert _summary(parallel) == _summary(CSVDataLoader(path, transformer=_slow_transform).load())
+    assert parallel.total_rows == 600
+
+
+def test_single_cpu_never_starts_a_pool(tmp_path, monkeypatch):
+    pools = _track_pools(monkeypatch)
+    monkeypatch.setattr(loader_base.os, "cpu_count", lambda: 1)
+    CSVDataLoader(_write(tmp_path, 300), transformer=_slow_transform).load(workers=4, chunk_size=100)
+    assert pools == []
@@ -0,0 +1,31 @@
+import pytest
+
+from odoo_bridge.minify import minify_css, minify_js
+
+
+def test_regex_after_closing_paren_is_not_truncated():
+    source = "if (a) /x\\/\\//.test(s); foo()"
+
+    assert minify_js(source) == source
+
+
+def test_division_after_closing_paren_keeps_the_line():
+    assert minify_js("x = (a + b) / 2 // half\n    y  =  1") == "x = (a + b) / 2 // half\ny = 1"
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("var re = /a\\/\\/b/g;  // tail", "var re = /a\\/\\/b/g;"),
+        ("i++ / 2", "i++ / 2"),
+        ("s = `a ${b} // c`", "s = `a ${b} // c`"),
+    ],
+)
+def test_js_literals_survive(source, expected):
+    assert minify_js(source) == expected
+
+
+def test_css_strips_whitespace_around_declaration_colons():
+    source = "a :hover , b > c { color : red ; }\n@media (min-width: 10px) { .x :not(.y) { margin : 0 ; } }"
+
+    assert minify_css(source) == "a :hover,b>c{color:red}@media (min-width:10px){.x :not(.y){margin:0}}"
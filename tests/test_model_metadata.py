@@ -0,0 +1,80 @@
+import gc
+from types import SimpleNamespace
+
+import pytest
+
+from lib.python.odoo_reusable.core import model_metadata as lib_metadata
+from lib.python.odoo_reusable.core.model_metadata import ModelMetadataCache
+from odoo_bridge import model_metadata as bridge_metadata
+
+
+class FakeClient:
+    def __init__(self):
+        self.creds = SimpleNamespace(url="https://odoo.test", db="db")
+        self.calls = []
+
+    def search_read(self, model, domain, fields=None):
+        self.calls.append(model)
+        if model == "ir.module.module":
+            return [{"name": "base", "latest_version": "17.0"}]
+        if model == "ir.model":
+            return [{"id": 7, "model": "res.partner"}]
+        return [{"name": "name", "ttype": "char", "relation": False}]
+
+
+def test_cache_persists_and_reuses_entries(tmp_path):
+    client = FakeClient()
+    cache = ModelMetadataCache(client.search_read, host="odoo.test", db="db", cache_dir=tmp_path)
+    assert cache.model_id("res.partner") == 7
+    assert cache.field_exists("res.partner", "name")
+
+    reloaded = FakeClient()
+    warm = ModelMetadataCache(reloaded.search_read, host="odoo.test", db="db", cache_dir=tmp_path)
+    assert warm.field_exists("res.partner", "name")
+    assert reloaded.calls == ["ir.module.module"]
+
+
+def test_bridge_adapter_shares_one_cache_per_client(tmp_path):
+    client = FakeClient()
+    first = bridge_metadata.shared_metadata_cache(client, cache_dir=tmp_path)
+
+    assert bridge_metadata.shared_metadata_cache(client) is first
+    assert isinstance(first, ModelMetadataCache)
+    assert first.search_read("ir.model", []) == [{"id": 7, "model": "res.partner"}]
+    assert client.calls == ["ir.model"]
+
+
+def test_bridge_adapter_does_not_keep_clients_alive(tmp_path):
+    client = FakeClient()
+    cache = bridge_metadata.shared_metadata_cache(client, cache_dir=tmp_path)
+    del client
+    gc.collect()
+    assert len(bridge_metadata._SHARED_CACHES) == 0
+    with pytest.raises(ReferenceError):
+        cache.model_id("res.partner")
+
+
+class FakeConnection(FakeClient):
+    url = "https://odoo.test"
+    db = "db"
+
+    def __init__(self, configured_dir=None):
+        super().__init__()
+        self.config = {"files.metadata_cache_dir": configured_dir} if configured_dir else {}
+
+
+def test_lib_adapter_resolves_cache_dir_against_project_root(tmp_path):
+    connection = FakeConnection()
+    cache = lib_metadata.shared_metadata_cache(connection, project_root=tmp_path)
+    assert cache.cache_dir == tmp_path / ".cache" / "model_metadata"
+
+    configured = FakeConnection("var/metadata")
+    assert lib_metadata.shared_metadata_cache(configured, project_root=tmp_path).cache_dir == tmp_path / "var" / "metadata"
+
+
+def test_lib_adapter_does_not_keep_connections_alive(tmp_path):
+    connection = FakeConnection()
+    lib_metadata.shared_metadata_cache(connection, cache_dir=tmp_path)
+    del connection
+    gc.collect()
+    assert len(lib_metadata._SHARED_CACHES) == 0
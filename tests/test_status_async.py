@@ -0,0 +1,23 @@
+import asyncio
+from types import SimpleNamespace
+
+from odoo_bridge.invoice_api.manager import InvoiceApiBridgeManager
+
+
+class FakeClient:
+    def __init__(self):
+        self.creds = SimpleNamespace(url="https://odoo.test", db="db")
+        self.transport = SimpleNamespace(config=SimpleNamespace(pool_size=4))
+        self.uid = 2
+
+    def search_read(self, model, domain, fields=None, limit=None, order=None, context=None):
+        return [{"id": 1, "model": model, "domain": repr(domain), "fields": fields, "limit": limit}]
+
+    def _exec_once(self, model, method, args, kwargs):
+        assert method == "search_read"
+        return self.search_read(model, *args, **kwargs)
+
+
+def test_status_async_matches_status(tmp_path):
+    manager = InvoiceApiBridgeManager(FakeClient(), project_root=tmp_path)
+    assert asyncio.run(manager.status_async()) == manager.status()
@@ -0,0 +1,30 @@
+from lib.python.odoo_reusable.core.tabular_rows import (
+    TabularSchema,
+    clean_tabular_text_value,
+    get_tabular_value_by_aliases,
+    normalize_tabular_key,
+)
+
+
+def test_normalize_key_cache_keeps_equal_values_of_different_types_apart():
+    assert normalize_tabular_key(True) == "true"
+    assert normalize_tabular_key(1.0) == "10"
+    assert normalize_tabular_key(1) == "1"
+
+
+def test_schema_matches_per_row_alias_lookup():
+    headers = ["Asset #", " Model ", "Cost", "cost"]
+    fields = {"asset": ["asset_number", "Asset #"], "model": ["Model"], "cost": ["Cost"], "missing": ["nope"]}
+    rows = [
+        {"Asset #": "A1", " Model ": "M", "Cost": None, "cost": 2.0},
+        {"Asset #": None, " Model ": "nan", "Cost": "3", "cost": None},
+    ]
+    schema = TabularSchema.compile(headers, fields)
+
+    expected = [
+        {name: clean_tabular_text_value(get_tabular_value_by_aliases(row, aliases)) for name, aliases in fields.items()}
+        for row in rows
+    ]
+    assert schema.extract_rows(rows) == expected
+    assert schema.extract_rows([list(row.values()) for row in rows]) == expected
+    assert schema.missing_fields == ["missing"]
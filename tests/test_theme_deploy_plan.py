@@ -0,0 +1,44 @@
+from odoo_bridge.theme_framework.manager import ThemeFrameworkConfig, ThemeFrameworkManager
+from odoo_bridge.theme_framework.planner import NOOP
+
+from fake_odoo import FakeOdoo
+
+CATALOG = """
+version: "1"
+themes:
+  - key: demo
+    assets:
+      - name: Demo CSS
+        path: assets/demo.css
+    qweb_views:
+      - name: Demo Header
+        inherit_key: web.webclient_bootstrap
+        arch_inline: "<data/>"
+"""
+
+
+def _manager(tmp_path, client):
+    (tmp_path / "assets").mkdir(exist_ok=True)
+    (tmp_path / "assets" / "demo.css").write_text("body { color: red; }\n", encoding="utf-8")
+    (tmp_path / "catalog.yml").write_text(CATALOG, encoding="utf-8")
+    config = ThemeFrameworkConfig(catalog_paths=(tmp_path / "catalog.yml",))
+    return ThemeFrameworkManager(client, project_root=tmp_path, config=config)
+
+
+def test_unchanged_views_plan_as_noop(tmp_path):
+    client = FakeOdoo(
+        records={"ir.ui.view": [{"id": 1, "key": "web.webclient_bootstrap", "type": "qweb", "name": "bootstrap"}]},
+        fields={"ir.attachment": ["public"]},
+    )
+    manager = _manager(tmp_path, client)
+    manager.apply()
+
+    plan = manager.plan()
+    views = plan.by_model("ir.ui.view")
+    assert [(item.action, item.fields) for item in views] == [(NOOP, ())] * 2
+    assert {item.action for item in plan.changes} == {NOOP}
+    assert plan.estimated_rpc_count() == 0
+
+    client.calls.clear()
+    manager.apply()
+    assert client.writes() == []
@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+from odoo_bridge.theme_framework.planner import NOOP, UPDATE, ThemeDeployPlanner
+
+
+class StubManager:
+    def __init__(self):
+        self.client = None
+        self.config = SimpleNamespace(minify_assets=False)
+        self.manifest = SimpleNamespace(deployed_checksum=lambda name: None)
+
+    def _field_exists(self, model, field_name):
+        return True
+
+
+def _plan(tmp_path, row):
+    asset = tmp_path / "theme.css"
+    asset.write_text("body{color:red}", encoding="utf-8")
+    planner = ThemeDeployPlanner(StubManager())
+    return planner._plan_attachment("theme", "x:theme:attachment:theme.css", asset, "abc", "text/css", {row["name"]: row})
+
+
+def test_matching_digest_on_public_attachment_is_a_noop(tmp_path):
+    row = {"id": 5, "name": "x:theme:attachment:theme.css", "checksum": "abc", "mimetype": "text/css", "public": True}
+    assert _plan(tmp_path, row).action == NOOP
+
+
+def test_matching_digest_still_restores_public_flag(tmp_path):
+    row = {"id": 5, "name": "x:theme:attachment:theme.css", "checksum": "abc", "mimetype": "text/css", "public": False}
+    change = _plan(tmp_path, row)
+    assert change.action == UPDATE
+    assert change.fields == ("public",)
+    assert change.build({}) == {"public": True}
@@ -0,0 +1,142 @@
+from pathlib import Path
+
+import pytest
+
+from odoo_bridge.theme_framework.contracts import ThemeCatalogSpec, ThemeSpec
+from odoo_bridge.theme_framework.resolver import ThemeResolver
+
+
+def _recursive_resolve(theme, catalog, seen=None):
+    # ThemeFrameworkManager._resolve_theme before ThemeResolver replaced it.
+    path = set(seen or set())
+    if theme.key in path:
+        raise RuntimeError(f"Cyclic theme inheritance detected for: {theme.key}")
+    next_path = set(path)
+    next_path.add(theme.key)
+
+    inherited_assets = []
+    inherited_views = []
+    inherited_params = {}
+    inherited_hosts = []
+    for parent_key in theme.inherits:
+        parent = catalog.themes.get(parent_key)
+        if not parent:
+            raise RuntimeError(f"Theme '{theme.key}' inherits unknown parent '{parent_key}'")
+        resolved_parent = _recursive_resolve(parent, catalog, next_path)
+        inherited_assets.extend(resolved_parent.assets)
+        inherited_views.extend(resolved_parent.qweb_views)
+        inherited_params.update(resolved_parent.params)
+        inherited_hosts.extend(resolved_parent.hosts)
+
+    merged_params = dict(inherited_params)
+    merged_params.update(theme.params)
+    return ThemeSpec(
+        key=theme.key,
+        title=theme.title,
+        description=theme.description,
+        inherits=theme.inherits,
+        assets=tuple(inherited_assets + list(theme.assets)),
+        qweb_views=tuple(inherited_views + list(theme.qweb_views)),
+        params=merged_params,
+        hosts=tuple(dict.fromkeys([*inherited_hosts, *theme.hosts]).keys()),
+    )
+
+
+def _first_seen(items):
+    seen = {}
+    for item in items:
+        seen.setdefault(id(item), item)
+    return tuple(seen.values())
+
+
+def _theme(key, inherits=(), hosts=(), **params):
+    return {
+        "key": key,
+        "inherits": list(inherits),
+        "assets": [{"path": f"static/{key}/{name}"} for name in ("a.css", "b.js")],
+        "qweb_views": [{"name": f"{key}.layout", "arch_inline": f"<t t-name='{key}'/>"}],
+        "params": {"owner": key, **params},
+        "hosts": list(hosts),
+    }
+
+
+def _catalog(*themes):
+    return ThemeCatalogSpec.from_dict({"version": "1", "themes": list(themes)})
+
+
+@pytest.fixture
+def diamond():
+    return _catalog(
+        _theme("base", hosts=["a.test"], color="grey"),
+        _theme("left", ["base"], color="red"),
+        _theme("right", ["base"], hosts=["b.test"], font="serif"),
+        _theme("top", ["left", "right"]),
+        _theme("leaf", ["top", "base"]),
+    )
+
+
+def test_diamond_emits_each_ancestor_once_in_recursive_order(diamond):
+    resolver = ThemeResolver(diamond)
+
+    for key in ("top", "leaf"):
+        resolved = resolver.resolve(key)
+        expected = _recursive_resolve(diamond.themes[key], diamond)
+        assert resolved.assets == _first_seen(expected.assets)
+        assert resolved.qweb_views == _first_seen(expected.qweb_views)
+        assert resolved.params == expected.params
+        assert resolved.hosts == expected.hosts
+
+    top = resolver.resolve("top")
+    assert [asset.path for asset in top.assets] == [
+        Path(f"static/{key}/{name}") for key in ("base", "left", "right", "top") for name in ("a.css", "b.js")
+    ]
+    assert top.params == {"owner": "top", "color": "grey", "font": "serif"}
+
+
+def test_shared_ancestors_are_merged_once(diamond, monkeypatch):
+    resolver = ThemeResolver(diamond)
+    merged = []
+    merge = resolver._merge
+    monkeypatch.setattr(resolver, "_merge", lambda theme: merged.append(theme.key) or merge(theme))
+
+    resolver.resolve_all()
+
+    assert sorted(merged) == sorted(diamond.themes)
+    assert merged.index("base") < merged.index("left") < merged.index("top") < merged.index("leaf")
+
+
+def test_matches_recursive_resolver_without_shared_ancestors():
+    catalog = _catalog(
+        _theme("root", hosts=["a.test"], color="grey"),
+        _theme("child", ["root"], color="blue"),
+        _theme("other", hosts=["b.test"]),
+        _theme("grandchild", ["child", "other"], hosts=["a.test", "c.test"]),
+        _theme("standalone"),
+    )
+
+    resolved = ThemeResolver(catalog).resolve_all()
+
+    assert list(resolved) == sorted(catalog.themes)
+    for key, theme in catalog.themes.items():
+        assert resolved[key] == _recursive_resolve(theme, catalog)
+
+
+def test_cycle_error_reports_the_path():
+    catalog = _catalog(
+        _theme("entry", ["a"]),
+        _theme("a", ["b"]),
+        _theme("b", ["c"]),
+        _theme("c", ["a"]),
+    )
+
+    with pytest.raises(RuntimeError, match="Cyclic theme inheritance detected: a -> b -> c -> a$"):
+        ThemeResolver(catalog).resolve("entry")
+    with pytest.raises(RuntimeError, match="Cyclic theme inheritance detected: b -> c -> a -> b$"):
+        ThemeResolver(catalog).resolve("b")
+
+
+def test_self_inheritance_and_unknown_parent_are_rejected():
+    with pytest.raises(RuntimeError, match="Cyclic theme inheritance detected: solo -> solo$"):
+        ThemeResolver(_catalog(_theme("solo", ["solo"]))).resolve("solo")
+    with pytest.raises(RuntimeError, match="Theme 'child' inherits unknown parent 'missing'"):
+        ThemeResolver(_catalog(_theme("child", ["missing"]))).resolve("child")
@@ -0,0 +1,45 @@
+import pickle
+
+from odoo_bridge import yaml_catalog
+from odoo_bridge.yaml_catalog import YamlCatalogLoader
+
+
+def _write_catalog(tmp_path):
+    path = tmp_path / "catalog.yaml"
+    path.write_text("themes:\n  - name: base\n", encoding="utf-8")
+    return path
+
+
+def test_malformed_disk_entry_is_a_miss_and_gets_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.setattr(yaml_catalog, "_MEMORY_CACHE", {})
+    catalog = _write_catalog(tmp_path)
+    cache_dir = tmp_path / "cache"
+    loader = YamlCatalogLoader(catalog, cache_dir=cache_dir)
+    expected = loader.load()
+
+    (cache_file,) = cache_dir.glob("*.pickle")
+    key = catalog.resolve().as_posix()
+    bad_entries = [
+        {"path": key},
+        {"path": key, "entry": 42},
+        {"path": key, "entry": (1, 2)},
+        {"path": key, "entry": (1, 2, None, b"")},
+    ]
+    for bad in bad_entries:
+        cache_file.write_bytes(pickle.dumps(bad))
+        yaml_catalog._MEMORY_CACHE.clear()
+        assert YamlCatalogLoader(catalog, cache_dir=cache_dir).load() == expected
+        stored = pickle.loads(cache_file.read_bytes())
+        assert stored["path"] == key
+        assert stored["entry"][3] and isinstance(stored["entry"][2], str)
+
+
+def test_unpicklable_garbage_is_a_miss(tmp_path, monkeypatch):
+    monkeypatch.setattr(yaml_catalog, "_MEMORY_CACHE", {})
+    catalog = _write_catalog(tmp_path)
+    cache_dir = tmp_path / "cache"
+    expected = YamlCatalogLoader(catalog, cache_dir=cache_dir).load()
+    (cache_file,) = cache_dir.glob("*.pickle")
+    cache_file.write_bytes(b"\x80\x05not a pickle")
+    yaml_catalog._MEMORY_CACHE.clear()
+    assert YamlCatalogLoader(catalog, cache_dir=cache_dir).load() == expected